@@ -0,0 +1,230 @@
+"""
+Banco di prova dell'addon fuori da Kodi
+Carica launcher.py con gli stub di xbmc* (bench/stubs) in una cartella Kodi
+temporanea e ridirige ogni richiesta HTTP al server di replay locale
+(bench/replay.py): ogni invocazione e' ripetibile e senza rete.
+
+    bench = Bench().start()
+    result = bench.run({"action": "getExtData", "url": "https://.../data/disclaimer.json"})
+    print(result.seconds, len(result.items))
+    bench.stop()
+"""
+
+import os
+import sys
+import time
+import json
+import shutil
+import tempfile
+import traceback
+import importlib
+import urllib.request
+from urllib.parse import urlencode
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+STUBS_DIR = os.path.join(BENCH_DIR, 'stubs')
+ADDON_ID = 'plugin.video.mandrakodi'
+PLUGIN_URL = 'plugin://'+ADDON_ID+'/'
+
+# Moduli dell'addon ricaricati ad ogni invocazione (Kodi avvia un interprete nuovo)
+ADDON_MODULES = ('launcher', 'myResolver', 'mandraCore', 'portal_api', 'jsunpack', 'resolvers')
+
+# Impostazioni di partenza dell'addon
+DEFAULT_SETTINGS = {
+    "debug": "off",
+    "password": "bench",
+    "urlAppo2": "BENCH1",
+    "showAdult": "false",
+    "autoView": "0",
+}
+
+# Costanti del launcher impostate dopo l'import, come farebbe chi le modifica nel file
+DEFAULT_CONSTANTS = {
+    # le copertine non sono registrate: il prefetch misurerebbe solo 404
+    "ART_CACHE": False,
+}
+
+for path in (BENCH_DIR, STUBS_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import xbmc
+import xbmcgui
+import xbmcvfs
+import xbmcaddon
+import xbmcplugin
+
+from replay import ReplayServer
+
+
+class Result:
+    """Esito di una invocazione: tempo, elementi della directory, dialog, richieste"""
+
+    def __init__(self, params):
+        self.params = params
+        self.seconds = 0.0
+        self.items = []
+        self.resolved = []
+        self.directory = {}
+        self.dialogs = []
+        self.builtins = []
+        self.requests = []
+        self.misses = []
+        self.settingCalls = {}
+        self.error = None
+
+    def ok(self):
+        return self.error is None
+
+    def toDict(self):
+        return dict(self.__dict__)
+
+
+class Bench:
+    def __init__(self, settings=None, record=False, keepRoot=False, constants=None):
+        self.settings = dict(DEFAULT_SETTINGS)
+        if settings:
+            self.settings.update(settings)
+        self.constants = dict(DEFAULT_CONSTANTS)
+        if constants:
+            self.constants.update(constants)
+        self.server = ReplayServer(record=record)
+        self.root = tempfile.mkdtemp(prefix='mandra_bench_')
+        self.keepRoot = keepRoot
+        self.addonDir = os.path.join(self.root, 'addons', ADDON_ID)
+        self.patched = []
+
+    def start(self):
+        """Prepara la cartella Kodi, copia l'addon e avvia il server di replay"""
+
+        for folder in ('userdata', 'temp', 'addons'):
+            os.makedirs(os.path.join(self.root, folder), exist_ok=True)
+        os.makedirs(self.addonDir, exist_ok=True)
+        for name in os.listdir(REPO_DIR):
+            if name.endswith('.py'):
+                shutil.copy(os.path.join(REPO_DIR, name), self.addonDir)
+        shutil.copytree(os.path.join(REPO_DIR, 'resolvers'), os.path.join(self.addonDir, 'resolvers'),
+                        ignore=shutil.ignore_patterns('__pycache__'))
+        xbmcvfs.KODI_ROOT = self.root
+        xbmcaddon.settings.clear()
+        xbmcaddon.settings.update(self.settings)
+        if self.addonDir not in sys.path:
+            sys.path.insert(1, self.addonDir)
+        self.server.start()
+        self.patchHttp()
+        return self
+
+    def stop(self):
+        for owner, name, original in reversed(self.patched):
+            setattr(owner, name, original)
+        self.patched = []
+        self.server.stop()
+        self.purge()
+        if self.addonDir in sys.path:
+            sys.path.remove(self.addonDir)
+        if not self.keepRoot:
+            shutil.rmtree(self.root, ignore_errors=True)
+
+    def patch(self, owner, name, replacement):
+        self.patched.append((owner, name, getattr(owner, name)))
+        setattr(owner, name, replacement)
+
+    def patchHttp(self):
+        """requests e urllib passano dal server di replay"""
+
+        rewrite = self.server.rewrite
+        origUrlopen = urllib.request.urlopen
+
+        def urlopen(url, *args, **kwargs):
+            if isinstance(url, urllib.request.Request):
+                url.full_url = rewrite(url.full_url)
+            else:
+                url = rewrite(url)
+            return origUrlopen(url, *args, **kwargs)
+        self.patch(urllib.request, 'urlopen', urlopen)
+
+        try:
+            import requests
+        except ImportError:
+            return
+        origRequest = requests.Session.request
+
+        def request(session, method, url, *args, **kwargs):
+            return origRequest(session, method, rewrite(url), *args, **kwargs)
+        self.patch(requests.Session, 'request', request)
+
+    def patchCore(self, mandraCore):
+        # mandraCore e' ricaricato ad ogni invocazione: il client va ridiretto ogni volta
+        rewrite = self.server.rewrite
+        origRequest = mandraCore.HttpClient.request
+
+        def request(client, url, *args, **kwargs):
+            return origRequest(client, rewrite(url), *args, **kwargs)
+        mandraCore.HttpClient.request = request
+
+        # il prober apre le sue connessioni: stessi link verso il server locale
+        origProbe = mandraCore.LinkProber.request
+
+        def probe(prober, url, *args, **kwargs):
+            return origProbe(prober, rewrite(url), *args, **kwargs)
+        mandraCore.LinkProber.request = probe
+
+    def purge(self):
+        for name in list(sys.modules):
+            if name.split('.')[0] in ADDON_MODULES:
+                del sys.modules[name]
+
+    def run(self, params=None, keyboard="", select=-1, yesno=False, settings=None, constants=None):
+        """
+        Esegue launcher.run() come una invocazione di Kodi e ne registra l'esito
+        settings e constants valgono solo per questa invocazione
+        """
+
+        if isinstance(params, dict):
+            params = urlencode(params)
+        result = Result(params or "")
+        for module in (xbmc, xbmcgui, xbmcplugin, xbmcaddon):
+            module.reset()
+        previous = {}
+        if settings:
+            previous = dict((key, xbmcaddon.settings.get(key)) for key in settings)
+            xbmcaddon.settings.update(settings)
+        xbmc.keyboardText = keyboard
+        xbmcgui.answers.update({"select": select, "yesno": yesno})
+        requestsBefore = len(self.server.requests)
+        missesBefore = len(self.server.misses)
+
+        self.purge()
+        importlib.invalidate_caches()
+        sys.argv = [PLUGIN_URL, '1', '?'+params if params else '']
+        start = time.perf_counter()
+        try:
+            import mandraCore
+            self.patchCore(mandraCore)
+            import launcher
+            for key, value in dict(self.constants, **(constants or {})).items():
+                setattr(launcher, key, value)
+            launcher.run()
+        except BaseException:
+            result.error = traceback.format_exc()
+        result.seconds = time.perf_counter() - start
+
+        result.items = [dict(li.toDict(), url=url, isFolder=isFolder) for url, li, isFolder in xbmcplugin.items]
+        result.resolved = [dict(li.toDict(), succeeded=ok) for ok, li in xbmcplugin.resolved]
+        result.directory = dict(xbmcplugin.directory, calls=dict(xbmcplugin.calls))
+        result.dialogs = list(xbmcgui.dialogs)
+        result.builtins = list(xbmc.builtins)
+        result.requests = self.server.requests[requestsBefore:]
+        result.misses = self.server.misses[missesBefore:]
+        result.settingCalls = dict(xbmcaddon.calls)
+        for key, value in previous.items():
+            if value is None:
+                xbmcaddon.settings.pop(key, None)
+            else:
+                xbmcaddon.settings[key] = value
+        return result
+
+
+def dumpResult(result):
+    return json.dumps(result.toDict(), indent=2, sort_keys=True, default=str)
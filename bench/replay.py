@@ -0,0 +1,184 @@
+"""
+Server HTTP locale che riproduce le risposte registrate per il banco di prova
+Ogni URL esterno viene riscritto in http://127.0.0.1:<porta>/<schema>/<host>/<percorso>
+Ordine di ricerca: registrazioni (recordings/index.json), file del repo per
+gli URL di GitHub raw / GitHub Pages, altrimenti 404 (o download con --record)
+"""
+
+import os
+import json
+import gzip
+import hashlib
+import threading
+import urllib.error
+import urllib.request
+import http.server
+from urllib.parse import urlsplit
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+RECORDINGS_DIR = os.path.join(BENCH_DIR, 'recordings')
+INDEX_FILE = os.path.join(RECORDINGS_DIR, 'index.json')
+
+# URL serviti direttamente dai file del repo
+REPO_MIRRORS = [
+    "https://raw.githubusercontent.com/mandrakodi/mandrakodi.github.io/main/",
+    "https://raw.githubusercontent.com/mandrakodi/mandrakodi.github.io/refs/heads/main/",
+    "https://mandrakodi.github.io/",
+]
+
+# Header non riprodotti (li ricalcola il server)
+SKIP_HEADERS = ("content-length", "content-encoding", "transfer-encoding", "connection", "date", "server")
+
+
+def loadIndex():
+    """Indice delle registrazioni: url -> status, headers, file"""
+    
+    if not os.path.exists(INDEX_FILE):
+        return {}
+    with open(INDEX_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+class ReplayHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "MandraReplay/1.0"
+
+    def log_message(self, format, *args):
+        pass
+
+    def originalUrl(self):
+        # /https/host:porta/percorso?query -> https://host:porta/percorso?query
+        parts = self.path.lstrip("/").split("/", 2)
+        if len(parts) < 2 or parts[0] not in ("http", "https"):
+            return None
+        return parts[0]+"://"+parts[1]+"/"+(parts[2] if len(parts) > 2 else "")
+
+    def do_GET(self):
+        self.reply(None)
+
+    def do_HEAD(self):
+        self.reply(None, head=True)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", "0") or 0)
+        self.reply(self.rfile.read(length) if length else b"")
+
+    def reply(self, data, head=False):
+        url = self.originalUrl()
+        self.server.requests.append((self.command, url))
+        found = self.server.lookup(url, self.command, data) if url else None
+        if found is None:
+            self.server.misses.append(url or self.path)
+            found = (404, {"Content-Type": "text/plain"}, b"not recorded")
+        status, headers, body = found
+
+        etag = '"'+hashlib.sha1(body).hexdigest()[:16]+'"'
+        if status == 200 and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        self.send_response(status)
+        for key in headers:
+            value = headers[key]
+            if key.lower() == "location":
+                value = self.server.rewrite(value)
+            self.send_header(key, value)
+        if status == 200:
+            self.send_header("ETag", etag)
+        if body and "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body, 6)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if not head:
+            self.wfile.write(body)
+
+
+class ReplayServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, port=0, record=False):
+        super().__init__(("127.0.0.1", port), ReplayHandler)
+        self.record = record
+        self.index = loadIndex()
+        self.generated = {}
+        self.requests = []
+        self.misses = []
+        self.lock = threading.Lock()
+        self.thread = None
+
+    @property
+    def base(self):
+        return "http://127.0.0.1:%d/" % self.server_port
+
+    def rewrite(self, url):
+        """URL esterno -> URL del server locale"""
+        
+        if not url or url.startswith(self.base):
+            return url
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or parts.hostname in ("127.0.0.1", "localhost"):
+            return url
+        target = parts.path or "/"
+        if parts.query:
+            target += "?"+parts.query
+        return self.base+parts.scheme+"/"+parts.netloc+target
+
+    def add(self, url, body, headers=None, status=200, method="GET"):
+        """Risposta in memoria (fixture generate dal banco, non salvate)"""
+        
+        self.generated[url] = (status, headers or {}, body if isinstance(body, bytes) else body.encode('utf-8'))
+
+    def lookup(self, url, method, data):
+        if url in self.generated and method in ("GET", "HEAD"):
+            return self.generated[url]
+        entry = self.index.get(url)
+        recorded = entry.get("method", "GET") if entry is not None else None
+        if recorded == method or (method == "HEAD" and recorded == "GET"):
+            with open(os.path.join(RECORDINGS_DIR, entry["file"]), 'rb') as f:
+                body = f.read()
+            return entry.get("status", 200), entry.get("headers", {}), body
+        for mirror in REPO_MIRRORS:
+            if url.startswith(mirror):
+                local = os.path.join(REPO_DIR, urlsplit(url).path[len(urlsplit(mirror).path):])
+                if os.path.isfile(local):
+                    with open(local, 'rb') as f:
+                        return 200, {}, f.read()
+        if self.record:
+            return self.fetch(url, method, data)
+        return None
+
+    def fetch(self, url, method, data):
+        """Scarica l'URL reale e lo aggiunge alle registrazioni (solo con --record)"""
+        
+        req = urllib.request.Request(url, data=data, method=method, headers={"User-Agent": "Mozilla/5.0"})
+        try:
+            resp = urllib.request.urlopen(req, timeout=30)
+            status, headers, body = resp.status, dict(resp.getheaders()), resp.read()
+        except urllib.error.HTTPError as err:
+            status, headers, body = err.code, dict(err.headers.items()), err.read()
+        headers = dict((k, v) for k, v in headers.items() if k.lower() not in SKIP_HEADERS)
+        name = hashlib.sha1((method+" "+url).encode('utf-8')).hexdigest()[:16]+".bin"
+        with self.lock:
+            os.makedirs(RECORDINGS_DIR, exist_ok=True)
+            with open(os.path.join(RECORDINGS_DIR, name), 'wb') as f:
+                f.write(body)
+            self.index[url] = {"method": method, "status": status, "headers": headers, "file": name}
+            with open(INDEX_FILE, 'w', encoding='utf-8') as f:
+                json.dump(self.index, f, indent=2, sort_keys=True)
+                f.write("\n")
+        print(f" Registrato: {url} ({status}, {len(body)} bytes)")
+        return status, headers, body
+
+    def start(self):
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
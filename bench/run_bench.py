@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Misura i tempi delle azioni dell'addon fuori da Kodi
+Ogni scenario di bench/scenarios.json e' eseguito N volte con launcher.run()
+su stub di xbmc* e server di replay locale: nessuna richiesta esce in rete
+(salvo --record, che scarica e registra gli URL mancanti).
+
+    python3 bench/run_bench.py -n 5
+    python3 bench/run_bench.py list_large m3u_large --trace
+    python3 bench/run_bench.py resolver_frame --dump
+"""
+
+import os
+import sys
+import json
+import logging
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from harness import Bench, dumpResult, BENCH_DIR
+
+SCENARIOS_FILE = os.path.join(BENCH_DIR, 'scenarios.json')
+
+# Dimensioni delle fixture generate
+LARGE_LIST_ITEMS = 3000
+HUGE_LIST_ITEMS = 20000
+LARGE_M3U_ENTRIES = 5000
+PROBE_M3U_ENTRIES = 30
+
+
+def large_list(count):
+    """Lista json con count elementi (link diretti, externallink e myresolve)"""
+    
+    items = []
+    for i in range(count):
+        item = {
+            "title": f"[COLOR lime]Elemento {i}[/COLOR]",
+            "thumbnail": f"https://bench.mandrakodi.test/img/{i % 50}.png",
+            "fanart": "https://bench.mandrakodi.test/img/fanart.jpg",
+            "info": f"Elemento di prova numero {i}"
+        }
+        if i % 3 == 0:
+            item["externallink"] = f"https://bench.mandrakodi.test/list/{i}.json"
+        elif i % 3 == 1:
+            item["myresolve"] = f"frame@@https://bench.mandrakodi.test/frame?id={i}"
+        else:
+            item["link"] = f"https://cdn.mandrakodi.test/live/{i}/index.m3u8"
+        items.append(item)
+    return json.dumps({"SetViewMode": "51", "items": items}, indent=1)
+
+def large_m3u(count):
+    """Playlist m3u con count canali in 20 gruppi"""
+    
+    lines = ["#EXTM3U"]
+    for i in range(count):
+        lines.append(f'#EXTINF:-1 tvg-id="ch{i}" tvg-logo="https://bench.mandrakodi.test/logo/{i % 50}.png" group-title="Gruppo {i % 20}",Canale {i}')
+        lines.append(f"https://cdn.mandrakodi.test/live/{i}/index.m3u8")
+    return "\n".join(lines)+"\n"
+
+def probe_m3u(server, count):
+    """Playlist m3u per il prober: un canale su tre ha il link morto (404)"""
+    
+    lines = ["#EXTM3U"]
+    for i in range(count):
+        lines.append(f'#EXTINF:-1 group-title="Prober",Canale {i}')
+        if i % 3 == 2:
+            lines.append(f"https://dead.mandrakodi.test/live/{i}/index.m3u8")
+        elif i % 3 == 1:
+            link = f"https://vod.mandrakodi.test/film/{i}.mp4"
+            server.add(link, b"\0" * 1024, {"Content-Type": "video/mp4"})
+            lines.append(link)
+        else:
+            # master playlist -> variante -> primo segmento
+            base = f"https://hls{i % 4}.mandrakodi.test/live/{i}/"
+            server.add(base+"index.m3u8", "#EXTM3U\n#EXT-X-STREAM-INF:BANDWIDTH=800000\nmid.m3u8\n", {"Content-Type": "application/vnd.apple.mpegurl"})
+            server.add(base+"mid.m3u8", "#EXTM3U\n#EXT-X-TARGETDURATION:6\n#EXTINF:6.0,\nseg0.ts\n#EXTINF:6.0,\nseg1.ts\n", {"Content-Type": "application/vnd.apple.mpegurl"})
+            server.add(base+"seg0.ts", b"G" * 188, {"Content-Type": "video/mp2t"})
+            lines.append(base+"index.m3u8")
+    return "\n".join(lines)+"\n"
+
+def add_generated(server):
+    server.add("https://bench.mandrakodi.test/generated/large.json", large_list(LARGE_LIST_ITEMS), {"Content-Type": "application/json"})
+    server.add("https://bench.mandrakodi.test/generated/huge.json", large_list(HUGE_LIST_ITEMS), {"Content-Type": "application/json"})
+    server.add("https://bench.mandrakodi.test/generated/large.m3u", large_m3u(LARGE_M3U_ENTRIES), {"Content-Type": "audio/x-mpegurl"})
+    server.add("https://bench.mandrakodi.test/generated/probe.m3u", probe_m3u(server, PROBE_M3U_ENTRIES), {"Content-Type": "audio/x-mpegurl"})
+
+def run_scenario(bench, scenario, rounds):
+    times = []
+    result = None
+    settings = scenario.get("settings")
+    constants = scenario.get("constants")
+    for _ in range(rounds):
+        for before in scenario.get("before", []):
+            bench.run(before, settings=settings, constants=constants)
+        result = bench.run(scenario["params"], keyboard=scenario.get("keyboard", ""),
+                           select=scenario.get("select", -1), yesno=scenario.get("yesno", False),
+                           settings=settings, constants=constants)
+        times.append(result.seconds)
+    return times, result
+
+def main():
+    """Main"""
+    
+    parser = argparse.ArgumentParser(description="Benchmark headless di launcher.run()")
+    parser.add_argument("scenarios", nargs="*", help="scenari da eseguire (default: tutti)")
+    parser.add_argument("-n", "--rounds", type=int, default=3, help="ripetizioni per scenario")
+    parser.add_argument("--trace", action="store_true", help="attiva i trace span dell'addon")
+    parser.add_argument("--debug", action="store_true", help="attiva il log di debug dell'addon")
+    parser.add_argument("--record", action="store_true", help="scarica e registra gli URL mancanti")
+    parser.add_argument("--dump", action="store_true", help="stampa l'esito completo dell'ultima esecuzione")
+    parser.add_argument("--json", help="salva i tempi in un file json")
+    parser.add_argument("--keep", action="store_true", help="non cancella la cartella Kodi temporanea")
+    args = parser.parse_args()
+
+    with open(SCENARIOS_FILE, 'r', encoding='utf-8') as f:
+        scenarios = json.load(f)
+    if args.scenarios:
+        scenarios = [s for s in scenarios if s["name"] in args.scenarios]
+
+    if not args.debug:
+        # launcher e resolver loggano con logging.warning: fuori da Kodi e' solo rumore
+        logging.disable(logging.WARNING)
+    if args.trace:
+        os.environ["MANDRA_TRACE"] = "on"
+    settings = {"debug": "on" if args.debug else "off"}
+    bench = Bench(settings=settings, record=args.record, keepRoot=args.keep).start()
+    add_generated(bench.server)
+    report = []
+    print(f" {'scenario':<18} {'min ms':>9} {'median':>9} {'max ms':>9} {'items':>6} {'play':>4} {'req':>4} {'miss':>4}  esito")
+    try:
+        for scenario in scenarios:
+            times, result = run_scenario(bench, scenario, args.rounds)
+            ms = [t * 1000 for t in times]
+            esito = "ok" if result.ok() else result.error.strip().splitlines()[-1]
+            print(f" {scenario['name']:<18} {min(ms):>9.1f} {statistics.median(ms):>9.1f} {max(ms):>9.1f} "
+                  f"{len(result.items):>6} {len(result.resolved):>4} {len(result.requests):>4} {len(result.misses):>4}  {esito}")
+            report.append({"name": scenario["name"], "ms": ms, "items": len(result.items),
+                           "requests": len(result.requests), "misses": result.misses, "error": result.error})
+            if args.dump:
+                print(dumpResult(result))
+    finally:
+        bench.stop()
+    if args.keep:
+        print(f"\n Cartella Kodi: {bench.root}")
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n Output: {args.json}")
+
+if __name__ == '__main__':
+    main()
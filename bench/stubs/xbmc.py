@@ -0,0 +1,126 @@
+"""
+Stub del modulo xbmc per il banco di prova (bench/harness.py)
+Registra i builtin eseguiti e le chiamate JSON-RPC
+"""
+
+import json
+import time
+import logging
+
+LOGDEBUG = 0
+LOGINFO = 1
+LOGWARNING = 2
+LOGERROR = 3
+LOGFATAL = 4
+LOGNONE = 5
+
+# Stato registrato durante una invocazione (azzerato da reset())
+builtins = []
+jsonrpc = []
+logs = []
+
+# Valori restituiti da getInfoLabel / getCondVisibility
+infoLabels = {
+    "System.BuildVersion": "21.2 (21.2.0) Git:20241214-bench",
+    "Network.DNS1Address": "127.0.0.1",
+    "Network.DNS2Address": "127.0.0.1",
+    "Network.GatewayAddress": "127.0.0.1",
+}
+conditions = {}
+skinDir = "skin.estuary"
+keyboardText = ""
+addonsEnabled = {}
+
+
+def reset():
+    del builtins[:]
+    del jsonrpc[:]
+    del logs[:]
+
+
+def log(msg, level=LOGDEBUG):
+    logs.append((level, msg))
+    if level >= LOGWARNING:
+        logging.warning(msg)
+
+def executebuiltin(function, wait=False):
+    builtins.append(function)
+
+def executeJSONRPC(jsonrpccommand):
+    request = json.loads(jsonrpccommand)
+    jsonrpc.append(request)
+    method = request.get("method", "")
+    params = request.get("params", {})
+    result = "OK"
+    if method == "Application.GetProperties":
+        result = {"version": {"major": 21, "minor": 2, "revision": "bench", "tag": "stable"}, "name": "Kodi"}
+    elif method == "Addons.GetAddonDetails":
+        addonId = params.get("addonid", "")
+        result = {"addon": {"addonid": addonId, "type": "xbmc.addon", "enabled": addonsEnabled.get(addonId, True)}}
+    elif method == "Addons.SetAddonEnabled":
+        addonsEnabled[params.get("addonid", "")] = params.get("enabled") is True
+    return json.dumps({"id": request.get("id", 1), "jsonrpc": "2.0", "result": result}, separators=(",", ":"))
+
+def getInfoLabel(cLine):
+    return infoLabels.get(cLine, "")
+
+def getCondVisibility(condition):
+    return conditions.get(condition.lower(), False)
+
+def getSkinDir():
+    return skinDir
+
+def sleep(timemillis):
+    time.sleep(timemillis / 1000.0)
+
+def translatePath(path):
+    import xbmcvfs
+    return xbmcvfs.translatePath(path)
+
+def StartPVRManager():
+    builtins.append("StartPVRManager")
+
+def StopPVRManager():
+    builtins.append("StopPVRManager")
+
+
+class Keyboard:
+    def __init__(self, line="", heading="", hidden=False):
+        self.heading = heading
+        self.text = line
+
+    def doModal(self, autoclose=0):
+        self.text = keyboardText
+
+    def isConfirmed(self):
+        return keyboardText != ""
+
+    def getText(self):
+        return self.text
+
+    def setHeading(self, heading):
+        self.heading = heading
+
+
+class Monitor:
+    def abortRequested(self):
+        return False
+
+    def waitForAbort(self, timeout=0):
+        time.sleep(timeout)
+        return False
+
+
+class Player:
+    def __init__(self):
+        self.playing = None
+
+    def play(self, item="", listitem=None, windowed=False, startpos=-1):
+        builtins.append("PlayMedia("+str(item)+")")
+        self.playing = item
+
+    def stop(self):
+        self.playing = None
+
+    def isPlaying(self):
+        return self.playing is not None
@@ -0,0 +1,54 @@
+"""
+Stub del modulo xbmcaddon per il banco di prova (bench/harness.py)
+Le impostazioni vivono in memoria e contano le chiamate getSetting/setSetting
+"""
+
+
+ADDON_ID = "plugin.video.mandrakodi"
+
+settings = {}
+calls = {"getSetting": 0, "setSetting": 0}
+info = {
+    "id": ADDON_ID,
+    "name": "MandraKodi",
+    "version": "2.2.1",
+    "path": "special://home/addons/"+ADDON_ID+"/",
+    "profile": "special://profile/addon_data/"+ADDON_ID+"/",
+}
+
+
+def reset():
+    calls["getSetting"] = 0
+    calls["setSetting"] = 0
+
+
+class Addon:
+    def __init__(self, id=None):
+        self.id = id or ADDON_ID
+
+    def getSetting(self, id):
+        calls["getSetting"] += 1
+        return settings.get(id, "")
+
+    def setSetting(self, id, value):
+        calls["setSetting"] += 1
+        settings[id] = value
+
+    def getSettingBool(self, id):
+        return self.getSetting(id) == "true"
+
+    def getSettingInt(self, id):
+        return int(self.getSetting(id) or 0)
+
+    def getAddonInfo(self, id):
+        value = info.get(id, "")
+        if id in ("path", "profile"):
+            import xbmcvfs
+            value = xbmcvfs.translatePath(value)
+        return value
+
+    def getLocalizedString(self, id):
+        return str(id)
+
+    def openSettings(self):
+        pass
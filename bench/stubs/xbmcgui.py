@@ -0,0 +1,155 @@
+"""
+Stub del modulo xbmcgui per il banco di prova (bench/harness.py)
+ListItem conserva label, info, art e proprieta', i dialog sono registrati
+"""
+
+# Dialog mostrati durante una invocazione (azzerati da reset())
+dialogs = []
+# Risposte ai dialog: yesno -> bool, select -> indice
+answers = {"yesno": False, "select": -1}
+# Proprieta' delle finestre: (idFinestra, chiave) -> valore
+windowProps = {}
+
+
+def reset():
+    del dialogs[:]
+
+
+class ListItem:
+    def __init__(self, label="", label2="", path="", offscreen=False):
+        self.label = label
+        self.label2 = label2
+        self.path = path
+        self.info = {}
+        self.art = {}
+        self.properties = {}
+        self.mimeType = ""
+        self.contentLookup = True
+        self.contextMenu = []
+        self.subtitles = []
+
+    def getLabel(self):
+        return self.label
+
+    def setLabel(self, label):
+        self.label = label
+
+    def getLabel2(self):
+        return self.label2
+
+    def setLabel2(self, label):
+        self.label2 = label
+
+    def setInfo(self, type, infoLabels):
+        self.info.setdefault(type, {}).update(infoLabels)
+
+    def setArt(self, values):
+        self.art.update(values)
+
+    def getArt(self, key):
+        return self.art.get(key, "")
+
+    def setProperty(self, key, value):
+        self.properties[key.lower()] = value
+
+    def getProperty(self, key):
+        return self.properties.get(key.lower(), "")
+
+    def setProperties(self, values):
+        for key in values:
+            self.setProperty(key, values[key])
+
+    def setPath(self, path):
+        self.path = path
+
+    def getPath(self):
+        return self.path
+
+    def setMimeType(self, mimetype):
+        self.mimeType = mimetype
+
+    def setContentLookup(self, enable):
+        self.contentLookup = enable
+
+    def setSubtitles(self, subtitleFiles):
+        self.subtitles = list(subtitleFiles)
+
+    def addContextMenuItems(self, items, replaceItems=False):
+        self.contextMenu.extend(items)
+
+    def toDict(self):
+        return {
+            "label": self.label,
+            "label2": self.label2,
+            "path": self.path,
+            "info": self.info,
+            "art": self.art,
+            "properties": self.properties,
+            "mimeType": self.mimeType,
+            "contextMenu": self.contextMenu,
+        }
+
+
+class Dialog:
+    def ok(self, heading, message):
+        dialogs.append(("ok", heading, message))
+        return True
+
+    def yesno(self, heading, message, *args, **kwargs):
+        dialogs.append(("yesno", heading, message))
+        return answers["yesno"]
+
+    def select(self, heading, list, *args, **kwargs):
+        dialogs.append(("select", heading, list))
+        return answers["select"]
+
+    def notification(self, heading, message, icon="", time=5000, sound=True):
+        dialogs.append(("notification", heading, message))
+
+    def textviewer(self, heading, text, usemono=False):
+        dialogs.append(("textviewer", heading, text))
+
+    def input(self, heading, defaultt="", type=0, option=0, autoclose=0):
+        dialogs.append(("input", heading, defaultt))
+        return defaultt
+
+
+class DialogProgress:
+    def create(self, heading, message=""):
+        dialogs.append(("progress", heading, message))
+
+    def update(self, percent, message=""):
+        pass
+
+    def iscanceled(self):
+        return False
+
+    def close(self):
+        pass
+
+
+class DialogProgressBG(DialogProgress):
+    def isFinished(self):
+        return True
+
+
+class Window:
+    def __init__(self, existingWindowId=-1):
+        self.windowId = existingWindowId
+
+    def getProperty(self, key):
+        return windowProps.get((self.windowId, key.lower()), "")
+
+    def setProperty(self, key, value):
+        windowProps[(self.windowId, key.lower())] = value
+
+    def clearProperty(self, key):
+        windowProps.pop((self.windowId, key.lower()), None)
+
+    def clearProperties(self):
+        for key in [k for k in windowProps if k[0] == self.windowId]:
+            del windowProps[key]
+
+
+def getCurrentWindowId():
+    return 10025
@@ -0,0 +1,53 @@
+"""
+Stub del modulo xbmcplugin per il banco di prova (bench/harness.py)
+Registra gli elementi della directory e il link risolto dell'invocazione
+"""
+
+SORT_METHOD_NONE = 0
+SORT_METHOD_LABEL = 1
+SORT_METHOD_LABEL_IGNORE_THE = 2
+SORT_METHOD_DATE = 3
+SORT_METHOD_TITLE = 10
+
+# Stato registrato durante una invocazione (azzerato da reset())
+items = []
+resolved = []
+directory = {"content": "", "category": "", "ended": None, "sortMethods": []}
+calls = {"addDirectoryItem": 0, "addDirectoryItems": 0}
+
+
+def reset():
+    del items[:]
+    del resolved[:]
+    directory.update({"content": "", "category": "", "ended": None, "sortMethods": []})
+    calls["addDirectoryItem"] = 0
+    calls["addDirectoryItems"] = 0
+
+
+def addDirectoryItem(handle, url, listitem, isFolder=False, totalItems=0):
+    calls["addDirectoryItem"] += 1
+    items.append((url, listitem, isFolder))
+    return True
+
+def addDirectoryItems(handle, items_, totalItems=0):
+    calls["addDirectoryItems"] += 1
+    for entry in items_:
+        url, listitem = entry[0], entry[1]
+        isFolder = entry[2] if len(entry) > 2 else False
+        items.append((url, listitem, isFolder))
+    return True
+
+def endOfDirectory(handle, succeeded=True, updateListing=False, cacheToDisc=True):
+    directory["ended"] = succeeded
+
+def setResolvedUrl(handle, succeeded, listitem):
+    resolved.append((succeeded, listitem))
+
+def setContent(handle, content):
+    directory["content"] = content
+
+def setPluginCategory(handle, category):
+    directory["category"] = category
+
+def addSortMethod(handle, sortMethod, labelMask="", label2Mask=""):
+    directory["sortMethods"].append(sortMethod)
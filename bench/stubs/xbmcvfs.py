@@ -0,0 +1,94 @@
+"""
+Stub del modulo xbmcvfs per il banco di prova (bench/harness.py)
+I percorsi special:// puntano alla cartella Kodi temporanea del banco
+"""
+
+import os
+import shutil
+
+# Impostato dal banco prima di importare l'addon
+KODI_ROOT = os.environ.get("MANDRA_BENCH_ROOT", "/tmp/mandra_bench")
+
+SPECIAL = {
+    "special://profile/": "userdata/",
+    "special://userdata/": "userdata/",
+    "special://masterprofile/": "userdata/",
+    "special://home/": "",
+    "special://temp/": "temp/",
+    "special://logpath/": "temp/",
+    "special://xbmc/": "xbmc/",
+    "special://xbmcbin/": "xbmc/",
+    "special://xbmcbinaddons/": "xbmc/addons/",
+}
+
+
+def translatePath(path):
+    for prefix in SPECIAL:
+        if path.startswith(prefix) or path+"/" == prefix:
+            rest = path[len(prefix):] if len(path) >= len(prefix) else ""
+            return os.path.join(KODI_ROOT, SPECIAL[prefix], rest)
+    return path
+
+def exists(path):
+    return os.path.exists(translatePath(path))
+
+def mkdir(path):
+    os.makedirs(translatePath(path), exist_ok=True)
+    return True
+
+def mkdirs(path):
+    return mkdir(path)
+
+def delete(path):
+    try:
+        os.remove(translatePath(path))
+        return True
+    except OSError:
+        return False
+
+def copy(source, destination):
+    shutil.copyfile(translatePath(source), translatePath(destination))
+    return True
+
+def rename(file, newFileName):
+    os.replace(translatePath(file), translatePath(newFileName))
+    return True
+
+def listdir(path):
+    path = translatePath(path)
+    dirs = [n for n in os.listdir(path) if os.path.isdir(os.path.join(path, n))]
+    files = [n for n in os.listdir(path) if not os.path.isdir(os.path.join(path, n))]
+    return dirs, files
+
+
+class File:
+    def __init__(self, filepath, mode="r"):
+        self.binary = "b" in mode
+        realMode = ("w" if "w" in mode else "r")+("b" if self.binary else "")
+        if self.binary:
+            self.f = open(translatePath(filepath), realMode)
+        else:
+            self.f = open(translatePath(filepath), realMode, encoding="utf-8")
+
+    def read(self, numBytes=-1):
+        return self.f.read(numBytes)
+
+    def readBytes(self, numBytes=-1):
+        data = self.f.read(numBytes)
+        return data if isinstance(data, bytes) else data.encode("utf-8")
+
+    def write(self, buffer):
+        self.f.write(buffer)
+        return True
+
+    def size(self):
+        return os.fstat(self.f.fileno()).st_size
+
+    def close(self):
+        self.f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, tb):
+        self.close()
@@ -1,8 +1,8 @@
-versione='1.1.3'
+versione='1.1.6'
 # Module: myResolve
 # Author: ElSupremo
 # Created on: 10.04.2021
-# Last update: 05.05.2023
+# Last update: 17.10.2026
 # License: GPL v.3 https://www.gnu.org/copyleft/gpl.html
 
 import os
@@ -15,8 +15,15 @@ import logging
 
 
 addon_id = 'plugin.video.mandrakodi'
-#selfAddon = xbmcaddon.Addon(id=addon_id)
-debug = xbmcaddon.Addon(id=addon_id).getSetting("debug")
+try:
+    import mandraCore
+    # same snapshot used by launcher and myResolver
+    settings = mandraCore.getSettings()
+    debug = settings.get("debug")
+except Exception:
+    # first start with the new code, or a broken copy: launcher.py fetches mandraCore
+    mandraCore = None
+    debug = xbmcaddon.Addon(id=addon_id).getSetting("debug")
 
 PY3 = sys.version_info[0] == 3
 if PY3:
@@ -33,11 +40,34 @@ def getStartUrl():
     return urlStart
 
 def checkLauncher():
+    global mandraCore, settings
     home = ''
     if PY3:
         home = xbmcvfs.translatePath(xbmcaddon.Addon(id=addon_id).getAddonInfo('path'))
     else:
         home = xbmc.translatePath(xbmcaddon.Addon(id=addon_id).getAddonInfo('path').decode('utf-8'))
+    if mandraCore is None:
+        return checkLauncherFull(home)
+
+    updater = mandraCore.getUpdater(home)
+    try:
+        installed = updater.update(["mandraCore.py", "launcher.py"])
+    except Exception as err:
+        logga('We failed to get the update manifest: {0}'.format(err))
+        msgBox("Non e' stato possibile contattare la sorgente.[CR]L'addon potrebbe non essere aggiornato.")
+        return
+    if "mandraCore.py" in installed:
+        import importlib
+        # the pool of the old module is closed, the launcher and this file
+        # share the client and the settings snapshot of the new one
+        mandraCore.closeClient()
+        mandraCore = importlib.reload(mandraCore)
+        settings = mandraCore.getSettings()
+    if "launcher.py" in installed:
+        logga('VERSION UPDATE')
+        msgBox("Codice Launcher aggiornato alla versione: "+updater.version("launcher.py"))
+
+def checkLauncherFull(home):
     launcher_file = os.path.join(home, 'launcher.py')
     if os.path.exists(launcher_file)==True:
         resF = open(launcher_file)
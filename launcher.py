@@ -1,8 +1,8 @@
-versione='1.2.77'
+versione='1.3.4'
 # Module: launcher
 # Author: ElSupremo
 # Created on: 22.02.2021
-# Last update: 05.01.2026
+# Last update: 17.10.2026
 # License: GPL v.3 https://www.gnu.org/copyleft/gpl.html
 
 import sys
@@ -13,10 +13,12 @@ import xbmc
 import xbmcplugin
 import xbmcaddon
 import json
+import hashlib
 import string
 import random
 import re
 import time
+import threading
 import xbmcvfs
 
 # Get the plugin url in plugin:// notation. 
@@ -24,21 +26,74 @@ _url = sys.argv[0]
 # Get the plugin handle as an integer number.
 _handle = int(sys.argv[1])
 addon_id = 'plugin.video.mandrakodi'
-#selfAddon = xbmcaddon.Addon(id=addon_id)
-xbmcaddon.Addon(id=addon_id).setSetting("debug", "on")
 
-debug = xbmcaddon.Addon(id=addon_id).getSetting("debug")
-showAdult = xbmcaddon.Addon(id=addon_id).getSetting("ShowAdult")
-lastView = xbmcaddon.Addon(id=addon_id).getSetting("urlAppo1")
+remoteBaseUrl = "https://raw.githubusercontent.com/mandrakodi/mandrakodi.github.io/main/"
+
+def downloadCore(core_file):
+    import hashlib
+    import urllib.request as myRequest
+    response = myRequest.urlopen(remoteBaseUrl+"mandraCore.py", timeout=45)
+    strSource = response.read()
+    response.close()
+    try:
+        response = myRequest.urlopen(remoteBaseUrl+"manifest.json", timeout=45)
+        info = json.loads(response.read().decode("utf-8"))["modules"]["mandraCore.py"]
+        response.close()
+    except Exception as err:
+        # no manifest: the body is at least checked to compile
+        logging.warning('MANDRA_LOG: NO MANIFEST FOR mandraCore: {0}'.format(err))
+        info = None
+    if info is not None and hashlib.sha256(strSource).hexdigest() != info["sha256"]:
+        raise Exception("Hash mismatch for mandraCore.py")
+    compile(strSource, core_file, "exec")
+    tmp_file = core_file+".tmp"
+    f = open(tmp_file, "wb")
+    f.write(strSource)
+    f.close()
+    os.replace(tmp_file, core_file)
+
+def checkCore(force=False):
+    home = xbmcvfs.translatePath(xbmcaddon.Addon(id=addon_id).getAddonInfo('path'))
+    core_file = os.path.join(home, 'mandraCore.py')
+    if os.path.exists(core_file) and not force:
+        return True
+    try:
+        downloadCore(core_file)
+        return True
+    except Exception as err:
+        logging.warning('Error to get mandraCore from: '+remoteBaseUrl+'mandraCore.py {0}'.format(err))
+    if force and os.path.exists(core_file):
+        # broken copy: removed, the next start downloads it again
+        try:
+            os.remove(core_file)
+        except OSError:
+            pass
+    return False
+
+checkCore()
+try:
+    import mandraCore
+except Exception as err:
+    # missing or broken local copy: one more verified download, then give up
+    logging.warning('MANDRA_LOG: CANNOT LOAD mandraCore: {0}'.format(err))
+    if not checkCore(force=True):
+        raise Exception("mandraCore non disponibile, controlla la connessione e riapri l'addon")
+    import mandraCore
+
+settings = mandraCore.getSettings()
+settings.set("debug", "on")
+
+debug = settings.get("debug")
+showAdult = settings.get("ShowAdult")
+lastView = settings.get("urlAppo1")
 if (lastView=="Not in use"):
     lastView="51"
-testoLog = "";
 viewmode=lastView
 ua = ""
 
 autoView="Not in use"
 try:
-    autoView = xbmcaddon.Addon(id=addon_id).getSetting("urlAppo4")
+    autoView = settings.get("urlAppo4")
 except:
     pass
 if (autoView=="Not in use"):
@@ -46,29 +101,40 @@ if (autoView=="Not in use"):
 
 PY3 = sys.version_info[0] == 3
 if PY3:
-    from urllib.parse import urlencode, parse_qsl
+    from urllib.parse import urlencode, parse_qsl, quote
 else:
     from urlparse import urlparse, parse_qsl
     from urllib import urlencode, quote
 	
-def logga(mess):
-    global testoLog
-    if debug == "on":
-        logging.warning("MANDRA_LOG: \n"+mess)
-        testoLog += mess+"\n";
+logger = mandraCore.getLogger("MANDRA_LOG: \n", debug)
+
+def logga(mess, *args):
+    logger.log(mess, *args)
+
+def getUa():
+    global ua
+    if ua == "":
+        pwd = settings.get("password")
+        deviceId = settings.get("urlAppo2")
+        if (deviceId == "Not in use" or deviceId == "" or len(deviceId) != 6):
+            #generate id
+            deviceId = id_generator()
+            settings.set("urlAppo2", deviceId)
+        version = settings.addonInfo("version")
+        ua = "MandraKodi2@@"+version+"@@"+pwd+"@@"+deviceId
+    return ua
+
+def httpGet(url, hdr=None):
+    response = mandraCore.getClient().get(url, headers=hdr)
+    if not response.ok():
+        raise Exception("HTTP "+str(response.status)+" from "+url)
+    return response.text()
 
 def makeRequestNoUa(url):
     logga('TRY TO OPEN '+url)
     html = ""
-    if PY3:
-        import urllib.request as myRequest
-    else:
-        import urllib2 as myRequest
     try:
-        req = myRequest.Request(url)
-        response = myRequest.urlopen(req, timeout=45)
-        html = response.read().decode('utf-8')
-        response.close()
+        html = httpGet(url, {"User-Agent": "Python-urllib/%d.%d" % sys.version_info[:2]})
         retff="NOCODE"
         if html != "":
             retff=html[0:15]
@@ -79,28 +145,14 @@ def makeRequestNoUa(url):
     return html
 
 
+@mandraCore.traced("makeRequest")
 def makeRequest(url, hdr=None):
     logga('TRY TO OPEN '+url)
     html = ""
-    if PY3:
-        import urllib.request as myRequest
-    else:
-        import urllib2 as myRequest
-    pwd = xbmcaddon.Addon(id=addon_id).getSetting("password")
-    deviceId = xbmcaddon.Addon(id=addon_id).getSetting("urlAppo2")
-    if (deviceId == "Not in use" or deviceId == "" or len(deviceId) != 6):
-        #generate id
-        deviceId = id_generator()
-        xbmcaddon.Addon(id=addon_id).setSetting("urlAppo2", deviceId)
-    version = xbmcaddon.Addon(id=addon_id).getAddonInfo("version")
     if hdr is None:
-        ua = "MandraKodi2@@"+version+"@@"+pwd+"@@"+deviceId
-        hdr = {"User-Agent" : ua}
+        hdr = {"User-Agent" : getUa()}
     try:
-        req = myRequest.Request(url, headers=hdr)
-        response = myRequest.urlopen(req, timeout=45)
-        html = response.read().decode('utf-8')
-        response.close()
+        html = httpGet(url, hdr)
         retff="NOCODE"
         if html != "":
             retff=html[0:15]
@@ -110,17 +162,35 @@ def makeRequest(url, hdr=None):
         pass
     return html
 
+sourceExpires = {}
+
+@mandraCore.traced("makeRequestCached")
+def makeRequestCached(url, ttl=None):
+    logga('TRY TO OPEN (CACHE) '+url)
+    html = ""
+    try:
+        response = mandraCore.fetchCached(url, {"User-Agent" : getUa()}, ttl)
+        if not response.ok():
+            raise Exception("HTTP "+str(response.status)+" from "+url)
+        html = response.text()
+        sourceExpires[url] = response.expires
+        logga('OK REQUEST FROM '+url+' cache: '+str(response.fromCache))
+    except:
+        logging.warning('Error to open url: '+url)
+        pass
+    return html
+
 def getSource():
     startUrl = "https://raw.githubusercontent.com/mandrakodi/mandrakodi.github.io/main/data/disclaimer.json"
     #startUrl = "https://www.dropbox.com/s/igyq58cnpjq0fq4/disclaimer.json?dl=1"
     try:
-        strSource = makeRequest(startUrl)
+        strSource = makeRequestCached(startUrl)
         if strSource is None or strSource == "":
             logging.warning('MANDRA_LOG: NO DISCLAIMER')
             strSource = underMaintMsg()
         else:
             logga('OK SOURCE ')
-            liveVersion = "Mandrakodi "+str(xbmcaddon.Addon(id=addon_id).getAddonInfo("version"))
+            liveVersion = "Mandrakodi "+str(settings.addonInfo("version"))
             strSource=strSource.replace("Mandrakodi 2.0", liveVersion)
     except Exception as err:
         errMsg="ERRORE: {0}".format(err)
@@ -156,39 +226,532 @@ def connProblemMsg():
 def id_generator(size=6, chars=string.ascii_uppercase + string.digits):
     return ''.join(random.choice(chars) for _ in range(size))
 
-def play_video(path):
+def play_video(path, props=None):
     urlClean=path.replace(" ", "%20")
     play_item = xbmcgui.ListItem(path=urlClean)
+    if props:
+        # #KODIPROP of the m3u entries: the stream plays with its inputstream at the first try
+        for key, value in json.loads(props).items():
+            if key == "mimetype":
+                play_item.setMimeType(value)
+                play_item.setContentLookup(False)
+            else:
+                play_item.setProperty(key, value)
     xbmcplugin.setResolvedUrl(_handle, True, listitem=play_item)
 
 def getTxtMessage(vName):
     home = ''
     if PY3:
-        home = xbmcvfs.translatePath(xbmcaddon.Addon(id=addon_id).getAddonInfo('path'))
+        home = xbmcvfs.translatePath(settings.addonInfo('path'))
     else:
-        home = xbmc.translatePath(xbmcaddon.Addon(id=addon_id).getAddonInfo('path').decode('utf-8'))
+        home = xbmc.translatePath(settings.addonInfo('path').decode('utf-8'))
     fPath = os.path.join(home, vName)
     resF = open(fPath)
     file_content = resF.read()
     resF.close()
     return file_content
 
-def getExternalJson(strPath):
-    strSource = makeRequest(strPath)
+def getExternalJson(strPath, offset=0, rev="", page=1):
+    global recording
+    snapshots = None
+    snap = None
+    if DIR_SNAPSHOT and probeMode() == "off":
+        # with the link prober on the entries change with the health of the links
+        snapshots = mandraCore.getSnapshotCache()
+        snapKey = snapshots.key(versione, strPath, offset, rev, page, showAdult, PAGE_SIZE)
+        snap = snapshots.load(snapKey)
+        if snap is not None and time.time() < snap["expires"] and replaySnapshot(snap):
+            # source still fresh: no request and no json
+            snapshots.touch(snapKey)
+            return
+    strSource = makeRequestCached(strPath)
     #strSource = makeRequestNoUa(strPath)
     if (strSource == ""):
         msgBox("Spiacenti, la fonte non e' raggiungibile")
         remoteLog("NO_FONTE@@"+strPath)
         logging.warning("NO JSON AT: "+strPath)
         strSource = connProblemMsg()
+        strPath = None
+    elif snapshots is not None:
+        digest = snapshots.digest(strSource)
+        expires = sourceExpires.get(strPath, 0)
+        if snap is not None and snap["source"] == digest and replaySnapshot(snap):
+            # source revalidated and unchanged: no json
+            snap["expires"] = expires
+            snapshots.store(snapKey, snap)
+            return
+        recording = {"key": snapKey, "source": digest, "expires": expires, "channels": "", "entries": []}
+    if offset > 0 and rev != pageRev(strSource):
+        # the list changed since the previous page: its offsets are no longer valid
+        logga("LIST CHANGED, RESTART FROM PAGE 1: %s", strPath)
+        offset = 0
+        page = 1
     
-    jsonToItems(strSource)
-	
-def jsonToItems(strJson):
+    jsonToItems(strSource, strPath, offset, page)
+
+#=================================================
+# PAGED LISTS
+#=================================================
+
+PAGE_MIN_SIZE = 512 * 1024
+PAGE_SIZE = 400
+JSON_WS = re.compile(r'[ \t\n\r]*')
+
+class ItemPage:
+    """
+    One page of the "items" array of a big list, decoded item by item from
+    the character offset where the previous page stopped.
+    """
+    def __init__(self, strJson, start, size):
+        self.strJson = strJson
+        self.start = start
+        self.size = size
+        self.nextOffset = None
+
+    def __iter__(self):
+        decoder = json.JSONDecoder()
+        text = self.strJson
+        pos = JSON_WS.match(text, self.start).end()
+        count = 0
+        while pos < len(text) and text[pos] != ']':
+            if count >= self.size:
+                self.nextOffset = pos
+                return
+            item, pos = decoder.raw_decode(text, pos)
+            pos = JSON_WS.match(text, pos).end()
+            if pos < len(text) and text[pos] == ',':
+                pos = JSON_WS.match(text, pos + 1).end()
+            count += 1
+            yield item
+
+def pageRev(strJson):
+    # the resume offsets hold only for the body they were taken from
+    return hashlib.sha1(strJson.encode("utf-8", "replace")).hexdigest()[:16]
+
+def itemsLast(strJson, start):
+    """
+    True when nothing but the closing brace follows the items array that
+    starts at start. Keys after it would be lost by paging: those
+    documents take the full-parse path.
+    """
+    pos = len(strJson) - 1
+    for expected in ('}', ']', '}['):
+        while pos >= start and strJson[pos] in ' \t\n\r':
+            pos -= 1
+        if pos < start or strJson[pos] not in expected:
+            return False
+        pos -= 1
+    # an array of objects after the items looks the same: the only one read is "channels"
+    return strJson.find('"channels"', start) < 0
+
+def openPage(strJson, offset):
+    """
+    Reads the keys in front of "items" and returns them with an ItemPage
+    starting at offset (the first item when offset is 0). None when the
+    document is not a plain item list.
+    """
+    decoder = json.JSONDecoder()
+    try:
+        pos = JSON_WS.match(strJson, 0).end()
+        if strJson[pos] != '{':
+            return None
+        header = {}
+        pos = JSON_WS.match(strJson, pos + 1).end()
+        while strJson[pos] != '}':
+            key, pos = decoder.raw_decode(strJson, pos)
+            pos = JSON_WS.match(strJson, pos).end()
+            pos = JSON_WS.match(strJson, pos + 1).end()
+            if key in ("name", "channels"):
+                # redirect and channel lists take the full-parse path
+                return None
+            if key == "items":
+                if strJson[pos] != '[' or not itemsLast(strJson, pos):
+                    return None
+                start = pos + 1
+                if offset > 0:
+                    # the offset must be the start of an item of this array
+                    back = offset - 1
+                    while back > pos and strJson[back] in ' \t\n\r':
+                        back -= 1
+                    if back <= pos or strJson[back] != ',' or not isinstance(decoder.raw_decode(strJson, offset)[0], dict):
+                        return None
+                    start = offset
+                header["items"] = ItemPage(strJson, start, PAGE_SIZE)
+                return header
+            header[key], pos = decoder.raw_decode(strJson, pos)
+            pos = JSON_WS.match(strJson, pos).end()
+            if strJson[pos] == ',':
+                pos = JSON_WS.match(strJson, pos + 1).end()
+    except (ValueError, IndexError):
+        pass
+    return None
+
+#=================================================
+# DIRECTORY
+#=================================================
+
+DIRECTORY_CHUNK = 500
+DEFAULT_THUMB = "https://www.andreisfina.it/wp-content/uploads/2018/12/no_image.jpg"
+DEFAULT_FANART = "https://www.stadiotardini.it/wp-content/uploads/2016/12/mandrakata.jpg"
+
+# lists replayed from the directory snapshots when their source is unchanged
+DIR_SNAPSHOT = True
+# snapshot prepared by getExternalJson, taken by the next Directory
+recording = None
+
+class Directory:
+    """
+    Collects the (url, ListItem, isFolder) entries of a listing and passes
+    them to Kodi with one addDirectoryItems call every DIRECTORY_CHUNK entries
+    instead of one addDirectoryItem call per entry.
+    """
+    def __init__(self, handle, chunkSize=DIRECTORY_CHUNK):
+        global recording
+        self.handle = handle
+        self.chunkSize = chunkSize
+        self.entries = []
+        self.count = 0
+        self.snapshot = recording
+        recording = None
+        self.art = artEnabled()
+        self.artWindow = PAGE_SIZE
+
+    def add(self, url, listItem, isFolder=False):
+        self.entries.append((url, listItem, isFolder))
+        if len(self.entries) >= self.chunkSize:
+            self.flush()
+
+    def addItem(self, url, label, info, art, isFolder=False, playable=False):
+        # ListItem built from plain values, kept for the snapshot of the directory
+        list_item = xbmcgui.ListItem(label=label, offscreen=True)
+        list_item.setInfo('video', info)
+        if self.art:
+            # local copies when cached, the first page of entries is prefetched
+            list_item.setArt(localArt(art, self.count + len(self.entries) < self.artWindow))
+        else:
+            list_item.setArt(art)
+        if playable:
+            list_item.setProperty('IsPlayable', 'true')
+        if self.snapshot is not None:
+            self.snapshot["entries"].append((url, isFolder, label, info, art, playable))
+        self.add(url, list_item, isFolder)
+
+    def flush(self):
+        if self.entries:
+            xbmcplugin.addDirectoryItems(self.handle, self.entries)
+            self.count += len(self.entries)
+            self.entries = []
+
+    def end(self, succeeded=True):
+        self.flush()
+        xbmcplugin.endOfDirectory(self.handle, succeeded)
+        if succeeded and self.snapshot is not None:
+            snap = self.snapshot
+            self.snapshot = None
+            snap["viewmode"] = viewmode
+            mandraCore.getSnapshotCache().store(snap.pop("key"), snap)
+        if self.art:
+            mandraCore.getArtCache().prefetch()
+
+def replaySnapshot(snap):
+    global viewmode
+    if snap["channels"]:
+        # the categories open from the channel store: it must still have the list
+        if not mandraCore.getChannelStore().has(snap["channels"]):
+            return False
+        xbmcgui.Window(10000).setProperty("chListKey", snap["channels"])
+    with mandraCore.span("snapshot.replay", items=len(snap["entries"])):
+        logga("REPLAY SNAPSHOT: %s items", len(snap["entries"]))
+        xbmcplugin.setContent(_handle, 'movies')
+        viewmode = snap["viewmode"]
+        directory = Directory(_handle)
+        for url, isFolder, label, info, art, playable in snap["entries"]:
+            directory.addItem(url, label, info, art, isFolder, playable)
+        directory.end()
+    return True
+
+artCache = {}
+
+def artDict(thumb=DEFAULT_THUMB, fanart=DEFAULT_FANART):
+    # setArt copies the values: lists repeating the same images share one dict
+    key = (thumb, fanart)
+    art = artCache.get(key)
+    if art is None:
+        art = {'thumb': thumb, 'icon': thumb, 'poster': thumb, 'landscape': fanart, 'fanart': fanart}
+        artCache[key] = art
+    return art
+
+ART_WAIT = 15
+# thumbnails and fanart prefetched and served from the local art cache
+ART_CACHE = True
+localArtCache = {}
+
+def artEnabled():
+    return ART_CACHE
+
+def localArt(art, want=True):
+    """art with the images already in the local art cache pointing at the local files"""
+    key = (art.get('thumb', ""), art.get('fanart', ""))
+    local = localArtCache.get(key)
+    if local is None:
+        files = mandraCore.getArtCache()
+        thumb = files.lookup(key[0], want)
+        fanart = files.lookup(key[1], want)
+        local = art
+        if thumb != key[0] or fanart != key[1]:
+            local = dict(art, thumb=thumb, icon=thumb, poster=thumb, landscape=fanart, fanart=fanart)
+        localArtCache[key] = local
+    return local
+
+def queueArt(items):
+    # art of the entries the user is likely to open next (the next page)
+    files = mandraCore.getArtCache()
+    try:
+        for item in items:
+            files.lookup(item.get("thumbnail", ""))
+            files.lookup(item.get("fanart", ""))
+    except (ValueError, IndexError, AttributeError):
+        pass
+
+def waitArtPrefetch():
+    # the directory is already on screen: only the connections wait for the prefetch
+    if artEnabled():
+        mandraCore.getArtCache().wait(ART_WAIT)
+
+#=================================================
+# LINK HEALTH
+#=================================================
+
+PROBE_WAIT = 20
+PROBE_DEAD = "[COLOR red]OFF[/COLOR] "
+# off, mark (dead links in red) or hide (dead links not shown)
+LINK_PROBE = "off"
+
+def probeMode():
+    return LINK_PROBE
+
+def linkHealth(links):
+    """{link: alive} of the links already checked; the others are queued for the prober"""
+    try:
+        prober = mandraCore.getLinkProber()
+        health = prober.state(links)
+        prober.queue([link for link in links if link not in health])
+        return health
+    except Exception as err:
+        logga("LINK HEALTH ERROR: %s", err)
+    return {}
+
+def waitLinkProbe():
+    if probeMode() != "off":
+        mandraCore.getLinkProber().wait(PROBE_WAIT)
+
+#=================================================
+# LIST ENTRIES
+#=================================================
+
+# keys carrying the link of an item, in the order they have always been read:
+# when an item has more than one of them the last one gives the link
+LINK_KEYS = ("link", "acelocal", "acehls", "externallink", "externallink2", "myresolve",
+             "regexPage", "chrome", "yatse", "m3u", "personal", "magnet", "pvr", "log",
+             "copyXml", "updateCode", "delSet")
+# keys deciding how the url is built, strongest first ("link" is the fallback)
+KIND_KEYS = ("externallink", "externallink2", "regexPage", "myresolve", "pvr", "log",
+             "m3u", "personal", "copyXml", "updateCode", "delSet", "yatse", "magnet", "chrome")
+FOLDER_KEYS = frozenset(("externallink", "externallink2", "myresolve", "chrome", "m3u",
+                         "personal", "log", "copyXml", "updateCode", "delSet"))
+PLAYABLE_KINDS = frozenset(("regexPage", "yatse", "magnet", "apk", "link"))
+LINK_SET = frozenset(LINK_KEYS)
+LINK_ORDER = dict((key, n) for n, key in enumerate(LINK_KEYS))
+KIND_ORDER = dict((key, n) for n, key in enumerate(KIND_KEYS))
+
+class ListEntry:
+    """
+    One item of a list json reduced to what the directory needs: the kind
+    (the key that decides the url), the link and the extra url parameter.
+    """
+    __slots__ = ("title", "thumb", "fanart", "genre", "info", "kind", "link", "extra", "isFolder")
+
+    def __init__(self, item, link=""):
+        # link: items without any link key keep the one of the previous item
+        get = item.get
+        self.title = get("title", "NO TIT")
+        self.thumb = get("thumbnail", DEFAULT_THUMB)
+        self.fanart = get("fanart", DEFAULT_FANART)
+        self.genre = get("genre", "generic")
+        self.info = get("info", "")
+        self.extra = None
+        keys = LINK_SET.intersection(item)
+        youtube = "link" in keys and 'youtube' in item["link"]
+        if len(keys) == 1 and not youtube:
+            kind = last = next(iter(keys))
+            if kind not in KIND_ORDER:
+                kind = "link"
+        elif keys:
+            last = max(keys, key=LINK_ORDER.get)
+            kinds = [key for key in keys if key in KIND_ORDER]
+            if youtube:
+                kinds.append("yatse")
+            kind = min(kinds, key=KIND_ORDER.get) if kinds else "link"
+        else:
+            kind = last = None
+
+        if last is None:
+            pass
+        elif last == "acelocal":
+            link = "http://127.0.0.1:6878/ace/getstream?id="+item["acelocal"]
+        elif last == "acehls":
+            link = "http://127.0.0.1:6878/ace/manifest.m3u8?id="+item["acehls"]
+        elif last == "log":
+            link = "ignore"
+        else:
+            link = item[last]
+
+        if "myresolve" in keys:
+            # resolver@@parameter (or resolver:parameter)
+            value = item["myresolve"]
+            if "@@" in value:
+                arrT = value.split("@@")
+            elif ":" in value:
+                arrT = value.split(":")
+            else:
+                arrT = (value, "no_par")
+            if last == "myresolve":
+                link = arrT[0]
+            if kind == "myresolve":
+                self.extra = arrT[1]
+        if kind == "regexPage":
+            self.extra = get("regexExpres", "")
+        elif kind is None or kind == "link":
+            kind = "link"
+            if 'apk' in item:
+                kind = "apk"
+                self.extra = item["apk"]
+            elif 'props' in item:
+                # ListItem properties of the stream (inputstream, licence, ...)
+                self.extra = json.dumps(item["props"], sort_keys=True)
+        self.kind = kind
+        self.link = link
+        self.isFolder = youtube or not FOLDER_KEYS.isdisjoint(keys) or kind == "apk"
+
+def entryUrls():
+    """
+    Dispatch table kind -> function(entry) returning the url of the entry,
+    built once per list: the plugin urls share a precomputed action prefix.
+    """
+    def action(name, extraName=None):
+        prefix = '{0}?{1}&'.format(_url, urlencode({'action': name}))
+        if extraName is None:
+            return lambda entry: prefix + urlencode({'url': entry.link})
+        return lambda entry: prefix + urlencode((('url', entry.link), (extraName, entry.extra)))
+
+    playUrl = action('play')
+    playPropsUrl = action('play', 'props')
+    pluginUrl = action('plugin')
+
+    def linkUrl(entry):
+        if entry.link.startswith("plugin://plugin"):
+            return pluginUrl(entry)
+        if entry.extra is not None:
+            return playPropsUrl(entry)
+        return playUrl(entry)
+
+    def yatseUrl(entry):
+        arrT = entry.link.split("@@")
+        if arrT[0] == "pls":
+            return get_urlYatse(playlist_id=arrT[1])
+        return get_urlYatse(video_id=arrT[1])
+
+    apkUrl = action('apk', 'apk')
+
+    def apkEntryUrl(entry):
+        logga('APK MODE')
+        return apkUrl(entry)
+
+    return {
+        "externallink": action('getExtData'),
+        "externallink2": action('getExtData2'),
+        "regexPage": action('regex', 'exp'),
+        "myresolve": action('myresolve', 'parIn'),
+        "pvr": action('pvr'),
+        "log": action('log'),
+        "m3u": action('m3u'),
+        "personal": action('personal'),
+        "copyXml": action('copyXml'),
+        "updateCode": action('updateCode'),
+        "delSet": action('delSet'),
+        "yatse": yatseUrl,
+        "magnet": lambda entry: get_urlMagnet(uri=entry.link),
+        "chrome": lambda entry: get_urlChrome(mode='showSite', stopPlayback='no', kiosk='no', url=entry.link),
+        "apk": apkEntryUrl,
+        "link": linkUrl,
+    }
+
+#=================================================
+# LOCAL SEARCH
+#=================================================
+
+# service entries never shown among the search results
+SEARCH_SKIP_KINDS = frozenset(("log", "copyXml", "updateCode", "delSet"))
+SEARCH_THUMB = "https://cdn-icons-png.flaticon.com/512/54/54481.png"
+# searches answered from the local index of the lists already opened
+LOCAL_SEARCH = True
+
+def searchEnabled():
+    return LOCAL_SEARCH
+
+def searchSource(source, text):
+    """(source, digest) to index, None when the search index already has it"""
+    try:
+        index = mandraCore.getSearchIndex()
+        digest = index.digest(text)
+        if not index.current(source, digest):
+            return (source, digest)
+    except Exception as err:
+        logga("SEARCH INDEX ERROR: %s", err)
+    return None
+
+def indexItems(toIndex, entries):
+    try:
+        mandraCore.getSearchIndex().update(toIndex[0], toIndex[1], entries)
+    except Exception as err:
+        logga("SEARCH INDEX ERROR: %s", err)
+
+def localSearch(text, onlineUrl):
+    """Items of the lists already opened matching text, under an entry for the online search"""
+    try:
+        found = mandraCore.getSearchIndex().search(text)
+    except Exception as err:
+        logga("SEARCH INDEX ERROR: %s", err)
+        return False
+    logga("LOCAL SEARCH %s: %s items", text, len(found))
+    if not found:
+        return False
+    online = {"title": "[COLOR gold]Cerca online: "+text+"[/COLOR]", "externallink": onlineUrl,
+              "thumbnail": SEARCH_THUMB, "info": "Risultati dalla fonte remota"}
+    jsonToItems({"SetViewMode": "503", "items": [online] + found})
+    return True
+
+def jsonToItems(strJson, srcUrl=None, offset=0, page=1):
     global viewmode
     try:
         logga('START jsonToItems')
-        dataJson = json.loads(strJson)
+        dataJson = None
+        if isinstance(strJson, dict):
+            # already parsed (channel store, resolver Listing)
+            dataJson = strJson
+        elif srcUrl is not None and (offset > 0 or len(strJson) >= PAGE_MIN_SIZE):
+            # big list: decode only the items of the requested page
+            with mandraCore.span("jsonToItems.page", size=len(strJson), offset=offset):
+                dataJson = openPage(strJson, offset)
+                if dataJson is None and offset > 0:
+                    # offset not valid for this body: start again from the first page
+                    logga("BAD PAGE OFFSET, RESTART FROM PAGE 1: %s", srcUrl)
+                    offset = 0
+                    page = 1
+                    dataJson = openPage(strJson, 0)
+        if dataJson is None:
+            with mandraCore.span("jsonToItems.parse", size=len(strJson)):
+                dataJson = json.loads(strJson)
     except Exception as err:
         errMsg="Errore: Nessuna risposta dal server (No Json)"
         msgBox(errMsg)
@@ -219,204 +782,72 @@ def jsonToItems(strJson):
     try:
         arrChan = dataJson['channels']
         logga("OK CHANNELS")
-        return jsonToChannels(strJson)
+        return jsonToChannels(dataJson, strJson)
     except:
         logga('NO CHANNELS. GetItems')
         pass
     
     link = ""
-    strLog=""
+    current = None
+    isAndroid = None
+    entryUrl = entryUrls()
+    toIndex = None
+    searchEntries = []
+    if srcUrl is not None and searchEnabled():
+        toIndex = searchSource(srcUrl if offset <= 0 else srcUrl+"#"+str(offset), strJson)
+    items = dataJson["items"]
+    probe = probeMode()
+    health = {}
+    if probe != "off":
+        items = list(items)
+        health = linkHealth([item["link"] for item in items if isinstance(item.get("link"), str)])
+    render = mandraCore.span("jsonToItems.render")
+    directory = Directory(_handle)
     try:
-        for item in dataJson["items"]:
-            strLog=json.dumps(item)
-            titolo = "NO TIT"
-            thumb = "https://www.andreisfina.it/wp-content/uploads/2018/12/no_image.jpg"
-            fanart = "https://www.stadiotardini.it/wp-content/uploads/2016/12/mandrakata.jpg"
-            genre = "generic"
-            info = ""
-            regExp = ""
-            resolverPar = "no_par"
-            
-            tipoLink = ""
-            
-            extLink = False
-            extLink2 = False
-            is_folder = False
-            is_magnet = False
-            is_myresolve = False
-            is_regex = False
-            is_m3u = False
-            is_chrome = False
-            is_yatse = False
-            is_pvr = False
-            is_log = False
-            is_copyXml = False
-            is_updateCode = False
-            is_delSet = False
-            is_personal = False
-            is_enabled = True
-
-            if 'enabled' in item:
-                is_enabled = item["enabled"]
-            if is_enabled == False:
+        for item in items:
+            current = item
+            if item.get("enabled", True) == False:
                 continue
 
-            if 'tipoLink' in item:
-                tipoLink = item["tipoLink"]
-                if tipoLink == "adult":
-                    if showAdult=="false":
-                        continue
-            
-                if tipoLink == "android":
-                    if (xbmc.getCondVisibility("system.platform.android") == False):
-                        continue
-            
-            if 'title' in item:
-                titolo = item["title"]
-            if 'thumbnail' in item:
-                thumb = item["thumbnail"]
-            if 'fanart' in item:
-                fanart = item["fanart"]
-            if 'info' in item:
-                info = item["info"]
-            if 'genre' in item:
-                genre = item["genre"]
-            if 'link' in item:
-                link = item["link"]
-                if 'youtube' in link:
-                    is_yatse = True
-                    is_folder = True
-            if 'acelocal' in item:
-                link = "http://127.0.0.1:6878/ace/getstream?id="+item["acelocal"]
-            if 'acehls' in item:
-                link = "http://127.0.0.1:6878/ace/manifest.m3u8?id="+item["acehls"]
-            if 'externallink' in item:
-                extLink = True
-                is_folder = True
-                link = item["externallink"]
-            if 'externallink2' in item:
-                extLink2 = True
-                is_folder = True
-                link = item["externallink2"]
-            if 'myresolve' in item:
-                is_myresolve = True
-                is_folder = True
-                link = item["myresolve"]
-                #logga("MY_RESOLVE_LINK: "+link)
-                if "@@" in link:
-                    arrT=link.split("@@")
-                    link=arrT[0]
-                    resolverPar=arrT[1]
-                elif ":" in link:
-                    arrT=link.split(":")
-                    link=arrT[0]
-                    resolverPar=arrT[1]
-                #logga("MY_RES_LINK: "+link)
-                #logga("MY_RES_PAR: "+resolverPar)
-            if 'regexPage' in item:
-                is_regex = True
-                link = item["regexPage"]
-                if 'regexExpres' in item:
-                    regExp = item["regexExpres"]
-            if 'chrome' in item:
-                is_chrome = True
-                is_folder = True
-                link = item["chrome"]
-            if 'yatse' in item:
-                is_yatse = True
-                #is_folder = True
-                link = item["yatse"]
-            if 'm3u' in item:
-                is_m3u = True
-                is_folder = True
-                link = item["m3u"]
-            if 'personal' in item:
-                is_personal = True
-                is_folder = True
-                link = item["personal"]
-            if 'magnet' in item:
-                is_magnet = True
-                link = item["magnet"]
-            if 'pvr' in item:
-                is_pvr = True
-                link = item["pvr"]
-            if 'log' in item:
-                is_log = True
-                is_folder = True
-                link = "ignore"
-            if 'copyXml' in item:
-                is_copyXml = True
-                is_folder = True
-                link = item["copyXml"]
-            if 'updateCode' in item:
-                is_updateCode = True
-                is_folder = True
-                link = item["updateCode"]
-            if 'delSet' in item:
-                is_delSet = True
-                is_folder = True
-                link = item["delSet"]
-            list_item = xbmcgui.ListItem(label=titolo)
-            list_item.setInfo('video', {'title': titolo,'genre': genre,'plot': info,'mediatype': 'movie','credits': 'ElSupremo'})
-            list_item.setArt({'thumb': thumb, 'icon': thumb, 'poster': thumb, 'landscape': fanart, 'fanart': fanart})
-            url = ""
-
-            if extLink == True:
-                url = get_url(action='getExtData', url=link)
-            elif extLink2 == True:
-                url = get_url(action='getExtData2', url=link)
-            elif is_regex == True:
-                list_item.setProperty('IsPlayable', 'true')
-                url = get_url(action='regex', url=link, exp=regExp)
-            elif is_myresolve == True:
-                url = get_url(action='myresolve', url=link, parIn=resolverPar)
-            elif is_pvr == True:
-                url = get_url(action='pvr', url=link)
-            elif is_log == True:
-                url = get_url(action='log', url=link)
-            elif is_m3u == True:
-                url = get_url(action='m3u', url=link)
-            elif is_personal == True:
-                url = get_url(action='personal', url=link)
-            elif is_copyXml == True:
-                url = get_url(action='copyXml', url=link)
-            elif is_updateCode == True:
-                url = get_url(action='updateCode', url=link)
-            elif is_delSet == True:
-                url = get_url(action='delSet', url=link)
-            elif is_yatse == True:
-                list_item.setProperty('IsPlayable', 'true')
-                arrT=link.split("@@")
-                tipo=arrT[0]
-                link1=arrT[1]
-                if tipo=="pls":
-                    url = get_urlYatse(playlist_id=link1)
-                else:
-                    url = get_urlYatse(video_id=link1)
-                #url = get_urlYatse(action='share', type='unresolvedurl', data=link)
-            elif is_magnet == True:
-                list_item.setProperty('IsPlayable', 'true')
-                url = get_urlMagnet(uri=link)
-            elif is_chrome == True:
-                url = get_urlChrome(mode='showSite', stopPlayback='no', kiosk='no', url=link)
-            else:
-                if 'apk' in item:
-                    logga('APK MODE')
-                    list_item.setProperty('IsPlayable', 'true')
-                    is_folder = True
-                    apkName=item["apk"]
-                    url = get_url(action='apk', url=link, apk=apkName)
-                else:
-                    list_item.setProperty('IsPlayable', 'true')
-                    if not link.startswith("plugin://plugin"):
-                        url = get_url(action='play', url=link)
-                    else:
-                        url = get_url(action='plugin', url=link)
-            xbmcplugin.addDirectoryItem(_handle, url, list_item, is_folder)
+            tipoLink = item.get("tipoLink")
+            if tipoLink == "adult":
+                if showAdult=="false":
+                    continue
+            elif tipoLink == "android":
+                if isAndroid is None:
+                    isAndroid = xbmc.getCondVisibility("system.platform.android")
+                if isAndroid == False:
+                    continue
+
+            entry = ListEntry(item, link)
+            link = entry.link
+            if health and entry.kind == "link" and health.get(link) == False:
+                if probe == "hide":
+                    continue
+                entry.title = PROBE_DEAD+entry.title
+            if toIndex is not None and entry.kind not in SEARCH_SKIP_KINDS:
+                searchEntries.append((entry.title, item))
+            info = {'title': entry.title,'genre': entry.genre,'plot': entry.info,'mediatype': 'movie','credits': 'ElSupremo'}
+            directory.addItem(entryUrl[entry.kind](entry), entry.title, info, artDict(entry.thumb, entry.fanart),
+                              entry.isFolder, entry.kind in PLAYABLE_KINDS)
+        itemPage = dataJson["items"]
+        if isinstance(itemPage, ItemPage) and itemPage.nextOffset is not None:
+            titolo = "[COLOR gold]Pagina "+str(page + 1)+" >>[/COLOR]"
+            url = get_url(action='getExtPage', url=srcUrl, offset=itemPage.nextOffset, rev=pageRev(strJson), page=page + 1)
+            directory.addItem(url, titolo, {'title': titolo,'plot': titolo,'mediatype': 'movie','credits': 'ElSupremo'}, artDict(), True)
+            if directory.art:
+                queueArt(ItemPage(strJson, itemPage.nextOffset, itemPage.size))
         logga("CALL LAUNCHER endOfDirectory 1")
-        xbmcplugin.endOfDirectory(_handle)
+        directory.end()
+        render.end(items=directory.count)
+        if probe != "off":
+            mandraCore.getLinkProber().start(PROBE_WAIT)
+        if toIndex is not None:
+            indexItems(toIndex, searchEntries)
     except:
         import traceback
+        strLog = json.dumps(current) if current is not None else ""
+        render.end(error="NO_JSON_READ")
         msgBox("Errore nella lettura del json")
         remoteLog("NO_JSON_READ@@"+strLog)
         writeFileLog("NO_JSON_READ\n"+strLog, "w+")
@@ -442,21 +873,29 @@ def parameters_string_to_dict(parameters):
     params = dict(parse_qsl(parameters.split('?')[1]))
     return params
 
-def jsonToChannels(strJson):
+def jsonToChannels(channelsArray, strJson=None):
     jobStep=1
     jobCh=1
     try:
-        channelsArray = json.loads(strJson)
         jobStep += 1
-        window = xbmcgui.Window(10000)
-        window.setProperty("chList", strJson)
+        store = mandraCore.getChannelStore()
+        # listKey: channels already in the store (parsed playlists)
+        listKey = channelsArray.get("listKey")
+        if listKey is None:
+            listKey = store.listKey(strJson if strJson is not None else channelsArray)
+            store.put(listKey, channelsArray["channels"])
+        # favourites saved with an older getChannel url have no list key
+        xbmcgui.Window(10000).setProperty("chListKey", listKey)
         xbmcplugin.setContent(_handle, 'movies')
+        directory = Directory(_handle)
+        if directory.snapshot is not None:
+            directory.snapshot["channels"] = listKey
         for channel in channelsArray["channels"]:
             jobCh=1
             jobStep += 1
             titolo = "NO TIT"
-            thumb = "https://www.andreisfina.it/wp-content/uploads/2018/12/no_image.jpg"
-            fanart = "https://www.andreisfina.it/wp-content/uploads/2018/12/no_image.jpg"
+            thumb = DEFAULT_THUMB
+            fanart = DEFAULT_THUMB
             genre = "generic"
             info = ""
             is_enabled = True
@@ -481,18 +920,20 @@ def jsonToChannels(strJson):
             if 'info' in channel:
                 info = channel["info"].encode('utf-8').strip()
                 jobCh += 1
-            list_item = xbmcgui.ListItem(label=titolo)
-            jobCh += 1
-            list_item.setInfo('video', {'title': titolo,'genre': genre,'plot': info,'mediatype': 'movie','credits': 'ElSupremo'})
-            jobCh += 1
-            list_item.setArt({'thumb': thumb, 'icon': thumb, 'poster': thumb, 'landscape': fanart, 'fanart': fanart})
+            url = get_url(action='getChannel', url=titolo, list=listKey)
             jobCh += 1
-            url = get_url(action='getChannel', url=titolo)
-            jobCh += 1
-            xbmcplugin.addDirectoryItem(_handle, url, list_item, True)
+            directory.addItem(url, titolo, {'title': titolo,'genre': genre,'plot': info,'mediatype': 'movie','credits': 'ElSupremo'}, artDict(thumb, fanart), True)
             jobCh += 1
         logga("CALL LAUNCHER endOfDirectory 2")
-        xbmcplugin.endOfDirectory(_handle)
+        directory.end()
+        if searchEnabled():
+            toIndex = searchSource("channels:"+listKey, listKey)
+            if toIndex is not None:
+                entries = [(item.get("title", ""), item) for channel in channelsArray["channels"]
+                           for item in channel.get("items", []) if item.get("enabled", True) != False]
+                # group headers of a cached playlist have no items: its index stays as it is
+                if entries:
+                    indexItems(toIndex, entries)
     except Exception as err:
         import traceback
         logging.warning("ERR_TIT: "+titolo)
@@ -500,23 +941,24 @@ def jsonToChannels(strJson):
         msgBox("Errore nella creazione delle gategorie: "+str(jobStep)+" - "+str(jobCh))
         traceback.print_exc()    
    
-def channelToItems(strChName, _handle):
-    window = xbmcgui.Window(10000)
-    strJson = window.getProperty("chList")
-    channelsArray = json.loads(strJson)
+def channelToItems(strChName, _handle, listKey=""):
+    if listKey == "":
+        listKey = xbmcgui.Window(10000).getProperty("chListKey")
+    channel = mandraCore.getChannelStore().get(listKey, strChName)
+    if channel is None:
+        logga("CHANNEL NOT FOUND: %s (%s)", strChName, listKey)
+        msgBox("Categoria non disponibile.[CR]Riapri la lista e riprova.")
+        return
     xbmcplugin.setContent(_handle, 'movies')
-    for channel in channelsArray["channels"]:
-        titolo = channel["name"]
-        if titolo == strChName:
-            logga("FOUND CH: "+titolo)
-            jsonToItems(json.dumps(channel))
+    logga("FOUND CH: "+strChName)
+    jsonToItems(channel)
 
 def simpleRegex(page, find):
     hdr = {"User-Agent" : "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/74.0.3729.169 Safari/537.36"}
     html = makeRequest(page, hdr)
     #if PY3:
         #html = html.decode('utf-8')
-    logga("HTML:\n"+html)		
+    logga("HTML:\n%s", html)
     urlSteam = re.findall(find, html)[0]
     logga("urlSteam:\n"+urlSteam)	
     return urlSteam
@@ -600,7 +1042,7 @@ def callReolver(metodo, parametro):
             msgBox("Per visualizzare questo link, e' necessaria la versione [B]21.5.4[/B], o superiore, di [B]inputstream.adaptive[/B] ["+str(major)+"."+str(medium)+"."+str(minor)+"]")
             return
 
-        pwd = xbmcaddon.Addon(id=addon_id).getSetting("password")
+        pwd = settings.get("password")
         urlSup="https://test34344.herokuapp.com/testAnonym.php?token="+pwd+"&dns1=AMSTAFF&dns2="+version
         #makeRequestNoUa(urlSup)
         fanart="https://www.stadiotardini.it/wp-content/uploads/2016/12/mandrakata.jpg"
@@ -638,7 +1080,7 @@ def callReolver(metodo, parametro):
             msgBox("Per visualizzare questo link, e' necessaria la versione [B]21.5.4[/B], o superiore, di [B]inputstream.adaptive[/B] ["+str(major)+"."+str(medium)+"."+str(minor)+"]")
             return
 
-        pwd = xbmcaddon.Addon(id=addon_id).getSetting("password")
+        pwd = settings.get("password")
         urlSup="https://test34344.herokuapp.com/testAnonym.php?token="+pwd+"&dns1=AMSTAFF&dns2="+version
         #makeRequestNoUa(urlSup)
         fanart="https://www.stadiotardini.it/wp-content/uploads/2016/12/mandrakata.jpg"
@@ -750,9 +1192,12 @@ def callReolver(metodo, parametro):
         if retVal == None:
             return
         xbmcplugin.setContent(_handle, 'movies')
+        if isinstance(retVal, myResolver.Listing):
+            return jsonToItems(retVal.toDict())
         if isinstance(retVal, list):
             numLink=1
             oldLink="";
+            directory = Directory(_handle)
             for linkTmp in retVal:
                 newList=list(linkTmp)
                 newLink=newList[0]
@@ -768,6 +1213,7 @@ def callReolver(metodo, parametro):
                 if len(newList)>4:
                     tipo=newList[4]
                     if tipo == "json":
+                        directory.flush()
                         return jsonToItems(newLink)
 
                 logga("Stream_Url ==> " + newLink)
@@ -775,15 +1221,16 @@ def callReolver(metodo, parametro):
                 newTit="[COLOR lime]PLAY LINK "+str(numLink)+" ("+newLink[0:4]+")[/COLOR]"
                 if newP != "":
                     newTit=newP
-                list_item = xbmcgui.ListItem(label=newTit)
-                list_item.setInfo('video', {'title': newTit,'plot': info,'mediatype': 'movie','credits': 'ElSupremo'})
-                list_item.setArt({'thumb': thumb, 'icon': thumb, 'poster': thumb, 'landscape': fanart, 'fanart': fanart})
-                list_item.setProperty('IsPlayable', 'true')
-                url = get_url(action='play', url=newLink)
                 if oldLink!=newLink:
                     oldLink=newLink
-                    xbmcplugin.addDirectoryItem(_handle, url, list_item, False)
+                    list_item = xbmcgui.ListItem(label=newTit, offscreen=True)
+                    list_item.setInfo('video', {'title': newTit,'plot': info,'mediatype': 'movie','credits': 'ElSupremo'})
+                    list_item.setArt(artDict(thumb, fanart))
+                    list_item.setProperty('IsPlayable', 'true')
+                    url = get_url(action='play', url=newLink)
+                    directory.add(url, list_item, False)
                     numLink += 1
+            directory.flush()
         else:
             logga("StreamUrl ==> " + retVal)
             newTit="[COLOR lime]PLAY LINK ("+retVal[0:4]+")[/COLOR]"
@@ -828,18 +1275,59 @@ def getPvr():
     myPvr = xbmcaddon.Addon(id='pvr.iptvsimple')
     return myPvr
 
+def exportPvr(urlM3u):
+    """Local m3u and xmltv for pvr.iptvsimple: (m3u path, xmltv path, changed) or None"""
+    try:
+        opened = mandraCore.getPlaylistCache().open(urlM3u, {"User-Agent" : getUa()}, m3uDocument)
+        if opened is None:
+            return None
+        meta, doc = opened
+        if doc is None:
+            store = mandraCore.getChannelStore()
+            channels = [store.get(meta["key"], channel["name"]) or channel for channel in meta["channels"]]
+        else:
+            channels = doc["channels"]
+        dead = set()
+        if probeMode() != "off":
+            links = [item["link"] for channel in channels for item in channel.get("items", []) if "link" in item]
+            dead = set(link for link, alive in mandraCore.getLinkProber().state(links).items() if not alive)
+        epgBody = None
+        try:
+            response = mandraCore.fetchCached(mandraCore.PVR_EPG_URL, ttl=mandraCore.PVR_EPG_TTL)
+            if response.ok():
+                epgBody = response.body
+        except Exception as err:
+            logga("PVR EPG ERROR: %s", err)
+        return mandraCore.getPvrExport().export(channels, epgBody, dead)
+    except Exception as err:
+        logga("PVR EXPORT ERROR: %s", err)
+        writeFileLog("PVR "+urlM3u+"\n"+str(err), "a+")
+    return None
+
 def setPvr(urlM3u):
     try:
         pvrSimpleTv=getPvr()
+        exported = exportPvr(urlM3u)
+        if exported is not None:
+            m3uPath, xmlPath, changed = exported
+            wanted = {"m3uPathType": "0", "m3uPath": m3uPath, "epgPathType": "0", "epgPath": xmlPath}
+        else:
+            # no local copy: iptvsimple reads the remote list as before, and no
+            # longer the guide of an earlier local export
+            changed = True
+            wanted = {"m3uPathType": "1", "m3uUrl": urlM3u, "epgPathType": "1", "epgUrl": ""}
+        wanted = dict((key, value) for key, value in wanted.items() if pvrSimpleTv.getSetting(key) != value)
+        if not changed and not wanted:
+            # same channels and guide already loaded: no PVR restart
+            dialog = xbmcgui.Dialog()
+            return dialog.ok("Mandrakodi", "PVR gia' aggiornato.")
         
         if PY3:
             xbmc.executebuiltin('xbmc.StopPVRManager')
         else:
             xbmc.executeJSONRPC('{"jsonrpc": "2.0", "id":1, "method": "Addons.SetAddonEnabled", "params": { "addonid": "pvr.iptvsimple", "enabled": false }}')
-        if pvrSimpleTv.getSetting('m3uPathType') != '1': 
-            pvrSimpleTv.setSetting('m3uPathType', '1')
-        pvrSimpleTv.setSetting('epgUrl','')
-        pvrSimpleTv.setSetting('m3uUrl', urlM3u)
+        for key, value in wanted.items():
+            pvrSimpleTv.setSetting(key, value)
         xbmc.sleep(500)
         if PY3:
             xbmc.executebuiltin('xbmc.StartPVRManager')
@@ -859,9 +1347,9 @@ def setPvr(urlM3u):
 def reloadDefault():
     home = ''
     if PY3:
-        home = xbmcvfs.translatePath(xbmcaddon.Addon(id=addon_id).getAddonInfo('path'))
+        home = xbmcvfs.translatePath(settings.addonInfo('path'))
     else:
-        home = xbmc.translatePath(xbmcaddon.Addon(id=addon_id).getAddonInfo('path').decode('utf-8'))
+        home = xbmc.translatePath(settings.addonInfo('path').decode('utf-8'))
     defualt_file = os.path.join(home, 'default.py')
     timeUnix=os.path.getmtime(defualt_file)
     logga('TIME FILE '+str(timeUnix))
@@ -877,95 +1365,22 @@ def reloadDefault():
             f.close()
             logga("DEFAULT.PY UPDATE")
 
-def checkJsunpack():
-    home = ''
-    if PY3:
-        home = xbmcvfs.translatePath(xbmcaddon.Addon(id=addon_id).getAddonInfo('path'))
-    else:
-        home = xbmc.translatePath(xbmcaddon.Addon(id=addon_id).getAddonInfo('path').decode('utf-8'))
-    resolver_file = os.path.join(home, 'jsunpack.py')
-    if os.path.exists(resolver_file)==False:
-        remoteResolverUrl = "https://mandrakodi.github.io/jsunpack.py"
-        strSource = makeRequest(remoteResolverUrl)
-        if strSource is None or strSource == "":
-            logga('We failed to get source from '+remoteResolverUrl)
-            
-        else:
-            #if PY3:
-                #strSource = strSource.decode('utf-8')
-            saveFile(resolver_file, strSource)
+UPDATE_LABELS = {"launcher.py": "Launcher", "myResolver.py": "Resolver"}
+# swapped by default.py before the launcher is imported, never while this code runs
+CORE_MODULES = ("launcher.py", "mandraCore.py")
 
-def checkPortalPy():
-    home = ''
-    if PY3:
-        home = xbmcvfs.translatePath(xbmcaddon.Addon(id=addon_id).getAddonInfo('path'))
-    else:
-        home = xbmc.translatePath(xbmcaddon.Addon(id=addon_id).getAddonInfo('path').decode('utf-8'))
-    
-    resolver_file = os.path.join(home, 'portal_api.py')
-    remoteResolverUrl = "https://mandrakodi.github.io/portal_api.py"
-    strSource = makeRequest(remoteResolverUrl)
-    if strSource is None or strSource == "":
-        logga('We failed to get source from '+remoteResolverUrl)
-        
-    
-    if os.path.exists(resolver_file)==False:
-        logga("UPDATE PORTAL_API")
-        saveFile(resolver_file, strSource)
-    else:
-        resF = open(resolver_file)
-        resolver_content = resF.read()
-        resF.close()
-        try:
-            local_vers = re.findall("versione='(.*)'",resolver_content)[0]
-            logga('local_vers '+local_vers)
-            remote_vers = re.findall("versione='(.*)'",strSource)[0]
-            if local_vers != remote_vers:
-                logga("UPDATE PORTAL_API")
-                saveFile(resolver_file, strSource)
-        except Exception as err:
-            logga("NO VERSION - UPDATE PORTAL_API")
-            saveFile(resolver_file, strSource)
-
-       
-
-def checkResolver():
-    logga("START CHECK_RESOLVER")
-    home = ''
-    if PY3:
-        home = xbmcvfs.translatePath(xbmcaddon.Addon(id=addon_id).getAddonInfo('path'))
-    else:
-        home = xbmc.translatePath(xbmcaddon.Addon(id=addon_id).getAddonInfo('path').decode('utf-8'))
-    resolver_file = os.path.join(home, 'myResolver.py')
-    local_vers = '0.0.0'
-    if os.path.exists(resolver_file)==True:
-        resF = open(resolver_file)
-        resolver_content = resF.read()
-        resF.close()
-        try:
-            local_vers = re.findall("versione='(.*)'",resolver_content)[0]
-        except:
-            logga('ERRORE FIND LOCAL VERS')
-            pass
-        logga('Resolver_local_vers '+local_vers)
-        
-        remoteResolverUrl = "https://raw.githubusercontent.com/mandrakodi/mandrakodi.github.io/main/myResolver.py"
-        strSource = makeRequest(remoteResolverUrl)
-        if strSource is None or strSource == "":
-            logga('We failed to get source from '+remoteResolverUrl)
-            remote_vers = local_vers
-        else:
-            #if PY3:
-                #strSource = strSource.decode('utf-8')		
-            remote_vers = re.findall("versione='(.*)'",strSource)[0]
-        logga('remote_vers '+remote_vers)
-        if local_vers != remote_vers:
-            logga('TRY TO UPDATE VERSION')
-            f = open(resolver_file, "w")
-            f.write(strSource)
-            f.close()
-            msgBox("Codice Resolver aggiornato alla versione: "+remote_vers)
-            logga('VERSION UPDATE')
+def checkModules():
+    logga("START CHECK_MODULES")
+    home = xbmcvfs.translatePath(settings.addonInfo('path'))
+    updater = mandraCore.getUpdater(home)
+    try:
+        installed = updater.update([name for name in sorted(updater.modules()) if name not in CORE_MODULES])
+    except Exception as err:
+        logga('We failed to get the update manifest: {0}'.format(err))
+        return
+    for name in installed:
+        if name in UPDATE_LABELS:
+            msgBox("Codice "+UPDATE_LABELS[name]+" aggiornato alla versione: "+updater.version(name))
 
 def getIPAddress():
     import socket
@@ -975,7 +1390,7 @@ def getIPAddress():
         return "0.0.0.0"
 
 def checkDns():
-    import time, requests
+    import time
     ip = getIPAddress()
     dns1 = "0.0.0.0"
     dns2 = "0.0.0.0"
@@ -990,10 +1405,9 @@ def checkDns():
     
     responseCode=404
     try:
-        currSess = requests.Session()
         head={'user-agent':'iPad','Content-Type':'application/x-www-form-urlencoded','Referer':'https://daddyhd.com/'}
-        page_data1 = currSess.get("https://daddyhd.com/embed/stream-860.php",headers=head)
-        responseCode=page_data1.status_code
+        page_data1 = mandraCore.getClient().get("https://daddyhd.com/embed/stream-860.php", headers=head)
+        responseCode=page_data1.status
         dns1 = xbmc.getInfoLabel('Network.DNS1Address')
         dns2 = xbmc.getInfoLabel('Network.DNS2Address')
         gate = xbmc.getInfoLabel('Network.GatewayAddress')
@@ -1032,26 +1446,73 @@ def checkPluginInstalled(pluginId):
     return have_mandra_plugin
     
 
+LOG_TAIL_MAX = 1024 * 1024
+LOG_TAIL_CHUNK = 64 * 1024
+
+def getKodiSession():
+    # home window properties live as long as the Kodi session
+    window = xbmcgui.Window(10000)
+    session = window.getProperty("mandraSession")
+    if session == "":
+        session = str(int(time.time()))+"-"+id_generator()
+        window.setProperty("mandraSession", session)
+    return session
+
+def sessionMarkerFile():
+    return os.path.join(mandraCore.getProfileDir(), "session.json")
+
+def setSessionChecked():
+    try:
+        mandraCore.writeAtomic(sessionMarkerFile(), json.dumps({"dnsChecked": getKodiSession()}))
+    except:
+        logging.warning("MANDRA_LOG: CANNOT SAVE SESSION MARKER")
+
+def isSessionChecked():
+    try:
+        f = open(sessionMarkerFile(), encoding="utf-8")
+        marker = json.load(f)
+        f.close()
+        return marker.get("dnsChecked") == getKodiSession()
+    except:
+        return False
+
+def tailContains(fileName, needle, maxBytes=LOG_TAIL_MAX):
+    # scan backwards in chunks, never more than maxBytes from the end
+    needle = needle.encode("utf-8")
+    f = open(fileName, "rb")
+    try:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        stop = max(0, pos - maxBytes)
+        carry = b""
+        while pos > stop:
+            size = min(LOG_TAIL_CHUNK, pos - stop)
+            pos -= size
+            f.seek(pos)
+            block = f.read(size) + carry
+            if needle in block:
+                return True
+            carry = block[:len(needle)-1]
+    finally:
+        f.close()
+    return False
+
 def checkMsgOnLog():
-    LOGPATH = ''
-    if PY3:
-        LOGPATH = xbmcvfs.translatePath('special://logpath')
-    else:
-        LOGPATH = xbmc.translatePath('special://logpath')
-    
+    if isSessionChecked():
+        return False
+    LOGPATH = xbmcvfs.translatePath('special://logpath')
     log_file = os.path.join(LOGPATH, 'kodi.log')
     if os.path.exists(log_file)==True:
         try:
-            logF = open(log_file)
-            log_content = logF.read()
-            logF.close()
-            log_msg = re.findall("MANDRA_DNS",log_content)
-            if (log_msg):
+            # session checked by a launcher without the marker
+            if tailContains(log_file, "MANDRA_DNS"):
+                setSessionChecked()
                 return False
-            else:
-                return True
         except:
-            return True
+            pass
+        return True
+    # no kodi.log: the checks stay off, as they always did
+    return None
 
 def uploadLog():
     addon_log_uploader = None
@@ -1077,85 +1538,25 @@ def uploadLog():
     return True
 
 def updateCode(parIn):
-    home = ''
-    if PY3:
-        home = xbmcvfs.translatePath(xbmcaddon.Addon(id=addon_id).getAddonInfo('path'))
-    else:
-        home = xbmc.translatePath(xbmcaddon.Addon(id=addon_id).getAddonInfo('path').decode('utf-8'))
-    launcher_file = os.path.join(home, 'launcher.py')
-    if os.path.exists(launcher_file)==True:
-        local_vers = "1.0.0"
-        try:
-            resF = open(launcher_file)
-            resolver_content = resF.read()
-            resF.close()
-            local_vers = re.findall("versione='(.*)'",resolver_content)[0]
-        except:
-            msgBox("Non e' stato possibile leggere il file locale:[CR]"+launcher_file)
-        
-        logga('local_vers '+local_vers)
-
-
-        remoteLauncherUrl = "https://raw.githubusercontent.com/mandrakodi/mandrakodi.github.io/main/launcher.py"
-        strSource = makeRequest(remoteLauncherUrl)
-        if strSource is None or strSource == "":
-            logga('We failed to get source from '+remoteLauncherUrl)
-            msgBox("Non e' stato possibile contattare la sorgente.[CR]L'addon potrebbe non essere aggiornato.")
-            remote_vers = local_vers
-        else:
-            remote_vers = re.findall("versione='(.*)'",strSource)[0]
-        logga('remote_vers '+remote_vers)
-        if local_vers != remote_vers:
-            logga('TRY TO UPDATE VERSION')
-            try:
-                f = open(launcher_file, "w")
-                f.write(strSource)
-                f.close()
-                logga('VERSION UPDATE')
-                msgBox("Codice Launcher aggiornato alla versione: "+remote_vers)
-            except:
-                msgBox("Non e' stato possibile aggiornare il file locale:[CR]"+launcher_file)
-        else:
-            msgBox("Il codice Launcher e' gia' aggiornato all'ultima versione: "+remote_vers)
-    else:
-        msgBox("Il file launcher.py non e' stato trovato")
-
-    resolve_file = os.path.join(home, 'myResolver.py')
-    if os.path.exists(resolve_file)==True:
-        local_vers = "1.0.0"
-        try:
-            resF = open(resolve_file)
-            resolver_content = resF.read()
-            resF.close()
-            local_vers = re.findall("versione='(.*)'",resolver_content)[0]
-        except:
-            msgBox("Non e' stato possibile leggere il file locale:[CR]"+resolve_file)
-        logga('local_vers '+local_vers)
-
-
-        remoteLauncherUrl = "https://raw.githubusercontent.com/mandrakodi/mandrakodi.github.io/main/myResolver.py"
-        strSource = makeRequest(remoteLauncherUrl)
-        if strSource is None or strSource == "":
-            logga('We failed to get source from '+remoteLauncherUrl)
-            msgBox("Non e' stato possibile contattare la sorgente.[CR]L'addon potrebbe non essere aggiornato.")
-            remote_vers = local_vers
-        else:
-            remote_vers = re.findall("versione='(.*)'",strSource)[0]
-        logga('remote_vers '+remote_vers)
-        if local_vers != remote_vers:
-            logga('TRY TO UPDATE VERSION')
-            try:
-                f = open(resolve_file, "w")
-                f.write(strSource)
-                f.close()
-                logga('VERSION UPDATE')
-                msgBox("Codice Resolver aggiornato alla versione: "+remote_vers)
-            except:
-                msgBox("Non e' stato possibile aggiornare il file locale:[CR]"+resolve_file)
+    home = xbmcvfs.translatePath(settings.addonInfo('path'))
+    updater = mandraCore.getUpdater(home)
+    try:
+        outdated = updater.outdated()
+    except Exception as err:
+        logga('We failed to get the update manifest: {0}'.format(err))
+        msgBox("Non e' stato possibile contattare la sorgente.[CR]L'addon potrebbe non essere aggiornato.")
+        return
+    installed = updater.update(outdated)
+    for name in ("launcher.py", "myResolver.py"):
+        label = UPDATE_LABELS[name]
+        remote_vers = updater.version(name)
+        logga('remote_vers '+name+' '+remote_vers)
+        if name in installed:
+            msgBox("Codice "+label+" aggiornato alla versione: "+remote_vers)
+        elif name in outdated:
+            msgBox("Non e' stato possibile aggiornare il file locale:[CR]"+os.path.join(home, name))
         else:
-            msgBox("Il codice Resolver e' gia' aggiornato all'ultima versione: "+remote_vers)
-    else:
-        msgBox("Il file myResolver.py non e' stato trovato")
+            msgBox("Il codice "+label+" e' gia' aggiornato all'ultima versione: "+remote_vers)
 
 def copyPlayerCoreFactory(parIn):
     XMLPATH = ''
@@ -1218,140 +1619,111 @@ def preg_match(data, patron, index=0):
     except:
         return ""
 
-def m3u2json(src):
-    import re
-    m3uSource = makeRequest(src)
-    if m3uSource is None or m3uSource == "":
-        logga('We failed to get source from '+src)
-        msgBox("Errore download m3u")
-        return
+M3U_THUMB = "https://www.dropbox.com/s/wd2d403175rbvs7/tv_ch.png?dl=1"
+M3U_GROUP_THUMB = "https://www.dropbox.com/s/3j4wf8b67xt8gry/fold_tube.png?dl=1"
+M3U_FANART = "https://www.stadiotardini.it/wp-content/uploads/2016/12/mandrakata.jpg"
+# EXTINF attributes kept in the item for the guide and the catchup
+M3U_TVG_KEYS = ("tvg-id", "tvg-name", "tvg-chno", "tvg-shift", "catchup", "catchup-source", "catchup-days")
+
+def m3uLink(link, headers):
+    # headers in the Kodi form url|Header=value&..., after the ones already in the url
+    if not headers:
+        return link
+    present = link.split("|", 1)[1] if "|" in link else ""
+    extra = [key+"="+quote(value, safe="") for key, value in headers.items() if key+"=" not in present]
+    if not extra:
+        return link
+    return link + ("&" if present else "|") + "&".join(extra)
+
+def m3uItem(entry):
+    item = {
+        "title": entry["title"].replace("'", " "),
+        "thumbnail": entry["logo"] or M3U_THUMB,
+        "fanart": M3U_FANART,
+        "info": "NO INFO"
+    }
+    link = m3uLink(entry["link"], entry["headers"])
+    if link.endswith(".m3u"):
+        item["m3u"] = link
     else:
-        #if PY3:
-            #m3uSource = m3uSource.decode('utf-8')		
-        logga('OK source')
-        
-    regex = r'#EXTINF:(.*?),(.*?)$\s(http.*?//.*?)$'	
-    matches = re.compile(regex, re.MULTILINE).findall(m3uSource)
-    
-    
+        item["link"] = link
+    props = entry["props"]
+    if props:
+        if entry["headers"] and props.get("inputstream", props.get("inputstreamaddon")) == "inputstream.adaptive":
+            props.setdefault("inputstream.adaptive.stream_headers", link.split("|", 1)[1])
+        item["props"] = props
+    attrs = entry["attrs"]
+    tvg = dict((key, attrs[key]) for key in M3U_TVG_KEYS if attrs.get(key))
+    if tvg:
+        item["tvg"] = tvg
+    return item
+
+def m3uSortKey(item):
+    return (item["title"], item.get("link", item.get("m3u")), item["thumbnail"])
+
+def m3uChannels(groups):
+    # same layout as a channels list: one folder per group-title, items sorted by title
+    channels = []
+    for group in sorted(groups):
+        items = groups[group]
+        items.sort(key=m3uSortKey)
+        channels.append({
+            "name": "[COLOR lime]"+group+"[/COLOR]",
+            "thumbnail": M3U_GROUP_THUMB,
+            "fanart": M3U_FANART,
+            "info": "[COLOR lime]Category: "+group+"[/COLOR]",
+            "SetViewMode": "503",
+            "items": items
+        })
+    return {"SetViewMode": "503", "channels": channels}
+
+def m3uDocument(m3uSource):
+    groups = {}
     numIt=0
-    arrTmp = [""]
-    strLog="";
-    try:
-        okGroup=False
-        for match in matches:
-            if numIt>24999:
-                break
-            strLog=json.dumps(match)
-            tt = match[1]
-            title = tt.encode('utf-8', 'ignore').decode('utf-8').replace("'", " ").replace("\r", "").replace("\n", "")
-            #title = str(match[1]).strip()
-            link = match[2].replace("\r", "").replace("\n", "")
-            img = ""
-            group = ""
-            infos = match[0]
-            regex2= r'.*?tvg-logo="(.*?)"'
-            urlImg=preg_match(infos, regex2)
-            if (urlImg == ""):
-                img = "https://www.dropbox.com/s/wd2d403175rbvs7/tv_ch.png?dl=1"
-            else:
-                img = urlImg
-           
-            regex3 = r'.*?group-title="(.*?)"'
-            group = preg_match(infos, regex3)
-            if (group == ""):
-                group = "VARIOUS"
-            try:
-                row = group+"@#@"+title+"@#@"+link+"@#@"+img
-                okGroup=True
-            except:
-                row = group.encode('utf-8', 'ignore').decode('utf-8')+"@#@"+title+"@#@"+link+"@#@"+img
-                writeFileLog("\n"+row, "a+")
-            #logging.warning(row)
-            arrTmp.append(row)
+    with mandraCore.span("m3u2json.parse", size=len(m3uSource)) as sp:
+        for entry in mandraCore.parseM3u(m3uSource):
+            groups.setdefault(entry["group"] or "VARIOUS", []).append(m3uItem(entry))
             numIt += 1
-    except:
-        import traceback
-        msgBox("Errore nella lettura del file m3u")
-        writeFileLog(str(numIt)+"\n"+strLog, "a+")
-        traceback.print_exc()
-        return 
+        sp.set(entries=numIt, groups=len(groups))
     logga("FOUND "+str(numIt)+" ROWS")
+    return m3uChannels(groups)
 
-    if (okGroup):
-        arrTmp.sort()
-        
+@mandraCore.traced("m3u2json")
+def m3u2json(src):
     try:
-        strJson = '{"SetViewMode": "503","channels": ['
-        oldGroup = ""
-        numGoup = 0
-        numIt=0
-        numLoop=0
-        for rowTmp in arrTmp:
-            if (rowTmp != ""):
-                strLog=rowTmp
-                arrRow = rowTmp.split("@#@")
-                group = arrRow[0]
-                if (oldGroup != group):
-                    oldGroup = group
-                    if (numGoup > 0):
-                        strJson += ']},'
-                    strJson += '{'
-                    strJson += '"name": "[COLOR lime]'+group+'[/COLOR]",'
-                    strJson += '"thumbnail": "https://www.dropbox.com/s/3j4wf8b67xt8gry/fold_tube.png?dl=1",'
-                    strJson += '"fanart": "https://www.stadiotardini.it/wp-content/uploads/2016/12/mandrakata.jpg",'
-                    strJson += '"info": "[COLOR lime]Category: '+group+'[/COLOR]",'
-                    strJson += '"SetViewMode": "503","items":['
-                    numGoup += 1
-                    numIt=0
-                
-                strJsonNew = '{'
-                strJsonNew += '"title":"'+arrRow[1]+'",'
-                strJsonNew += '"thumbnail":"'+arrRow[3]+'",'
-                strJsonNew += '"fanart":"https://www.stadiotardini.it/wp-content/uploads/2016/12/mandrakata.jpg",'
-                link = arrRow[2]
-                if link.endswith(".m3u"):
-                    strJsonNew += '"m3u":"'+link+'",'
-                else:
-                    strJsonNew += '"link":"'+link+'",'
-                strJsonNew += '"info":"NO INFO"'
-                strJsonNew += '}'
-
-                try:
-                    json.loads(strJsonNew)
-                    if (numIt > 0):
-                        strJson += ','
-                    strJson +=  strJsonNew
-                    numIt += 1
-                except:
-                    logga("BAD ITEMS: "+strJsonNew)
-                    pass
-                
-
-        strJson += ']}]}'
-
-        logging.warning("END M3U2JSON. CALL jsonToItems")
-        jsonToItems(strJson)
-    except:
+        # parsed once per version of the playlist, the groups open from the channel store
+        opened = mandraCore.getPlaylistCache().open(src, {"User-Agent" : getUa()}, m3uDocument)
+    except Exception as err:
         import traceback
-        msgBox("Errore nella creazione del json")
-        writeFileLog(strLog, "w+")
+        msgBox("Errore nella lettura del file m3u")
+        writeFileLog("M3U "+src+"\n"+str(err), "a+")
         traceback.print_exc()
         return
+    if opened is None:
+        logga('We failed to get source from '+src)
+        msgBox("Errore download m3u")
+        return
+    meta, doc = opened
+    if doc is None:
+        logga("M3U FROM CACHE: "+src)
+        doc = {"SetViewMode": "503", "channels": meta["channels"]}
+    doc["listKey"] = meta["key"]
 
+    logging.warning("END M3U2JSON. CALL jsonToItems")
+    jsonToItems(doc)
 
 def decodeSkinViewMode (mySkin='', viewMode=''):
     retMode=viewMode
     if (retMode == "500" or retMode == "Wall"):
-        retMode = str(xbmcaddon.Addon(id=addon_id).getSetting("SkinWall"))
+        retMode = str(settings.get("SkinWall"))
     if (retMode == "50" or retMode == "List1"):
-        retMode = str(xbmcaddon.Addon(id=addon_id).getSetting("SkinList1"))
+        retMode = str(settings.get("SkinList1"))
     if (retMode == "51" or retMode == "List2"):
-        retMode = str(xbmcaddon.Addon(id=addon_id).getSetting("SkinList2"))
+        retMode = str(settings.get("SkinList2"))
     if (retMode == "503" or retMode == "Info1"):
-        retMode = str(xbmcaddon.Addon(id=addon_id).getSetting("SkinInfo1"))
+        retMode = str(settings.get("SkinInfo1"))
     if (retMode == "504" or retMode == "Info2"):
-        retMode = str(xbmcaddon.Addon(id=addon_id).getSetting("SkinInfo2"))
+        retMode = str(settings.get("SkinInfo2"))
     logga ("SKIN: "+mySkin+" - VIEW: "+str(retMode))
 
     return retMode
@@ -1371,11 +1743,11 @@ def personalList(listtType=''):
     urlToCall=""
     fileName=""
     if 	(listtType=="MAC"):
-        fileName = xbmcaddon.Addon(id=addon_id).getSetting("macFile")
+        fileName = settings.get("macFile")
     if 	(listtType=="IPTV"):
-        fileName = xbmcaddon.Addon(id=addon_id).getSetting("iptvFile")
+        fileName = settings.get("iptvFile")
     if 	(listtType=="M3U"):
-        fileName = xbmcaddon.Addon(id=addon_id).getSetting("m3uFile")
+        fileName = settings.get("m3uFile")
 
     if (fileName=="" or fileName=="blank"):
         msgBox("E' necessario specificare un file nelle impostazioni")
@@ -1394,15 +1766,15 @@ def personalList(listtType=''):
 
 def checkSkin():
     kodiSkin=xbmc.getSkinDir()
-    wall=xbmcaddon.Addon(id=addon_id).getSetting("SkinWall")
+    wall=settings.get("SkinWall")
     if str(kodiSkin).endswith("estuary"):
         logga ("SKIN ESTUARY")
         if (wall!="55"):
-            xbmcaddon.Addon(id=addon_id).setSetting("SkinWall", "55")    
-            xbmcaddon.Addon(id=addon_id).setSetting("SkinList1", "55")    
-            xbmcaddon.Addon(id=addon_id).setSetting("SkinList2", "55")    
-            xbmcaddon.Addon(id=addon_id).setSetting("SkinInfo1", "55")    
-            xbmcaddon.Addon(id=addon_id).setSetting("SkinInfo2", "55")    
+            settings.set("SkinWall", "55")    
+            settings.set("SkinList1", "55")    
+            settings.set("SkinList2", "55")    
+            settings.set("SkinInfo1", "55")    
+            settings.set("SkinInfo2", "55")    
     if str(kodiSkin).endswith("confluence"):
         logga ("SKIN CONFLUENCE")
         if (wall!="500"):
@@ -1410,18 +1782,102 @@ def checkSkin():
             mess="Rilevata Skin Confluence. Vuoi impostare la visualizzazione per questa skin?"
             resp= dialog.yesno("MandraKodi", mess)
             if (resp):
-                xbmcaddon.Addon(id=addon_id).setSetting("SkinWall", "500")    
-                xbmcaddon.Addon(id=addon_id).setSetting("SkinList1", "50")    
-                xbmcaddon.Addon(id=addon_id).setSetting("SkinList2", "51")    
-                xbmcaddon.Addon(id=addon_id).setSetting("SkinInfo1", "503")    
-                xbmcaddon.Addon(id=addon_id).setSetting("SkinInfo2", "504")
+                settings.set("SkinWall", "500")    
+                settings.set("SkinList1", "50")    
+                settings.set("SkinList2", "51")    
+                settings.set("SkinInfo1", "503")    
+                settings.set("SkinInfo2", "504")
                 msgBox("Visualizzazione impostata")    
 
 
 def msgBox(mess):
+    pendingMsg = getattr(startupState, "msgs", None)
+    if pendingMsg is not None:
+        # startup check running in background: show it after the menu
+        pendingMsg.append(mess)
+        return
     dialog = xbmcgui.Dialog()
     dialog.ok("MandraKodi", mess)
 
+STARTUP_WAIT = 15
+
+startupState = threading.local()
+startupLock = threading.Lock()
+startupMsgs = []
+startupWorkers = []
+startupDone = False
+
+def startupWorker(check):
+    startupState.msgs = []
+    try:
+        check()
+    except Exception as err:
+        logging.warning("MANDRA_LOG: STARTUP CHECK "+check.__name__+" FAILED: {0}".format(err))
+    with startupLock:
+        if startupDone:
+            # too late for this launch, the message is shown on the next one
+            savePendingMsg(startupState.msgs)
+        else:
+            startupMsgs.extend(startupState.msgs)
+    startupState.msgs = None
+
+def runStartupChecks(checks):
+    # the checks run while the menu is built, waitStartupChecks joins them
+    for check in checks:
+        worker = threading.Thread(target=startupWorker, args=(check,), name="mandraStartup-"+check.__name__)
+        worker.daemon = True
+        worker.start()
+        startupWorkers.append(worker)
+
+def showStartupMsgs():
+    # messages of the checks already done, never waiting for the others
+    with startupLock:
+        msgs = list(dict.fromkeys(loadPendingMsg() + startupMsgs))
+        del startupMsgs[:]
+    if len(msgs) > 0:
+        msgBox("[CR]".join(msgs))
+
+def waitStartupChecks():
+    # the menu is already on screen: the checks get up to STARTUP_WAIT to finish
+    global startupDone
+    if not startupWorkers:
+        return
+    deadline = time.time() + STARTUP_WAIT
+    for worker in startupWorkers:
+        worker.join(max(0, deadline - time.time()))
+    finished = not any(worker.is_alive() for worker in startupWorkers)
+    with startupLock:
+        startupDone = True
+    showStartupMsgs()
+    if finished:
+        # only checks run to the end mark the session, the others run again
+        setSessionChecked()
+
+def pendingMsgFile():
+    return os.path.join(mandraCore.getProfileDir(), "startup_msg.json")
+
+def savePendingMsg(msgs):
+    if len(msgs) == 0:
+        return
+    try:
+        oldMsgs = loadPendingMsg()
+        mandraCore.writeAtomic(pendingMsgFile(), json.dumps(oldMsgs + msgs))
+    except:
+        logging.warning("MANDRA_LOG: CANNOT SAVE STARTUP MSG")
+
+def loadPendingMsg():
+    msgFile = pendingMsgFile()
+    if not os.path.exists(msgFile):
+        return []
+    try:
+        f = open(msgFile, encoding="utf-8")
+        msgs = json.load(f)
+        f.close()
+        os.remove(msgFile)
+        return msgs
+    except:
+        return []
+
 def remoteLog(msgToLog):
     if PY3:
         import urllib.parse as myParse
@@ -1430,7 +1886,7 @@ def remoteLog(msgToLog):
     
     
     baseLog = "https://test34344.herokuapp.com/filter.php?numTest=JOB999"
-    urlLog = baseLog + "&msgLog=" + myParse.quote(ua+"@@"+msgToLog)
+    urlLog = baseLog + "&msgLog=" + myParse.quote(getUa()+"@@"+msgToLog)
     strSource = makeRequest(urlLog)
     if strSource is None or strSource == "":
         logga('MANDRA_LOG: NO REMOTE LOG')
@@ -1442,13 +1898,13 @@ def remoteLog(msgToLog):
 def writeFileLog(strIn, modo):
     home = ''
     if PY3:
-        home = xbmcvfs.translatePath(xbmcaddon.Addon(id=addon_id).getAddonInfo('path'))
+        home = xbmcvfs.translatePath(settings.addonInfo('path'))
         log_file = os.path.join(home, 'mandrakodi2.log')
         f = open(log_file, modo, encoding="utf-8")
         f.write(strIn)
         f.close()
     else:
-        home = xbmc.translatePath(xbmcaddon.Addon(id=addon_id).getAddonInfo('path').decode('utf-8'))
+        home = xbmc.translatePath(settings.addonInfo('path').decode('utf-8'))
         log_file = os.path.join(home, 'mandrakodi2.log')
         f = open(log_file, modo)
         f.write(strIn)
@@ -1479,13 +1935,11 @@ def run():
         if not sys.argv[2]:
             logga("=== ADDON START ===")
             if (checkMsgOnLog()):
-                checkResolver()
-                checkJsunpack()
-                checkPortalPy()
-                checkDns()
+                runStartupChecks([checkModules, checkDns])
                 #checkMandraScript()
             checkSkin()
             getSource()
+            showStartupMsgs()
         else:
             params = parameters_string_to_dict(sys.argv[2])
             action =  params['action']
@@ -1493,6 +1947,8 @@ def run():
             
             if action == 'getExtData':
                 getExternalJson(url)
+            elif action == 'getExtPage':
+                getExternalJson(url, int(params.get('offset', '0')), params.get('rev', ''), int(params.get('page', '1')))
             elif action == 'getExtData2':
                 clipB=""
                 keyboard = xbmc.Keyboard(clipB,'Inserisci Valore')
@@ -1509,7 +1965,8 @@ def run():
                         #strUrl = url + userInput.replace(" ", "+")
                         strUrl = url + myParse.quote(userInput)
                         logging.warning("GET JSON FROM: "+strUrl)
-                        getExternalJson(strUrl)
+                        if not (searchEnabled() and localSearch(keyboard.getText(), strUrl)):
+                            getExternalJson(strUrl)
                     else:
                         logga("NO INPUT")
                         mesNoInput='{"SetViewMode":"500","items":[{"title":"[COLOR red]NO INPUT[/COLOR]","link":"ignore","thumbnail":"https://e7.pngegg.com/pngimages/56/148/png-clipart-computer-icons-wrong-miscellaneous-blue-thumbnail.png","fanart":"https://www.stadiotardini.it/wp-content/uploads/2016/12/mandrakata.jpg","info":"NO INPUT"}]}'
@@ -1524,7 +1981,7 @@ def run():
                 runApk(apkN, url)
             elif action == 'getChannel':
                 logga("OPEN CHANNEL: "+url)
-                channelToItems(url, _handle)
+                channelToItems(url, _handle, params.get('list', ''))
             elif action == 'personal':
                 logga("OPEN PERSONAL: "+url)
                 personalList(url)
@@ -1540,6 +1997,7 @@ def run():
             elif action == 'openSettings':
                 try:
                     xbmcaddon.Addon().openSettings()
+                    settings.reload()
                     xbmcgui.Dialog().ok('[B][COLOR yellow]AVVISO[/COLOR][/B]','[COLOR lime]CHIUDI KODI E APRI DI NUOVO PER AGGIORNARE IMPOSTAZIONI[/COLOR]')
                     xbmc.executebuiltin("XBMC.Container.Refresh()")
                 except:
@@ -1572,7 +2030,7 @@ def run():
                     if (resp==0):
                         baseAce="http://127.0.0.1:6878"
                         try:
-                            setAce=xbmcaddon.Addon(id=addon_id).getSetting("urlAppo3")
+                            setAce=settings.get("urlAppo3")
                             if (setAce[0:4]=="http"):
                                 baseAce=setAce
                         except:
@@ -1592,7 +2050,7 @@ def run():
                         url="plugin://script.module.horus?action=play&title=by%20MandraKodi&id="+uArr[-1]
                     elif (resp==-1):
                         url=""
-                play_video(url)
+                play_video(url, params.get('props'))
             elif action == 'm3u':
                 m3u2json(url)
             elif action == 'pvr':
@@ -1617,6 +2075,8 @@ def run():
         errToLog = action + "@@" + url
         remoteLog(errToLog)
         traceback.print_exc()
+        settings.flush()
+        mandraCore.flushTrace(errToLog)
         raise err
 
     if not viewmode==None and autoView=="1":
@@ -1628,8 +2088,13 @@ def run():
         time.sleep(0.5)
         logga("setting view mode again to "+kodiView)
         xbmc.executebuiltin("Container.SetViewMode("+kodiView+")")
-        xbmcaddon.Addon(id=addon_id).setSetting("urlAppo1", kodiView)
+        settings.set("urlAppo1", kodiView)
         logga("Last ViewMode Saved: "+kodiView)
-    if debug == "on":
-        logging.warning("MANDRA_LOG: \n"+testoLog)
+    logger.dump()
+    settings.flush()
+    waitStartupChecks()
+    waitArtPrefetch()
+    waitLinkProbe()
+    mandraCore.closeClient()
+    mandraCore.flushTrace(action + "@@" + url)
         
@@ -0,0 +1,1845 @@
+versione='1.1.7'
+# Module: mandraCore
+# Author: ElSupremo
+# Created on: 17.10.2026
+# Last update: 17.10.2026
+# License: GPL v.3 https://www.gnu.org/copyleft/gpl.html
+
+import os
+import re
+import json
+import time
+import hashlib
+import logging
+import zlib
+import gzip
+import threading
+import marshal
+import sqlite3
+import unicodedata
+import collections
+import http.client
+import ssl
+import xbmcaddon
+import xbmcvfs
+
+from urllib.parse import urlsplit, urljoin, unquote
+
+addon_id = 'plugin.video.mandrakodi'
+
+CONNECT_TIMEOUT = 10
+READ_TIMEOUT = 45
+MAX_REDIRECT = 5
+MAX_IDLE_PER_HOST = 4
+CACHE_MAX_ENTRIES = 300
+GROUPS_MIN_SIZE = 512 * 1024
+LOG_RING_SIZE = 500
+LOG_BODY_MAX = 2048
+TRACE_MAX_EVENTS = 20000
+TRACE_KEEP = 20
+# environment variable turning the span recorder on (MANDRA_TRACE=on)
+TRACE_ENV = "MANDRA_TRACE"
+CHANNEL_LISTS_KEEP = 10
+SNAPSHOT_KEEP = 60
+SNAPSHOT_VERSION = 1
+SEARCH_MAX_SOURCES = 100
+SEARCH_LIMIT = 300
+ART_CACHE_BYTES = 64 * 1024 * 1024
+ART_MAX_FILE = 3 * 1024 * 1024
+ART_WORKERS = 4
+M3U_FRESH = 15 * 60
+PROBE_WORKERS = 8
+PROBE_TIMEOUT = 6
+PROBE_WAIT = 20
+PROBE_MAX = 200
+PROBE_HOST_INTERVAL = 0.25
+PROBE_MANIFEST_BYTES = 32 * 1024
+PROBE_TTL = 3 * 3600
+PROBE_KEEP = 7 * 86400
+M3U_KEEP = 50
+ART_UA = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+MANIFEST_URL = "https://raw.githubusercontent.com/mandrakodi/mandrakodi.github.io/main/manifest.json"
+PVR_EPG_URL = "https://raw.githubusercontent.com/mandrakodi/mandrakodi.github.io/main/cache/epg_raw.xml"
+PVR_EPG_TTL = 3 * 3600
+
+#=================================================
+# HTTP CLIENT
+#=================================================
+
+class HttpResponse:
+    def __init__(self, url, status, headers, body):
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.fromCache = False
+        # end of the freshness of a cached list (fetchCached)
+        self.expires = 0
+
+    def ok(self):
+        return 200 <= self.status < 300
+
+    def header(self, name, default=""):
+        return self.headers.get(name.lower(), default)
+
+    def text(self):
+        charset = "utf-8"
+        cType = self.header("content-type")
+        if "charset=" in cType:
+            charset = cType.split("charset=")[-1].split(";")[0].strip().strip('"') or "utf-8"
+        try:
+            return self.body.decode(charset)
+        except (LookupError, UnicodeDecodeError):
+            return self.body.decode("utf-8", "replace")
+
+
+class HttpClient:
+    """
+    Keep-alive client shared by every fetch of a plugin invocation.
+    Idle connections are pooled per (scheme, host, port), so a chain of
+    requests to the same host pays the TCP+TLS handshake only once.
+    """
+    def __init__(self, connectTimeout=CONNECT_TIMEOUT, readTimeout=READ_TIMEOUT, userAgent=None):
+        self.connectTimeout = connectTimeout
+        self.readTimeout = readTimeout
+        self.userAgent = userAgent
+        self.pool = {}
+        self.lock = threading.Lock()
+
+    def _newConn(self, key):
+        scheme, host, port = key
+        if scheme == "https":
+            conn = http.client.HTTPSConnection(host, port, timeout=self.connectTimeout)
+        else:
+            conn = http.client.HTTPConnection(host, port, timeout=self.connectTimeout)
+        with span("http.connect", host=host, scheme=scheme):
+            conn.connect()
+        conn.sock.settimeout(self.readTimeout)
+        return conn
+
+    def _acquire(self, key):
+        with self.lock:
+            idle = self.pool.get(key)
+            if idle:
+                return idle.pop(), True
+        return self._newConn(key), False
+
+    def _release(self, key, conn):
+        with self.lock:
+            idle = self.pool.setdefault(key, [])
+            if len(idle) < MAX_IDLE_PER_HOST:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def _exchange(self, conn, key, method, target, headers, data):
+        # http.wait is the time to first byte, http.body the download
+        with span("http.wait", host=key[1], path=target):
+            conn.request(method, target, body=data, headers=headers)
+            resp = conn.getresponse()
+        with span("http.body", host=key[1]) as sp:
+            body = resp.read()
+            sp.set(bytes=len(body))
+        return resp, body
+
+    def _send(self, key, method, target, headers, data):
+        conn, reused = self._acquire(key)
+        try:
+            resp, body = self._exchange(conn, key, method, target, headers, data)
+        except (http.client.RemoteDisconnected, http.client.BadStatusLine, ConnectionError, BrokenPipeError):
+            conn.close()
+            if not reused:
+                raise
+            # stale keep-alive socket closed by the server: retry once on a fresh one
+            conn = self._newConn(key)
+            try:
+                resp, body = self._exchange(conn, key, method, target, headers, data)
+            except:
+                conn.close()
+                raise
+        except:
+            conn.close()
+            raise
+        if resp.will_close:
+            conn.close()
+        else:
+            self._release(key, conn)
+        return resp, body
+
+    def request(self, url, headers=None, method="GET", data=None):
+        hdr = {"Accept-Encoding": "gzip, deflate", "Connection": "keep-alive"}
+        if self.userAgent is not None:
+            hdr["User-Agent"] = self.userAgent
+        if headers is not None:
+            hdr.update(headers)
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+
+        for _ in range(MAX_REDIRECT + 1):
+            parts = urlsplit(url)
+            scheme = parts.scheme.lower()
+            if scheme not in ("http", "https"):
+                raise ValueError("Unsupported scheme: "+url)
+            port = parts.port or (443 if scheme == "https" else 80)
+            key = (scheme, parts.hostname, port)
+            target = parts.path or "/"
+            if parts.query:
+                target += "?"+parts.query
+            resp, body = self._send(key, method, target, hdr, data)
+            respHeaders = dict((k.lower(), v) for k, v in resp.getheaders())
+            location = respHeaders.get("location")
+            if resp.status in (301, 302, 303, 307, 308) and location:
+                url = urljoin(url, location)
+                if resp.status == 303 or (resp.status in (301, 302) and method == "POST"):
+                    method = "GET"
+                    data = None
+                continue
+            encoding = respHeaders.get("content-encoding", "")
+            if encoding:
+                with span("http.decode", encoding=encoding, bytes=len(body)):
+                    body = decodeBody(body, encoding)
+            return HttpResponse(url, resp.status, respHeaders, body)
+        raise http.client.HTTPException("Too many redirects: "+url)
+
+    def get(self, url, headers=None):
+        return self.request(url, headers=headers)
+
+    def close(self):
+        with self.lock:
+            pools = list(self.pool.values())
+            self.pool = {}
+        for idle in pools:
+            for conn in idle:
+                try:
+                    conn.close()
+                except:
+                    pass
+
+
+def decodeBody(body, encoding):
+    encoding = encoding.lower().strip()
+    if not body or encoding in ("", "identity"):
+        return body
+    if encoding in ("gzip", "x-gzip"):
+        return gzip.decompress(body)
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            # some servers send raw deflate without the zlib header
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+    return body
+
+
+#=================================================
+# PROFILE FOLDER
+#=================================================
+
+def getProfileDir(*parts):
+    base = xbmcvfs.translatePath('special://profile/addon_data/'+addon_id)
+    path = os.path.join(base, *parts)
+    if not os.path.isdir(path):
+        os.makedirs(path, exist_ok=True)
+    return path
+
+#=================================================
+# SETTINGS SNAPSHOT
+#=================================================
+
+class Settings:
+    """
+    Addon settings read once per invocation from the profile settings.xml.
+    Keys missing from the file fall back to a single getSetting call,
+    writes are kept in memory until flush() at the end of the invocation
+    and skipped when the stored value changed meanwhile (openSettings).
+    """
+    def __init__(self, addonId=addon_id):
+        self.addonId = addonId
+        self.addon = None
+        self.values = None
+        self.info = {}
+        self.dirty = {}
+        self.original = {}
+        self.lock = threading.RLock()
+
+    def getAddon(self):
+        if self.addon is None:
+            self.addon = xbmcaddon.Addon(id=self.addonId)
+        return self.addon
+
+    def load(self):
+        import xml.etree.ElementTree as ET
+        values = {}
+        xmlFile = xbmcvfs.translatePath('special://profile/addon_data/'+self.addonId+'/settings.xml')
+        try:
+            for node in ET.parse(xmlFile).getroot().iter("setting"):
+                # v1 keeps the value in an attribute, v2 in the text
+                value = node.get("value")
+                if value is None:
+                    value = node.text or ""
+                values[node.get("id")] = value
+        except (OSError, ET.ParseError):
+            logging.warning("MANDRA_LOG: NO SETTINGS.XML, USE GETSETTING")
+        self.values = values
+
+    def get(self, key, default=""):
+        with self.lock:
+            if self.values is None:
+                self.load()
+            if key not in self.values:
+                self.values[key] = self.getAddon().getSetting(key)
+            value = self.values[key]
+        if value is None or value == "":
+            return default
+        return value
+
+    def set(self, key, value):
+        with self.lock:
+            if self.values is None:
+                self.load()
+            if key not in self.values:
+                self.values[key] = self.getAddon().getSetting(key)
+            if self.values[key] != value:
+                self.original.setdefault(key, self.values[key])
+                self.values[key] = value
+                self.dirty[key] = value
+
+    def reload(self):
+        # values changed outside the snapshot (openSettings): read them again
+        with self.lock:
+            self.values = None
+
+    def addonInfo(self, key):
+        with self.lock:
+            if key not in self.info:
+                self.info[key] = self.getAddon().getAddonInfo(key)
+            return self.info[key]
+
+    def flush(self):
+        # end of the invocation: write back and drop the snapshot
+        with self.lock:
+            dirty = self.dirty
+            original = self.original
+            self.dirty = {}
+            self.original = {}
+            self.values = None
+            self.info = {}
+        if not dirty:
+            return
+        # a new Addon object: an old one keeps the values it was created with
+        addon = xbmcaddon.Addon(id=self.addonId)
+        for key in dirty:
+            if addon.getSetting(key) != original[key]:
+                logging.warning("MANDRA_LOG: SETTING "+key+" CHANGED DURING THE INVOCATION, NOT OVERWRITTEN")
+                continue
+            addon.setSetting(key, dirty[key])
+
+
+_settings = None
+
+def getSettings():
+    global _settings
+    if _settings is None:
+        _settings = Settings()
+    return _settings
+
+#=================================================
+# LOGGER
+#=================================================
+
+def shorten(value, maxLen):
+    if not isinstance(value, str):
+        value = str(value)
+    if maxLen > 0 and len(value) > maxLen:
+        return value[:maxLen]+"...[+"+str(len(value)-maxLen)+" chars]"
+    return value
+
+
+class Logger:
+    """
+    Debug logger of launcher and resolver. Messages are formatted only when
+    debug is on (logga("PAGE: %s", html)), page bodies are cut at bodyMax
+    and the last messages of the invocation are kept in a shared ring.
+    """
+    ring = collections.deque(maxlen=LOG_RING_SIZE)
+
+    def __init__(self, prefix, enabled, bodyMax=LOG_BODY_MAX):
+        self.prefix = prefix
+        self.enabled = enabled
+        self.bodyMax = bodyMax
+
+    def log(self, mess, *args):
+        if not self.enabled:
+            return
+        if args:
+            try:
+                mess = mess % tuple(shorten(arg, self.bodyMax) for arg in args)
+            except (TypeError, ValueError):
+                mess = " ".join([mess]+[shorten(arg, self.bodyMax) for arg in args])
+        mess = shorten(mess, self.bodyMax * 2)
+        logging.warning(self.prefix+mess)
+        Logger.ring.append(mess)
+
+    def dump(self):
+        if self.enabled and len(Logger.ring) > 0:
+            logging.warning(self.prefix+"\n".join(Logger.ring))
+        Logger.ring.clear()
+
+
+def getLogger(prefix, debug):
+    return Logger(prefix, debug == "on", LOG_BODY_MAX)
+
+def writeAtomic(fileName, data):
+    tmpName = fileName+".tmp"+str(threading.get_ident())
+    mode = "wb" if isinstance(data, bytes) else "w"
+    f = open(tmpName, mode) if mode == "wb" else open(tmpName, mode, encoding="utf-8")
+    f.write(data)
+    f.close()
+    os.replace(tmpName, fileName)
+
+#=================================================
+# TRACING
+#=================================================
+
+class Span:
+    def __init__(self, tracer, name, args):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+        self.start = time.perf_counter()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, tb):
+        if excType is not None:
+            self.args["error"] = excType.__name__
+        self.end()
+        return False
+
+    def set(self, **args):
+        self.args.update(args)
+
+    def end(self, **args):
+        if self.tracer is None:
+            return
+        self.args.update(args)
+        self.tracer.add(self.name, self.start, time.perf_counter(), self.args)
+        self.tracer = None
+
+
+class NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, tb):
+        return False
+
+    def set(self, **args):
+        pass
+
+    def end(self, **args):
+        pass
+
+NULL_SPAN = NullSpan()
+
+
+class Tracer:
+    """
+    Span recorder enabled by the TRACE_ENV variable. At the end of the
+    invocation the spans are written in Chrome trace-event format to
+    addon_data/trace (open them with chrome://tracing or ui.perfetto.dev).
+    """
+    def __init__(self, maxEvents=TRACE_MAX_EVENTS):
+        self.maxEvents = maxEvents
+        self.events = []
+        self.dropped = 0
+        self.pid = os.getpid()
+        # perf_counter has no epoch: anchor it to the wall clock once
+        self.origin = time.time() - time.perf_counter()
+
+    def span(self, name, args):
+        return Span(self, name, args)
+
+    def add(self, name, start, end, args):
+        if len(self.events) >= self.maxEvents:
+            self.dropped += 1
+            return
+        event = {"name": name, "ph": "X", "pid": self.pid, "tid": threading.get_ident(),
+                 "ts": int((self.origin + start) * 1000000), "dur": int((end - start) * 1000000)}
+        if args:
+            event["args"] = dict((k, shorten(v, 200) if isinstance(v, str) else v) for k, v in args.items())
+        self.events.append(event)
+
+    def flush(self, label=""):
+        if not self.events:
+            return None
+        meta = [{"name": "process_name", "ph": "M", "pid": self.pid, "args": {"name": shorten(label, 200)}}]
+        if self.dropped:
+            meta.append({"name": "dropped_events", "ph": "M", "pid": self.pid, "args": {"count": self.dropped}})
+        folder = getProfileDir("trace")
+        # Kodi may run several invocations in the same process: the milliseconds keep the names apart
+        stamp = time.strftime("trace_%Y%m%d_%H%M%S_")+"%03d_" % (int(time.time() * 1000) % 1000)
+        fileName = os.path.join(folder, stamp+str(self.pid)+"_"+str(threading.get_ident())+".json")
+        writeAtomic(fileName, json.dumps({"traceEvents": meta+self.events}, separators=(",", ":")))
+        self.events = []
+        self.dropped = 0
+        old = sorted(name for name in os.listdir(folder) if name.startswith("trace_"))
+        for name in old[:-TRACE_KEEP]:
+            try:
+                os.remove(os.path.join(folder, name))
+            except OSError:
+                pass
+        return fileName
+
+
+def span(name, **args):
+    tracer = getTracer()
+    if tracer is None:
+        return NULL_SPAN
+    return tracer.span(name, args)
+
+def traced(name):
+    # decorator: with tracing off the function is returned as it is
+    def wrap(func):
+        if getTracer() is None:
+            return func
+        def tracedFunc(*args, **kwargs):
+            with getTracer().span(name, {}):
+                return func(*args, **kwargs)
+        tracedFunc.__name__ = func.__name__
+        tracedFunc.__doc__ = func.__doc__
+        return tracedFunc
+    return wrap
+
+def flushTrace(label=""):
+    tracer = getTracer()
+    if tracer is None:
+        return None
+    try:
+        return tracer.flush(label)
+    except Exception as err:
+        logging.warning("MANDRA_LOG: TRACE NOT SAVED: {0}".format(err))
+        return None
+
+#=================================================
+# RESPONSE CACHE
+#=================================================
+
+REFRESH_REGEX = re.compile(r'"RefreshList"\s*:\s*"?(\d+)')
+
+def refreshTtl(body, default=0):
+    # RefreshList sits at the top of the list json, no need to parse the whole body
+    found = REFRESH_REGEX.search(body[:4096].decode("utf-8", "ignore"))
+    if found:
+        return int(found.group(1))
+    return default
+
+
+def groupsIndexUrl(url, body, headers=None):
+    """
+    Groups index published next to a big grouped list (<list>.groups.json,
+    scripts/generate_groups_index.py). Used only when it was generated from
+    this very body: an index left behind by an edit of the list is ignored.
+    """
+    if len(body) < GROUPS_MIN_SIZE or "?" in url or (b'"groups"' not in body and b'"channels"' not in body):
+        return ""
+    indexUrl = url+".groups.json"
+    try:
+        response = getClient().get(indexUrl, headers=headers)
+        if not response.ok():
+            return ""
+        source = json.loads(response.text()).get("source", {})
+    except Exception:
+        return ""
+    if source.get("size") == len(body) and source.get("sha256") == hashlib.sha256(body).hexdigest():
+        return indexUrl
+    logging.warning("MANDRA_LOG: GROUPS INDEX NOT GENERATED FROM "+url)
+    return ""
+
+def pipeHeaders(url):
+    """(link, headers) of a kodi url carrying link|Header=value&Header=value"""
+    link, _, extra = url.partition("|")
+    headers = {}
+    for pair in extra.split("&"):
+        key, sep, value = pair.partition("=")
+        if sep:
+            headers[key] = unquote(value)
+    return link, headers
+
+def groupHash(group):
+    # same hash as scripts/generate_groups_index.py
+    data = json.dumps(group, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha1(data.encode("utf-8")).hexdigest()[:16]
+
+
+class ResponseCache:
+    """
+    On-disk store of list responses: one .json with validators and
+    freshness, one .body with the decoded payload.
+    """
+    def __init__(self, folder, maxEntries=CACHE_MAX_ENTRIES):
+        self.folder = folder
+        self.maxEntries = maxEntries
+
+    def key(self, url, headers=None):
+        ua = ""
+        if headers:
+            ua = headers.get("User-Agent", "")
+        return hashlib.sha1((url+"\n"+ua).encode("utf-8")).hexdigest()
+
+    def bodyPath(self, key):
+        return os.path.join(self.folder, key+".body")
+
+    def load(self, key):
+        try:
+            f = open(os.path.join(self.folder, key+".json"), encoding="utf-8")
+            meta = json.load(f)
+            f.close()
+            if os.path.exists(self.bodyPath(key)):
+                return meta
+        except (OSError, ValueError):
+            pass
+        return None
+
+    def body(self, key):
+        f = open(self.bodyPath(key), "rb")
+        data = f.read()
+        f.close()
+        return data
+
+    def storeMeta(self, key, meta):
+        writeAtomic(os.path.join(self.folder, key+".json"), json.dumps(meta))
+
+    def store(self, key, meta, body):
+        writeAtomic(self.bodyPath(key), body)
+        self.storeMeta(key, meta)
+        self.prune()
+
+    def prune(self):
+        try:
+            names = [n for n in os.listdir(self.folder) if n.endswith(".json")]
+            if len(names) <= self.maxEntries:
+                return
+            names.sort(key=lambda n: os.path.getmtime(os.path.join(self.folder, n)))
+            for n in names[:len(names)-self.maxEntries]:
+                for ext in (".json", ".body"):
+                    try:
+                        os.remove(os.path.join(self.folder, n[:-5]+ext))
+                    except OSError:
+                        pass
+        except OSError:
+            pass
+
+
+def cachedResponse(url, meta, body):
+    response = HttpResponse(url, 200, {"content-type": meta.get("type", "")}, body)
+    response.fromCache = True
+    response.expires = meta["fetched"] + meta["ttl"]
+    return response
+
+def fetchCached(url, headers=None, ttl=None):
+    """
+    GET through the response cache: a fresh entry costs no request, a stale
+    one is revalidated with If-None-Match/If-Modified-Since. Without ttl the
+    freshness comes from the RefreshList field of the list (0 = revalidate).
+    """
+    cache = getResponseCache()
+    key = cache.key(url, headers)
+    meta = cache.load(key)
+    hdr = dict(headers or {})
+    if meta is not None:
+        if time.time() - meta["fetched"] < meta["ttl"]:
+            return cachedResponse(url, meta, cache.body(key))
+        if meta.get("groupsIndex"):
+            response = refreshGroups(url, headers, ttl, cache, key, meta)
+            if response is not None:
+                return response
+        if meta.get("etag"):
+            hdr["If-None-Match"] = meta["etag"]
+        if meta.get("modified"):
+            hdr["If-Modified-Since"] = meta["modified"]
+    try:
+        response = getClient().get(url, headers=hdr)
+    except Exception:
+        if meta is None:
+            raise
+        logging.warning("MANDRA_LOG: OFFLINE, STALE CACHE FOR "+url)
+        return cachedResponse(url, meta, cache.body(key))
+
+    if response.status == 304 and meta is not None:
+        meta["fetched"] = time.time()
+        cache.storeMeta(key, meta)
+        return cachedResponse(url, meta, cache.body(key))
+    if response.status >= 500 and meta is not None:
+        return cachedResponse(url, meta, cache.body(key))
+    response.fromCache = False
+    if response.ok():
+        meta = {
+            "url": url,
+            "etag": response.header("etag"),
+            "modified": response.header("last-modified"),
+            "type": response.header("content-type"),
+            "fetched": time.time(),
+            "ttl": ttl if ttl is not None else refreshTtl(response.body),
+            "groupsIndex": groupsIndexUrl(url, response.body, headers)
+        }
+        response.expires = meta["fetched"] + meta["ttl"]
+        try:
+            cache.store(key, meta, response.body)
+        except OSError:
+            logging.warning("MANDRA_LOG: CACHE NOT WRITABLE")
+    return response
+
+def refreshGroups(url, headers, ttl, cache, key, meta):
+    """
+    Stale grouped list (w3u groups or channels) with a groups index. A HEAD
+    of the list tells whether it changed (ETag); when it did, gets the index
+    and only the groups whose hash changed, and merges them with the
+    unchanged groups of the cached copy. None when the index cannot be used
+    (the caller falls back to the full download).
+    """
+    indexUrl = meta["groupsIndex"]
+    try:
+        with span("list.groups", url=url) as sp:
+            # identity: Content-Length is the size of the file, as in the index
+            head = getClient().request(url, headers=dict(headers or {}, **{"Accept-Encoding": "identity"}), method="HEAD")
+            etag = head.header("etag")
+            if not head.ok() or not etag:
+                return None
+            if etag == meta.get("etag"):
+                meta["fetched"] = time.time()
+                cache.storeMeta(key, meta)
+                return cachedResponse(url, meta, cache.body(key))
+
+            response = getClient().get(indexUrl, headers=headers)
+            if not response.ok():
+                return None
+            index = json.loads(response.text())
+            size = head.header("content-length")
+            if not size or int(size) != index.get("source", {}).get("size"):
+                # the list changed after the index was generated
+                logging.warning("MANDRA_LOG: GROUPS INDEX OLDER THAN "+url)
+                return None
+            groupKey = index["key"]
+            cached = {}
+            for group in json.loads(cache.body(key).decode("utf-8")).get(groupKey, []):
+                cached[groupHash(group)] = group
+            groups = []
+            changed = 0
+            for entry in index["groups"]:
+                group = cached.get(entry["hash"])
+                if group is None:
+                    part = getClient().get(urljoin(indexUrl, entry["url"]), headers=headers)
+                    if not part.ok():
+                        return None
+                    group = json.loads(part.text())
+                    if groupHash(group) != entry["hash"]:
+                        return None
+                    changed += 1
+                groups.append(group)
+            sp.set(groups=len(groups), changed=changed)
+    except Exception as err:
+        logging.warning("MANDRA_LOG: GROUPS INDEX NOT USABLE FOR "+url+": "+str(err))
+        return None
+
+    doc = dict(index.get("header", {}))
+    doc[groupKey] = groups
+    body = json.dumps(doc, ensure_ascii=False).encode("utf-8")
+    meta.update({
+        "etag": etag,
+        "modified": head.header("last-modified"),
+        "type": "application/json; charset=utf-8",
+        "fetched": time.time(),
+        "ttl": ttl if ttl is not None else refreshTtl(body)
+    })
+    try:
+        cache.store(key, meta, body)
+    except OSError:
+        logging.warning("MANDRA_LOG: CACHE NOT WRITABLE")
+    merged = cachedResponse(url, meta, body)
+    merged.fromCache = False
+    return merged
+
+
+#=================================================
+# CHANNEL STORE
+#=================================================
+
+class ChannelStore:
+    """
+    Parsed channels of the channel lists, keyed by list and channel name.
+    Every list is spilled once to addon_data/channels as a data file of
+    marshalled channels plus an index of (offset, length) by name, so
+    opening a channel reads and decodes only that channel.
+    """
+    def __init__(self, folder):
+        self.folder = folder
+        self.memory = {}
+
+    def listKey(self, data):
+        if not isinstance(data, str):
+            data = json.dumps(data, sort_keys=True)
+        return hashlib.sha1(data.encode("utf-8")).hexdigest()[:16]
+
+    def paths(self, key):
+        base = os.path.join(self.folder, key)
+        return base+".idx", base+".dat"
+
+    def put(self, key, channels):
+        byName = {}
+        for channel in channels:
+            name = channel.get("name", "")
+            if name not in byName:
+                byName[name] = channel
+        self.memory[key] = byName
+        idxFile, datFile = self.paths(key)
+        if os.path.exists(idxFile):
+            # same list already spilled: just mark it as recently used
+            os.utime(idxFile, None)
+            return
+        index = {}
+        blobs = []
+        offset = 0
+        for name in byName:
+            blob = marshal.dumps(byName[name])
+            index[name] = (offset, len(blob))
+            blobs.append(blob)
+            offset += len(blob)
+        writeAtomic(datFile, b"".join(blobs))
+        writeAtomic(idxFile, marshal.dumps(index))
+        self.prune()
+
+    def get(self, key, name):
+        channels = self.memory.get(key)
+        if channels is not None:
+            return channels.get(name)
+        idxFile, datFile = self.paths(key)
+        try:
+            with open(idxFile, "rb") as f:
+                entry = marshal.load(f).get(name)
+            if entry is None:
+                return None
+            with open(datFile, "rb") as f:
+                f.seek(entry[0])
+                return marshal.loads(f.read(entry[1]))
+        except (OSError, EOFError, ValueError, TypeError):
+            # missing list or spill written by another python version
+            return None
+
+    def has(self, key):
+        return key in self.memory or os.path.exists(self.paths(key)[0])
+
+    def prune(self):
+        indexes = [os.path.join(self.folder, name) for name in os.listdir(self.folder) if name.endswith(".idx")]
+        if len(indexes) <= CHANNEL_LISTS_KEEP:
+            return
+        indexes.sort(key=os.path.getmtime)
+        for idxFile in indexes[:-CHANNEL_LISTS_KEEP]:
+            for fileName in (idxFile, idxFile[:-4]+".dat"):
+                try:
+                    os.remove(fileName)
+                except OSError:
+                    pass
+
+#=================================================
+# DIRECTORY SNAPSHOTS
+#=================================================
+
+class SnapshotCache:
+    """
+    Rendered directories (url, label, info and art of every entry) keyed by
+    action, source and settings, marshalled to addon_data/cache/dir. The
+    least recently used snapshots are dropped past maxEntries.
+    """
+    def __init__(self, folder, maxEntries=SNAPSHOT_KEEP):
+        self.folder = folder
+        self.maxEntries = maxEntries
+
+    def key(self, *parts):
+        return hashlib.sha1("\n".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+
+    def digest(self, text):
+        return hashlib.sha1(text.encode("utf-8", "replace")).hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.folder, key+".snap")
+
+    def load(self, key):
+        try:
+            with open(self.path(key), "rb") as f:
+                snap = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if not isinstance(snap, dict) or snap.get("version") != SNAPSHOT_VERSION:
+            return None
+        return snap
+
+    def touch(self, key):
+        try:
+            os.utime(self.path(key), None)
+        except OSError:
+            pass
+
+    def store(self, key, snap):
+        snap["version"] = SNAPSHOT_VERSION
+        try:
+            writeAtomic(self.path(key), marshal.dumps(snap))
+        except (OSError, ValueError):
+            logging.warning("MANDRA_LOG: SNAPSHOT NOT WRITABLE")
+            return
+        self.prune()
+
+    def prune(self):
+        try:
+            snaps = [os.path.join(self.folder, name) for name in os.listdir(self.folder) if name.endswith(".snap")]
+            if len(snaps) <= self.maxEntries:
+                return
+            snaps.sort(key=os.path.getmtime)
+            for fileName in snaps[:-self.maxEntries]:
+                os.remove(fileName)
+        except OSError:
+            pass
+
+#=================================================
+# SEARCH INDEX
+#=================================================
+
+SEARCH_TAGS = re.compile(r'\[/?(?:COLOR|B|I|CR|UPPERCASE|LOWERCASE|CAPITALIZE|LIGHT)[^\]]*\]', re.IGNORECASE)
+SEARCH_WORD = re.compile(r'\w+', re.UNICODE)
+
+def searchWords(text):
+    """Lowercase words of text without accents and Kodi label tags"""
+    text = unicodedata.normalize("NFKD", SEARCH_TAGS.sub(" ", text))
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return SEARCH_WORD.findall(text.lower())
+
+
+class SearchIndex:
+    """
+    Full-text index of the items of the lists already opened, in
+    addon_data/search/index.db. Every source (list url, page or channel
+    list) is indexed again only when its digest changes; the oldest
+    sources are dropped past SEARCH_MAX_SOURCES. Uses FTS5 or FTS4 when
+    the sqlite of Kodi has them, a plain LIKE scan otherwise.
+    """
+    def __init__(self, fileName, maxSources=SEARCH_MAX_SOURCES):
+        self.maxSources = maxSources
+        self.db = sqlite3.connect(fileName)
+        self.db.execute("CREATE TABLE IF NOT EXISTS sources (source TEXT PRIMARY KEY, digest TEXT, used REAL)")
+        self.db.execute("CREATE TABLE IF NOT EXISTS entries (id INTEGER PRIMARY KEY, source TEXT, item TEXT)")
+        self.db.execute("CREATE INDEX IF NOT EXISTS entries_source ON entries (source)")
+        self.fts = self.createWords()
+        self.db.commit()
+
+    def createWords(self):
+        row = self.db.execute("SELECT sql FROM sqlite_master WHERE name='words'").fetchone()
+        if row is not None:
+            return "VIRTUAL" in row[0].upper()
+        for module in ("fts5", "fts4"):
+            try:
+                self.db.execute("CREATE VIRTUAL TABLE words USING "+module+"(terms)")
+                return True
+            except sqlite3.OperationalError:
+                pass
+        self.db.execute("CREATE TABLE words (terms TEXT)")
+        return False
+
+    def digest(self, text):
+        return hashlib.sha1(text.encode("utf-8", "replace")).hexdigest()
+
+    def current(self, source, digest):
+        """True when source is already indexed with this digest (marked as used)"""
+        row = self.db.execute("SELECT digest FROM sources WHERE source=?", (source,)).fetchone()
+        if row is None or row[0] != digest:
+            return False
+        self.db.execute("UPDATE sources SET used=? WHERE source=?", (time.time(), source))
+        self.db.commit()
+        return True
+
+    def update(self, source, digest, entries):
+        """entries: (searchable text, item dict) of the source, replacing the old ones"""
+        with span("search.index", source=source, items=len(entries)):
+            db = self.db
+            self.remove(source)
+            rows = []
+            for text, item in entries:
+                words = searchWords(text)
+                if words:
+                    rows.append((" ".join(words), json.dumps(item)))
+            cursor = db.execute("SELECT IFNULL(MAX(id), 0) FROM entries")
+            first = cursor.fetchone()[0] + 1
+            db.executemany("INSERT INTO entries (id, source, item) VALUES (?, ?, ?)",
+                           [(first+n, source, row[1]) for n, row in enumerate(rows)])
+            db.executemany("INSERT INTO words (rowid, terms) VALUES (?, ?)",
+                           [(first+n, row[0]) for n, row in enumerate(rows)])
+            db.execute("INSERT OR REPLACE INTO sources (source, digest, used) VALUES (?, ?, ?)", (source, digest, time.time()))
+            self.prune()
+            db.commit()
+
+    def remove(self, source):
+        self.db.execute("DELETE FROM words WHERE rowid IN (SELECT id FROM entries WHERE source=?)", (source,))
+        self.db.execute("DELETE FROM entries WHERE source=?", (source,))
+        self.db.execute("DELETE FROM sources WHERE source=?", (source,))
+
+    def prune(self):
+        old = self.db.execute("SELECT source FROM sources ORDER BY used DESC LIMIT -1 OFFSET ?", (self.maxSources,)).fetchall()
+        for row in old:
+            self.remove(row[0])
+
+    def search(self, text, limit=SEARCH_LIMIT):
+        """Items whose words start with every word of text, accents ignored"""
+        words = searchWords(text)
+        if not words:
+            return []
+        with span("search.query", words=len(words)):
+            if self.fts:
+                query = " ".join('"'+word+'"*' for word in words)
+                sql = "SELECT DISTINCT e.item FROM words w JOIN entries e ON e.id = w.rowid WHERE w.terms MATCH ? LIMIT ?"
+                rows = self.db.execute(sql, (query, limit)).fetchall()
+            else:
+                where = " AND ".join("(' ' || w.terms) LIKE ? ESCAPE '\\'" for word in words)
+                sql = "SELECT DISTINCT e.item FROM words w JOIN entries e ON e.id = w.rowid WHERE "+where+" LIMIT ?"
+                rows = self.db.execute(sql, tuple("% "+word.replace("_", "\\_")+"%" for word in words) + (limit,)).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def close(self):
+        self.db.close()
+
+#=================================================
+# ARTWORK CACHE
+#=================================================
+
+ART_EXTENSIONS = (".jpg", ".jpeg", ".png", ".gif", ".webp", ".bmp")
+
+class ArtCache:
+    """
+    Local copies of the list artwork in addon_data/cache/art, named by url
+    hash. lookup() gives the local file when there is one and queues the
+    missing urls (each url once); prefetch() downloads the queue with a few
+    background threads. The least recently used files go past maxBytes.
+    """
+    def __init__(self, folder, maxBytes=ART_CACHE_BYTES):
+        self.folder = folder
+        self.maxBytes = maxBytes
+        self.local = {}
+        self.wanted = []
+        self.queued = set()
+        self.lock = threading.Lock()
+        self.workers = []
+
+    def path(self, url):
+        ext = os.path.splitext(urlsplit(url).path)[1].lower()
+        if ext not in ART_EXTENSIONS:
+            ext = ".img"
+        return os.path.join(self.folder, hashlib.sha1(url.encode("utf-8")).hexdigest()[:20]+ext)
+
+    def lookup(self, url, want=True):
+        """Local file of url when cached, else url itself (queued for the prefetch if want)"""
+        if not url or not url.startswith("http"):
+            return url
+        local = self.local.get(url)
+        if local is None:
+            path = self.path(url)
+            if os.path.exists(path):
+                local = path
+                try:
+                    os.utime(path, None)
+                except OSError:
+                    pass
+            else:
+                local = url
+            self.local[url] = local
+        if want and local == url:
+            self.queue(url)
+        return local
+
+    def queue(self, url):
+        if url not in self.queued and url.startswith("http") and self.local.get(url, url) == url:
+            self.queued.add(url)
+            self.wanted.append(url)
+
+    def prefetch(self, workers=ART_WORKERS):
+        if not self.wanted:
+            return
+        with span("art.prefetch", urls=len(self.wanted)):
+            count = len(self.wanted)
+            urls = iter(self.wanted)
+            self.wanted = []
+            for n in range(min(workers, count)):
+                worker = threading.Thread(target=self.worker, args=(urls,), name="mandraArt-"+str(n))
+                worker.daemon = True
+                worker.start()
+                self.workers.append(worker)
+
+    def worker(self, urls):
+        while True:
+            with self.lock:
+                url = next(urls, None)
+            if url is None:
+                return
+            self.download(url)
+
+    def download(self, url):
+        path = self.path(url)
+        if os.path.exists(path):
+            return
+        try:
+            with span("art.download", url=url):
+                response = getClient().get(url, headers={"User-Agent": ART_UA, "Accept": "image/*"})
+            if not response.ok() or len(response.body) > ART_MAX_FILE:
+                return
+            if not response.header("content-type", "image/").startswith("image/"):
+                return
+            writeAtomic(path, response.body)
+        except Exception as err:
+            logging.warning("MANDRA_LOG: ART NOT CACHED "+url+": "+str(err))
+
+    def wait(self, timeout):
+        """Waits up to timeout seconds for the prefetch, then trims the cache"""
+        if not self.workers:
+            return
+        deadline = time.time() + timeout
+        for worker in self.workers:
+            worker.join(max(0, deadline - time.time()))
+        self.workers = [worker for worker in self.workers if worker.is_alive()]
+        if not self.workers:
+            self.prune()
+
+    def prune(self):
+        try:
+            files = []
+            total = 0
+            for name in os.listdir(self.folder):
+                path = os.path.join(self.folder, name)
+                stat = os.stat(path)
+                files.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+            if total <= self.maxBytes:
+                return
+            files.sort()
+            for mtime, size, path in files:
+                os.remove(path)
+                total -= size
+                if total <= self.maxBytes * 0.9:
+                    break
+        except OSError:
+            pass
+
+#=================================================
+# LINK HEALTH
+#=================================================
+
+class LinkProber:
+    """
+    Liveness of the stream links in addon_data/health/health.db. The links
+    of a listing are queued and checked in background by a bounded pool of
+    threads, at most one request every PROBE_HOST_INTERVAL per host: a
+    HEAD (or a one byte GET when HEAD is refused), for HLS the manifest
+    and the first segment. Only the status line is read, so a live
+    stream never keeps a worker busy. Only a definite http error marks a
+    link dead: timeouts, dns and connection errors leave it unknown, and
+    certificates are not verified, as the players do not verify them.
+    """
+    def __init__(self, fileName):
+        self.fileName = fileName
+        self.db = sqlite3.connect(fileName)
+        self.db.execute("CREATE TABLE IF NOT EXISTS health (url TEXT PRIMARY KEY, host TEXT, ok INTEGER, status INTEGER, checked REAL, millis INTEGER)")
+        self.db.commit()
+        self.wanted = []
+        self.queued = set()
+        self.results = []
+        self.hostNext = {}
+        self.lock = threading.Lock()
+        self.workers = []
+        self.deadline = 0
+        self.context = ssl._create_unverified_context()
+
+    def state(self, urls):
+        """{url: True/False} for the urls checked within PROBE_TTL"""
+        found = {}
+        urls = list(set(urls))
+        since = time.time() - PROBE_TTL
+        for start in range(0, len(urls), 500):
+            part = urls[start:start+500]
+            rows = self.db.execute("SELECT url, ok FROM health WHERE checked>? AND url IN ("+",".join("?"*len(part))+")",
+                                   [since] + part)
+            for url, ok in rows:
+                found[url] = ok == 1
+        return found
+
+    def queue(self, urls):
+        for url in urls:
+            if len(self.wanted) >= PROBE_MAX:
+                return
+            if url not in self.queued and url.startswith("http"):
+                self.queued.add(url)
+                self.wanted.append(url)
+
+    def start(self, timeout=PROBE_WAIT, workers=PROBE_WORKERS):
+        if not self.wanted:
+            return
+        logging.warning("MANDRA_LOG: PROBE "+str(len(self.wanted))+" LINKS")
+        self.deadline = time.time() + timeout
+        count = len(self.wanted)
+        urls = iter(self.wanted)
+        self.wanted = []
+        for n in range(min(workers, count)):
+            worker = threading.Thread(target=self.worker, args=(urls,), name="mandraProbe-"+str(n))
+            worker.daemon = True
+            worker.start()
+            self.workers.append(worker)
+
+    def worker(self, urls):
+        while time.time() < self.deadline:
+            with self.lock:
+                url = next(urls, None)
+            if url is None:
+                return
+            host = urlsplit(url).hostname or ""
+            self.waitHost(host)
+            ok, status, millis = self.check(url)
+            if not ok and not 400 <= status < 600:
+                # no answer is not a dead link: nothing stored, checked again next time
+                continue
+            with self.lock:
+                self.results.append((url, host, 1 if ok else 0, status, time.time(), millis))
+
+    def waitHost(self, host):
+        # per host rate limit: the slots are booked under the lock, the sleep is outside
+        with self.lock:
+            now = time.time()
+            slot = max(now, self.hostNext.get(host, 0))
+            self.hostNext[host] = slot + PROBE_HOST_INTERVAL
+        if slot > now:
+            time.sleep(slot - now)
+
+    def request(self, url, headers, method="GET", limit=0):
+        """(status, first limit bytes of the body, final url) following the redirects"""
+        for _ in range(MAX_REDIRECT + 1):
+            parts = urlsplit(url)
+            if parts.scheme == "https":
+                conn = http.client.HTTPSConnection(parts.hostname, parts.port or 443, timeout=PROBE_TIMEOUT,
+                                                   context=self.context)
+            else:
+                conn = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=PROBE_TIMEOUT)
+            try:
+                target = (parts.path or "/") + ("?"+parts.query if parts.query else "")
+                conn.request(method, target, headers=headers)
+                resp = conn.getresponse()
+                location = resp.getheader("location")
+                if resp.status in (301, 302, 303, 307, 308) and location:
+                    url = urljoin(url, location)
+                    continue
+                body = resp.read(limit) if limit and method != "HEAD" else b""
+                return resp.status, body, url
+            finally:
+                conn.close()
+        return 310, b"", url
+
+    def head(self, url, headers):
+        status = self.request(url, headers, "HEAD")[0]
+        if status in (400, 403, 405, 501):
+            # servers refusing HEAD: the first byte is enough
+            status = self.request(url, dict(headers, Range="bytes=0-0"), "GET", 1)[0]
+        return status
+
+    def segment(self, url, body):
+        """(first uri of an HLS playlist, True when it is a variant playlist)"""
+        text = body.decode("utf-8", "ignore")
+        if not text.lstrip().startswith("#EXTM3U"):
+            return None, False
+        variant = False
+        for line in text.splitlines():
+            line = line.strip()
+            if line.startswith("#EXT-X-STREAM-INF"):
+                variant = True
+            elif line and not line.startswith("#"):
+                return urljoin(url, line), variant
+        return None, False
+
+    def check(self, url):
+        """(ok, status, millis) of one link; link|Header=value headers are sent"""
+        link, extra = pipeHeaders(url)
+        headers = {"User-Agent": ART_UA}
+        headers.update(extra)
+        start = time.time()
+        ok = False
+        status = 0
+        try:
+            with span("probe.check", url=link) as sp:
+                if ".m3u8" in urlsplit(link).path.lower():
+                    status, body, final = self.request(link, headers, "GET", PROBE_MANIFEST_BYTES)
+                    if 200 <= status < 400:
+                        uri, variant = self.segment(final, body)
+                        if variant:
+                            status, body, final = self.request(uri, headers, "GET", PROBE_MANIFEST_BYTES)
+                            uri, variant = self.segment(final, body) if 200 <= status < 400 else (None, False)
+                        if uri is not None:
+                            status = self.head(uri, headers)
+                        ok = uri is not None and 200 <= status < 400
+                else:
+                    status = self.head(link, headers)
+                    ok = 200 <= status < 400
+                sp.set(status=status, ok=ok)
+        except Exception as err:
+            logging.warning("MANDRA_LOG: PROBE "+link+": "+str(err))
+        return ok, status, int((time.time() - start) * 1000)
+
+    def wait(self, timeout):
+        """Waits up to timeout seconds for the workers and stores the results"""
+        deadline = time.time() + timeout
+        for worker in self.workers:
+            worker.join(max(0, deadline - time.time()))
+        self.workers = [worker for worker in self.workers if worker.is_alive()]
+        with self.lock:
+            results = self.results
+            self.results = []
+        if results:
+            self.db.executemany("INSERT OR REPLACE INTO health VALUES (?, ?, ?, ?, ?, ?)", results)
+            self.db.execute("DELETE FROM health WHERE checked<?", (time.time() - PROBE_KEEP,))
+            self.db.commit()
+
+    def close(self):
+        self.db.close()
+
+#=================================================
+# M3U PLAYLIST
+#=================================================
+
+# every key="value" (or key=value) pair of an #EXTINF line
+M3U_ATTR_REGEX = re.compile(r'([\w.-]+)=(?:"([^"]*)"|([^\s",]+))')
+# attributes and title are split by the first comma outside the quotes
+M3U_EXTINF_REGEX = re.compile(r'((?:[^",]|"[^"]*")*),(.*)')
+# #EXTVLCOPT options sent as http headers by the players
+M3U_VLC_HEADERS = {
+    "http-user-agent": "User-Agent",
+    "http-referrer": "Referer",
+    "http-referer": "Referer",
+    "http-origin": "Origin",
+    "http-cookie": "Cookie"
+}
+
+def iterLines(text):
+    # one line at a time: a 100k entries playlist never becomes a list of lines
+    start = 0
+    size = len(text)
+    while start < size:
+        end = text.find("\n", start)
+        if end < 0:
+            end = size
+        yield text[start:end]
+        start = end + 1
+
+def m3uAttrs(attrs):
+    return dict((key.lower(), quoted if value == "" else value)
+                for key, quoted, value in M3U_ATTR_REGEX.findall(attrs))
+
+def m3uOption(line, headers, props):
+    """#EXTVLCOPT, #KODIPROP and #EXTHTTP lines of an entry into headers and props"""
+    tag, _, value = line.partition(":")
+    tag = tag.upper()
+    if tag == "#KODIPROP":
+        key, _, val = value.partition("=")
+        props[key.strip()] = val.strip()
+    elif tag == "#EXTVLCOPT":
+        key, _, val = value.partition("=")
+        header = M3U_VLC_HEADERS.get(key.strip().lower())
+        if header is not None:
+            headers[header] = val.strip()
+    elif tag == "#EXTHTTP":
+        try:
+            for key, val in json.loads(value).items():
+                headers[key] = str(val)
+        except ValueError:
+            pass
+
+def parseM3u(text):
+    """
+    Single pass over an M3U playlist: yields one entry (title, link, group,
+    logo, attrs, headers, props) for every #EXTINF line followed by its
+    url. The option lines of an entry (#EXTVLCOPT, #KODIPROP, #EXTHTTP,
+    #EXTGRP) can sit before or after its #EXTINF.
+    """
+    extinf = None
+    headers = {}
+    props = {}
+    extgrp = ""
+    for line in iterLines(text):
+        line = line.strip()
+        if not line:
+            continue
+        if line[0] == "#":
+            if line.startswith("#EXTINF:"):
+                extinf = line[8:]
+            elif line.startswith("#EXTGRP:"):
+                extgrp = line[8:].strip()
+            elif line[1:4] in ("EXT", "KOD"):
+                m3uOption(line, headers, props)
+            continue
+        if extinf is not None:
+            found = M3U_EXTINF_REGEX.match(extinf)
+            if found:
+                attrs, title = found.groups()
+            else:
+                attrs, _, title = extinf.partition(",")
+            attrs = m3uAttrs(attrs)
+            yield {
+                "title": title.strip() or attrs.get("tvg-name", ""),
+                "link": line,
+                "group": attrs.get("group-title") or extgrp,
+                "logo": attrs.get("tvg-logo", ""),
+                "attrs": attrs,
+                "headers": headers,
+                "props": props
+            }
+        extinf = None
+        headers = {}
+        props = {}
+        extgrp = ""
+
+
+class PlaylistCache:
+    """
+    Parsed M3U playlists by url. The channels of a playlist live in the
+    channel store (marshal data plus an index by group name) under a key
+    made of the url and the ETag of the response, or its size and digest
+    when the server sends no ETag; a small marshal file per url keeps the
+    validators and the group headers. A playlist opened again within
+    M3U_FRESH costs no request, after that a conditional GET: unchanged,
+    it is neither downloaded nor parsed again.
+    """
+    def __init__(self, folder, channels):
+        self.folder = folder
+        self.channels = channels
+
+    def path(self, url):
+        return os.path.join(self.folder, hashlib.sha1(url.encode("utf-8")).hexdigest()+".m3u")
+
+    def load(self, url):
+        try:
+            with open(self.path(url), "rb") as f:
+                meta = marshal.load(f)
+            if self.channels.has(meta["key"]):
+                return meta
+        except (OSError, EOFError, ValueError, TypeError, KeyError):
+            pass
+        return None
+
+    def store(self, url, meta):
+        try:
+            writeAtomic(self.path(url), marshal.dumps(meta))
+            self.prune()
+        except OSError:
+            logging.warning("MANDRA_LOG: CACHE NOT WRITABLE")
+
+    def open(self, url, headers, build):
+        """
+        (meta, doc) of the playlist at url: doc is the channels document
+        made by build(text) when the playlist was parsed, None when meta
+        (key and group headers) comes from the cache. None when the
+        playlist cannot be downloaded and is not cached.
+        """
+        meta = self.load(url)
+        if meta is not None and time.time() - meta["fetched"] < M3U_FRESH:
+            return meta, None
+        # link|Header=value: the headers go on the request, not in the url
+        link, extra = pipeHeaders(url)
+        hdr = dict(headers or {})
+        hdr.update(extra)
+        if meta is not None:
+            if meta["etag"]:
+                hdr["If-None-Match"] = meta["etag"]
+            if meta["modified"]:
+                hdr["If-Modified-Since"] = meta["modified"]
+        try:
+            with span("m3u.fetch", url=url):
+                response = getClient().get(link, headers=hdr)
+        except Exception:
+            if meta is None:
+                return None
+            logging.warning("MANDRA_LOG: OFFLINE, STALE PLAYLIST "+url)
+            return meta, None
+        if response.status == 304 and meta is not None:
+            meta["fetched"] = time.time()
+            self.store(url, meta)
+            return meta, None
+        if not response.ok():
+            return (meta, None) if meta is not None else None
+
+        etag = response.header("etag")
+        version = etag or "%d:%s" % (len(response.body), hashlib.sha1(response.body).hexdigest())
+        key = hashlib.sha1((url+"\n"+version).encode("utf-8")).hexdigest()[:16]
+        if meta is not None and meta["key"] == key:
+            doc = None
+        else:
+            doc = build(response.text())
+            self.channels.put(key, doc["channels"])
+            meta = {
+                "key": key,
+                "channels": [dict((k, v) for k, v in channel.items() if k != "items") for channel in doc["channels"]]
+            }
+        meta.update({
+            "etag": etag,
+            "modified": response.header("last-modified"),
+            "fetched": time.time()
+        })
+        self.store(url, meta)
+        return meta, doc
+
+    def prune(self):
+        names = [os.path.join(self.folder, n) for n in os.listdir(self.folder) if n.endswith(".m3u")]
+        if len(names) <= M3U_KEEP:
+            return
+        names.sort(key=os.path.getmtime)
+        for fileName in names[:-M3U_KEEP]:
+            try:
+                os.remove(fileName)
+            except OSError:
+                pass
+
+#=================================================
+# PVR EXPORT
+#=================================================
+
+LABEL_TAGS_REGEX = re.compile(r'\[/?(?:COLOR|B|I|CR)[^\]]*\]', re.IGNORECASE)
+EPG_COUNTRY_REGEX = re.compile(r'\.[a-z]{2}$')
+EPG_QUALITY_REGEX = re.compile(r'\b(?:f?hd|sd|4k|uhd)\b')
+EPG_WORD_REGEX = re.compile(r'[^0-9a-z]+')
+PVR_TVG_KEYS = ("tvg-chno", "tvg-shift", "catchup", "catchup-source", "catchup-days")
+
+def plainLabel(text):
+    return LABEL_TAGS_REGEX.sub("", text).strip()
+
+def epgKey(name):
+    # "Sky Cinema Due.it", "[COLOR lime]SKY CINEMA DUE HD[/COLOR]" -> "skycinemadue"
+    name = EPG_COUNTRY_REGEX.sub("", plainLabel(name).lower())
+    return EPG_WORD_REGEX.sub("", EPG_QUALITY_REGEX.sub("", name))
+
+def xmltvChannels(body):
+    """(ids, {epgKey(display name): id}) of the channels of an XMLTV guide"""
+    import io
+    import xml.etree.ElementTree as ET
+    ids = set()
+    names = {}
+    for event, elem in ET.iterparse(io.BytesIO(body), ("end",)):
+        if elem.tag == "programme":
+            # the channels come first
+            break
+        if elem.tag == "channel":
+            channelId = elem.get("id", "")
+            ids.add(channelId)
+            names.setdefault(epgKey(channelId), channelId)
+            for display in elem.findall("display-name"):
+                names.setdefault(epgKey(display.text or ""), channelId)
+    return ids, names
+
+def pvrPlaylist(channels, epgIds=(), epgNames=None, dead=()):
+    """
+    M3U for pvr.iptvsimple from the channels of a parsed playlist: one
+    entry per stream link (the first one wins), dead links left out,
+    tvg-id taken from the guide by name when the playlist has none.
+    Returns the text and the tvg-ids used.
+    """
+    epgNames = epgNames or {}
+    lines = ["#EXTM3U"]
+    seen = set()
+    ids = set()
+    for channel in channels:
+        group = plainLabel(channel.get("name", ""))
+        for item in channel.get("items", []):
+            link = item.get("link")
+            if not isinstance(link, str) or not link or link in seen or link in dead:
+                continue
+            if item.get("enabled", True) == False:
+                continue
+            seen.add(link)
+            title = plainLabel(item.get("title", "")) or "NO TIT"
+            tvg = item.get("tvg", {})
+            tvgId = tvg.get("tvg-id", "")
+            if tvgId not in epgIds:
+                tvgId = epgNames.get(epgKey(tvg.get("tvg-name") or title), tvgId)
+            attrs = [("tvg-id", tvgId), ("tvg-name", tvg.get("tvg-name") or title),
+                     ("tvg-logo", item.get("thumbnail", "")), ("group-title", group)]
+            attrs += [(key, tvg[key]) for key in PVR_TVG_KEYS if tvg.get(key)]
+            lines.append("#EXTINF:-1 "+" ".join(key+'="'+value.replace('"', "'")+'"' for key, value in attrs if value)+","+title)
+            for key, value in item.get("props", {}).items():
+                lines.append("#KODIPROP:"+key+"="+value)
+            lines.append(link)
+            if tvgId:
+                ids.add(tvgId)
+    return "\n".join(lines)+"\n", ids
+
+def pvrGuide(body, ids):
+    """XMLTV with only the channels and programmes of ids"""
+    import io
+    import xml.etree.ElementTree as ET
+    parts = ['<?xml version="1.0" encoding="UTF-8"?>\n<tv generator-info-name="MandraKodi">\n']
+    root = None
+    for event, elem in ET.iterparse(io.BytesIO(body), ("start", "end")):
+        if root is None:
+            root = elem
+            continue
+        if event != "end" or elem.tag not in ("channel", "programme"):
+            continue
+        if elem.get("id" if elem.tag == "channel" else "channel") in ids:
+            elem.tail = "\n"
+            parts.append(ET.tostring(elem, encoding="unicode"))
+        root.clear()
+    parts.append("</tv>\n")
+    return "".join(parts)
+
+
+class PvrExport:
+    """
+    Local playlist and guide for pvr.iptvsimple in addon_data/pvr. Every
+    file is written again only when the hash of its content changes, so
+    the caller restarts the PVR manager only when export() says so.
+    """
+    def __init__(self, folder):
+        self.folder = folder
+        self.m3uPath = os.path.join(folder, "mandra.m3u")
+        self.xmlPath = os.path.join(folder, "mandra.xml")
+        self.statePath = os.path.join(folder, "state.json")
+
+    def loadState(self):
+        try:
+            with open(self.statePath, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def write(self, state, path, text):
+        name = os.path.basename(path)
+        digest = hashlib.sha1(text.encode("utf-8")).hexdigest()
+        if state.get(name) == digest and os.path.exists(path):
+            return False
+        writeAtomic(path, text)
+        state[name] = digest
+        return True
+
+    def export(self, channels, epgBody=None, dead=()):
+        """(m3u path, xmltv path or "", True when a file changed)"""
+        with span("pvr.export") as sp:
+            state = self.loadState()
+            epgIds, epgNames = set(), {}
+            if epgBody:
+                try:
+                    epgIds, epgNames = xmltvChannels(epgBody)
+                except Exception as err:
+                    logging.warning("MANDRA_LOG: EPG NOT READABLE: "+str(err))
+                    epgBody = None
+            text, ids = pvrPlaylist(channels, epgIds, epgNames, dead)
+            changed = self.write(state, self.m3uPath, text)
+            xmlPath = ""
+            if epgBody:
+                changed = self.write(state, self.xmlPath, pvrGuide(epgBody, ids)) or changed
+                xmlPath = self.xmlPath
+            if changed:
+                writeAtomic(self.statePath, json.dumps(state))
+            sp.set(changed=changed, channels=len(ids))
+        return self.m3uPath, xmlPath, changed
+
+#=================================================
+# CODE UPDATE
+#=================================================
+
+def fileHash(fileName):
+    digest = hashlib.sha256()
+    f = open(fileName, "rb")
+    for chunk in iter(lambda: f.read(65536), b""):
+        digest.update(chunk)
+    f.close()
+    return digest.hexdigest()
+
+
+class Updater:
+    """
+    Keeps the addon modules in line with manifest.json: only the modules
+    whose sha256 differs from the local copy are downloaded, verified and
+    swapped in with an atomic rename.
+    """
+    def __init__(self, home, manifestUrl=None):
+        self.home = home
+        self.manifestUrl = manifestUrl or MANIFEST_URL
+        self.manifest = None
+
+    def loadManifest(self):
+        if self.manifest is None:
+            response = fetchCached(self.manifestUrl, ttl=0)
+            if not response.ok():
+                raise Exception("HTTP "+str(response.status)+" from "+self.manifestUrl)
+            self.manifest = json.loads(response.text())
+        return self.manifest
+
+    def modules(self):
+        return self.loadManifest()["modules"]
+
+    def version(self, name):
+        return self.modules()[name].get("version", "")
+
+    def outdated(self, names=None):
+        modules = self.modules()
+        if names is None:
+            names = sorted(modules)
+        toUpdate = []
+        for name in names:
+            if name not in modules:
+                continue
+            localFile = os.path.join(self.home, name)
+            if not os.path.exists(localFile) or fileHash(localFile) != modules[name]["sha256"]:
+                toUpdate.append(name)
+        # package modules first, so a new entrypoint never imports a provider that is not there yet
+        toUpdate.sort(key=lambda name: "/" not in name)
+        return toUpdate
+
+    def install(self, name):
+        info = self.modules()[name]
+        remoteUrl = self.loadManifest().get("baseUrl", "")+name
+        response = getClient().get(remoteUrl)
+        if not response.ok():
+            raise Exception("HTTP "+str(response.status)+" from "+remoteUrl)
+        body = response.body
+        if len(body) != info.get("size", len(body)) or hashlib.sha256(body).hexdigest() != info["sha256"]:
+            raise Exception("Hash mismatch for "+name)
+        localFile = os.path.join(self.home, name)
+        localDir = os.path.dirname(localFile)
+        if not os.path.isdir(localDir):
+            os.makedirs(localDir, exist_ok=True)
+        writeAtomic(localFile, body)
+        compileModule(localFile)
+
+    def update(self, names=None):
+        installed = []
+        for name in self.outdated(names):
+            try:
+                self.install(name)
+                installed.append(name)
+                logging.warning("MANDRA_LOG: MODULE UPDATED "+name+" "+self.version(name))
+            except Exception as err:
+                logging.warning("MANDRA_LOG: MODULE UPDATE FAILED "+name+": {0}".format(err))
+        return installed
+
+
+def compileModule(fileName):
+    # rebuild the bytecode of a swapped module: the next invocation loads a
+    # valid .pyc instead of compiling the source again
+    import importlib
+    import py_compile
+    try:
+        py_compile.compile(fileName, doraise=True, invalidation_mode=py_compile.PycInvalidationMode.CHECKED_HASH)
+    except Exception as err:
+        logging.warning("MANDRA_LOG: COMPILE FAILED "+fileName+": {0}".format(err))
+    importlib.invalidate_caches()
+
+
+_updater = None
+
+def getUpdater(home):
+    global _updater
+    if _updater is None or _updater.home != home:
+        _updater = Updater(home)
+    return _updater
+
+
+_tracer = None
+_tracerInit = False
+
+def getTracer():
+    global _tracer, _tracerInit
+    if not _tracerInit:
+        _tracerInit = True
+        if os.environ.get(TRACE_ENV) == "on":
+            _tracer = Tracer()
+    return _tracer
+
+
+_channels = None
+
+def getChannelStore():
+    global _channels
+    if _channels is None:
+        _channels = ChannelStore(getProfileDir("channels"))
+    return _channels
+
+
+_playlists = None
+
+def getPlaylistCache():
+    global _playlists
+    if _playlists is None:
+        _playlists = PlaylistCache(getProfileDir("cache", "m3u"), getChannelStore())
+    return _playlists
+
+
+_prober = None
+
+def getLinkProber():
+    global _prober
+    if _prober is None:
+        _prober = LinkProber(os.path.join(getProfileDir("health"), "health.db"))
+    return _prober
+
+
+_pvr = None
+
+def getPvrExport():
+    global _pvr
+    if _pvr is None:
+        _pvr = PvrExport(getProfileDir("pvr"))
+    return _pvr
+
+
+_snapshots = None
+
+def getSnapshotCache():
+    global _snapshots
+    if _snapshots is None:
+        _snapshots = SnapshotCache(getProfileDir("cache", "dir"))
+    return _snapshots
+
+
+_art = None
+
+def getArtCache():
+    global _art
+    if _art is None:
+        _art = ArtCache(getProfileDir("cache", "art"))
+    return _art
+
+
+_search = None
+
+def getSearchIndex():
+    global _search
+    if _search is None:
+        _search = SearchIndex(os.path.join(getProfileDir("search"), "index.db"))
+    return _search
+
+
+_cache = None
+
+def getResponseCache():
+    global _cache
+    if _cache is None:
+        _cache = ResponseCache(getProfileDir("cache", "http"))
+    return _cache
+
+
+_client = None
+_clientLock = threading.Lock()
+
+def getClient():
+    global _client
+    with _clientLock:
+        if _client is None:
+            _client = HttpClient()
+        return _client
+
+def closeClient():
+    global _client
+    with _clientLock:
+        client = _client
+        _client = None
+    if client is not None:
+        client.close()
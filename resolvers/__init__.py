@@ -0,0 +1,7 @@
+from __future__ import unicode_literals # turns everything to unicode
+# Package: resolvers
+# Author: ElSupremo
+# Created on: 17.10.2026
+# Last update: 17.10.2026
+# License: GPL v.3 https://www.gnu.org/copyleft/gpl.html
+# Resolver providers loaded on demand by myResolver.getProvider
@@ -0,0 +1,442 @@
+from __future__ import unicode_literals # turns everything to unicode
+# Module: resolvers.daddy
+# Author: ElSupremo
+# Created on: 17.10.2026
+# Last update: 17.10.2026
+# License: GPL v.3 https://www.gnu.org/copyleft/gpl.html
+
+import re, requests
+
+import xbmcgui
+
+from myResolver import logga, find_single_match, msgBox, preg_match, writeFileLog, settings, PY3, myParse
+from resolvers.useragents import getRandomUA
+
+
+def daddyFind(parIn):
+    video_url = ""
+    page_data = requests.get(parIn,headers={'user-agent':'Mozilla/5.0','accept':'*/*','Referer':'https://daddylivestream.com/'}).content
+    if PY3:
+        page_data = page_data.decode('utf-8')
+    iframe_url = preg_match(page_data, r'iframe\s*src="([^"]+)')
+    logga('IFRAME DADDY: '+iframe_url)
+    if iframe_url.endswith(".mp4"):
+        video_url = iframe_url
+        return video_url
+    if iframe_url.startswith("http"):
+        page_data2 = requests.get(iframe_url.replace("caq21harderv991gpluralplay", "forcedtoplay"),headers={'user-agent':'Mozilla/5.0','accept':'*/*','Referer':parIn}).content
+        if PY3:
+            page_data2 = page_data2.decode('utf-8')
+        
+        iframe_url2 = preg_match(page_data2, r'iframe\s*src="([^"]+)')
+        logga('IFRAME DADDY2: '+iframe_url2)
+        if iframe_url2=="":
+            video_url = preg_match(page_data2.replace('//source:','//source_no:'), "source:'(.*?)'")
+            logga('VIDEO DADDY2: '+video_url)
+            
+        if "http" in iframe_url2:
+            page_data3 = requests.get(iframe_url2,headers={'user-agent':'Mozilla/5.0','accept':'*/*','Referer':'https://widevine.licenses4.me/'}).content
+            if PY3:
+                page_data3 = page_data3.decode('utf-8')
+            writeFileLog("DADDY_PAGE\n"+page_data3, "w+")
+            video_url = preg_match(page_data3, "Clappr.Player[\w\W]*?.source:'(.*?)'")
+            vt = video_url.split("?auth")
+            video_url = vt[0]
+
+    return video_url
+
+def daddy(parIn=None):
+    video_urls = []
+    logga('PAR_DADDY: '+parIn)
+    video_url = daddyFind(parIn)
+    logga('URL DADDYS: '+video_url)
+    tito = "DADDY"
+    refe = parIn
+    try:
+        arrTmp = parIn.split("stream-")
+        arrTmp2 = arrTmp[1].split(".")
+        vId = arrTmp2[0]
+        tito = vId
+        refe = "https://weblivehdplay.ru/premiumtv/daddyhd.php?id="+vId+"&Origin=https://weblivehdplay.ru/premiumtv/daddyhd.php?id="+vId
+        if video_url == "":
+            return daddyCode(vId)
+    except:
+        pass
+
+    randomUa=getRandomUA()
+    ip64="MTUxLjI1LjIzMS43MQ=="
+    final_url = video_url + "?auth="+ip64+"|Keep-Alive=true&Referer="+refe+"&User-Agent="+randomUa
+    
+
+    video_urls.append((final_url, "[COLOR lime]PLAY STREAM "+tito+"[/COLOR]", "by @MandraKodi", "https://i.imgur.com/8EL6mr3.png"))
+    
+    return video_urls
+
+def daddyCode(codeIn=None):
+    import re, json, base64
+    video_urls = []
+
+    dadUrl="https://dlhd.dad/watch/stream-"+codeIn+".php"
+    m3u8=resolve_link(codeIn)
+
+    jsonText='{"SetViewMode":"50","items":['
+    jsonText = jsonText + '{"title":"[COLOR lime]PLAY STREAM '+codeIn+'[/COLOR] [COLOR gold](DIRECT)[/COLOR]","link":"'+m3u8+'",'
+    jsonText = jsonText + '"thumbnail":"https://i.imgur.com/8EL6mr3.png",'
+    jsonText = jsonText + '"fanart":"https://www.stadiotardini.it/wp-content/uploads/2016/12/mandrakata.jpg",'
+    jsonText = jsonText + '"info":"by MandraKodi"},'
+    jsonText = jsonText + '{"title":"[COLOR orange]PLAY STREAM '+codeIn+'[/COLOR] [COLOR gold](FFMPEG)[/COLOR]","myresolve":"ffmpeg_noRef@@'+m3u8+'",'
+    #jsonText = jsonText + '{"title":"[COLOR orange]PLAY STREAM '+codeIn+'[/COLOR] [COLOR gold](FFMPEG)[/COLOR]","myresolve":"daddy@@https://dlhd.so/embed/stream-'+codeIn+'.php",'
+    jsonText = jsonText + '"thumbnail":"https://i.imgur.com/8EL6mr3.png",'
+    jsonText = jsonText + '"fanart":"https://www.stadiotardini.it/wp-content/uploads/2016/12/mandrakata.jpg",'
+    jsonText = jsonText + '"info":"by MandraKodi"}'
+    
+   
+    
+    jsonText = jsonText + "]}"
+    logga('JSON-DADDY: %s', jsonText)
+    video_urls.append((jsonText, "PLAY VIDEO", "No info", "noThumb", "json"))
+    
+    return video_urls
+
+
+    randomUa="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.0.0 Safari/537.36 OPR/120.0.0.0"
+    #randomUa=getRandomUA()
+    headers = {
+        'user-agent': randomUa,
+        'referer': "https://dlhd.dad/"
+    }
+    s = requests.Session()
+    
+    #urlSrv="https://dlhd.dad/stream/stream-"+codeIn+".php"
+    #fuSrv = s.get(urlSrv, headers=headers, verify=False)
+    #urlAuth = re.findall('<iframe src="(.*?)"', fuSrv.text)[0]
+    #logga("SERVER_AUTH_DADDY: "+urlAuth)
+    #arrAuth=urlAuth.split("/")
+    #hostAuth=arrAuth[2]
+    hostAuth="epicplayplay.cfd"
+    urlAuth="https://"+hostAuth+"/premiumtv/daddyhd.php?id="+codeIn
+    
+    fu = s.get(urlAuth, headers=headers)
+    logga ("AUTH_PAGE: %s", fu.text)
+
+    bundle64 = re.findall('const IJXX="(.*?)"', fu.text)[0]
+    logga("BUNDLE_DADDY: "+bundle64)
+    bundle=base64.b64decode(bundle64).decode("utf-8")
+    arrAuth=json.loads(bundle)
+    authTs64 = arrAuth["b_ts"]
+    authRnd64 = arrAuth["b_rnd"]
+    authSig64 = arrAuth["b_sig"]
+
+    authTs = base64.b64decode(authTs64).decode("utf-8")
+    authRnd = base64.b64decode(authRnd64).decode("utf-8")
+    authSig = base64.b64decode(authSig64).decode("utf-8")
+    
+    sigHt=re.findall('src="https://security.giokko.ru/secure.php(.*?)"', fu.text)[0]
+    logga("DADDY NEW_URL "+sigHt)
+    arrSig=sigHt.split("&sig=")
+    authSig=arrSig[1]
+
+    headers = {
+        'user-agent': randomUa,
+        'referer': "https://"+hostAuth+"/",
+        'origin': "https://"+hostAuth
+    }
+    urlAuth="https://top2new.giokko.ru/auth.php?channel_id=premium"+codeIn+"&ts="+authTs+"&rnd="+authRnd+"&sig="+authSig
+    urlAuth="https://security.giokko.ru/secure.php"+sigHt
+    
+    dataJ2 = s.get(urlAuth, headers=headers)
+    logga("DADDY AUTH %s\n%s", urlAuth, dataJ2.text)
+    
+    urlSrv="https://"+hostAuth+"/server_lookup.php?channel_id=premium"+codeIn
+
+    dataJson = s.get(urlSrv, headers=headers)
+    logga("DADDY JSON %s", dataJson.text)
+    arrJ = json.loads(dataJson.text)
+    server=arrJ["server_key"]
+    logga("DADDY_CODE SERVER "+server)
+    link="https://"+server+"new.giokko.ru/"+server+"/premium"+codeIn+"/mono.m3u8"
+    
+    refe="https://"+hostAuth+"/"
+    origin="https://"+hostAuth
+    
+    
+    final_url=link+"|Referer="+refe+"&Origin="+origin+"&Connection=Keep-Alive&User-Agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.0.0 Safari/537.36 OPR/120.0.0.0"
+    
+
+    jsonText='{"SetViewMode":"50","server":"'+server+'","items":['
+    jsonText = jsonText + '{"title":"[COLOR lime]PLAY STREAM '+codeIn+'[/COLOR] [COLOR gold](DIRECT)[/COLOR]","link":"'+final_url+'",'
+    jsonText = jsonText + '"thumbnail":"https://i.imgur.com/8EL6mr3.png",'
+    jsonText = jsonText + '"fanart":"https://www.stadiotardini.it/wp-content/uploads/2016/12/mandrakata.jpg",'
+    jsonText = jsonText + '"info":"by MandraKodi"},'
+    jsonText = jsonText + '{"title":"[COLOR orange]PLAY STREAM '+codeIn+'[/COLOR] [COLOR gold](FFMPEG)[/COLOR]","myresolve":"ffmpeg_noRef@@'+final_url+'",'
+    #jsonText = jsonText + '{"title":"[COLOR orange]PLAY STREAM '+codeIn+'[/COLOR] [COLOR gold](FFMPEG)[/COLOR]","myresolve":"daddy@@https://dlhd.so/embed/stream-'+codeIn+'.php",'
+    jsonText = jsonText + '"thumbnail":"https://i.imgur.com/8EL6mr3.png",'
+    jsonText = jsonText + '"fanart":"https://www.stadiotardini.it/wp-content/uploads/2016/12/mandrakata.jpg",'
+    jsonText = jsonText + '"info":"by MandraKodi"}'
+    
+   
+    
+    jsonText = jsonText + "]}"
+    logga('JSON-DADDY: %s', jsonText)
+    video_urls.append((jsonText, "PLAY VIDEO", "No info", "noThumb", "json"))
+    
+    return video_urls
+
+def resolve_link(url):
+    import json, base64, time
+    from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
+    
+    user_agent = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36 OPR/124.0.0.0'
+    m3u8 = "IgnoreMe"
+    logga ("URL IN ==> "+url)
+    try:
+        dadUrl="https://daddyhd.com/watch/stream-"+url+".php"
+        #response = get(url)
+        headers = {
+            'user-agent': user_agent,
+            'referer': "https://daddyhd.com/"
+        }
+        s = requests.Session()
+        
+        
+        iframe_url = "https://epicplayplay.cfd/premiumtv/daddyhd.php?id="+url
+        response = s.get(iframe_url, headers=headers)
+        js = response.text
+        logga ("SOURCE2 ==> "+js)
+        params = {
+            "channel_key": None,
+            "auth_token": None,
+            "auth_country": None,
+            "auth_ts": None,
+            "auth_expiry": None,
+        }
+
+        # intercetta QUALSIASI const var_<qualcosa> = "valore";
+        pattern = r'const\s+var_[a-zA-Z0-9]+\s*=\s*["\']([^"\']+)["\']'
+
+        matches = re.findall(pattern, js)
+
+        if len(matches) >= 5:
+            params["auth_token"]   = matches[0]
+            params["channel_key"]  = matches[1]
+            params["auth_country"] = matches[2]
+            params["auth_ts"]      = matches[3]
+            params["auth_expiry"]  = matches[4]
+
+        logga("channel_key ==> " + str(params["channel_key"]))
+        logga("auth_token ==> " + str(params["auth_token"]))
+        logga("auth_country ==> " + str(params["auth_country"]))
+        logga("auth_ts ==> " + str(params["auth_ts"]))
+        logga("auth_expiry ==> " + str(params["auth_expiry"]))
+
+        channel_key   = params["channel_key"]
+        auth_token    = params["auth_token"]
+        sess_split = auth_token.split(".")
+        session_token = auth_token
+        auth_country  = params["auth_country"]
+        time_stamp    = params["auth_ts"]
+        lang = 'it-IT'
+        screen = '1920x1080'
+        time_zone = "Europe/Rome"
+        fingerprint = f"{user_agent}|{screen}|{time_zone}|{lang}"
+        sign_data = f"{channel_key}|{auth_country}|{auth_token}|{user_agent}|{fingerprint}"
+        logga("SIGN_DATA: "+str(sign_data.encode("utf-8")))
+        client_token = base64.b64encode(sign_data.encode("utf-8")).decode("ascii")
+
+        heartbeat= "https://chevy.kiko2.ru/heartbeat"
+        
+        referer="https://epicplayplay.cfd"
+        heartbeat_headers = {
+            'Accept': '*/*',
+            "X-User-Agent": user_agent,
+            "User-Agent": user_agent,
+            "accept-encoding": "gzip, deflate, br, zstd",
+            "Accept-Language": "it-IT,it;q=0.9,en-US;q=0.8,en;q=0.7,es;q=0.6,lt;q=0.5,de;q=0.4,fr;q=0.3,hu;q=0.2,ru;q=0.1,sv;q=0.1,da;q=0.1,ro;q=0.1,pl;q=0.1,hr;q=0.1",
+            "Referer": referer,
+            "Origin": referer,
+            "Connection": "Keep-Alive",
+            "Authorization": f"Bearer {session_token}",
+            "X-Channel-Key": channel_key,
+            "X-Client-Token": client_token,
+            'sec-ch-ua': '"Chromium";v="140", "Not=A?Brand";v="24", "Opera";v="124"',
+            'Sec-Fetch-Dest': 'empty',
+            'Sec-Fetch-Mode': 'cors',
+            'Sec-Fetch-Site': 'cross-site',
+            'Priority': 'u=1, i'
+        }
+
+        heart_resp = s.get(heartbeat, headers=heartbeat_headers, timeout=10)
+        content_encoding = heart_resp.headers.get('Content-Encoding')
+        logga("heart_resp ==> "+str(heart_resp.status_code)+" ("+content_encoding+")")
+
+        server_lookup_url = f"https://chevy.giokko.ru/server_lookup?channel_id={channel_key}"
+        lookup_headers = headers.copy()
+        lookup_headers.update({
+            'Accept': '*/*',
+            'accept-encoding': 'gzip, deflate, zstd',
+            'Accept-Language': 'it-IT,it;q=0.9,en-US;q=0.8,en;q=0.7,es;q=0.6,lt;q=0.5,de;q=0.4,fr;q=0.3,hu;q=0.2,ru;q=0.1,sv;q=0.1,da;q=0.1,ro;q=0.1,pl;q=0.1,hr;q=0.1',
+            'Origin': referer,
+            'Referer': referer+"/",
+            'sec-ch-ua': '"Chromium";v="140", "Not=A?Brand";v="24", "Opera";v="124"',
+            'Sec-Fetch-Dest': 'empty',
+            'Sec-Fetch-Mode': 'cors',
+            'Sec-Fetch-Site': 'cross-site',
+            'Priority': 'u=1, i',
+        })
+        lookup_resp = s.get(server_lookup_url, headers=lookup_headers, timeout=6)
+        content_encoding = lookup_resp.headers.get('Content-Encoding')
+        logga("lookup_resp ==> "+str(lookup_resp.status_code)+" ("+content_encoding+")")
+        server_key = find_single_match(lookup_resp.text, '{"server_key":"(.*?)"}')
+        try:
+            server_data = lookup_resp.json()
+            server_key = server_data.get('server_key')
+        except Exception:
+            pass
+        logga("server_key ==> "+server_key)
+        if server_key == 'top1/cdn':
+            stream_url = f'https://top1.kiko2.ru/top1/cdn/{channel_key}/mono.css'
+        else:
+            stream_url = f'https://{server_key}new.kiko2.ru/{server_key}/{channel_key}/mono.css'
+        
+        uaenc=myParse.quote(user_agent, safe='')
+        cookie = "eplayer_session=" + session_token
+        cookenc=myParse.quote(cookie, safe='')
+
+        m3u8 = f'{stream_url}|Referer={referer}/&Origin={referer}&Connection=Keep-Alive&User-Agent={uaenc}&Cookie={cookenc}'
+        m3u8_resp = s.get(m3u8)
+        logga ("SOURCE_M3U8 ==> %s", m3u8_resp.text)
+        #m3u8 = f'{m3u8}|{urlencode(heartbeat_headers)}'
+    except Exception as err:
+        import traceback
+        
+        errMsg="ERROR_MK2: {0}".format(err)
+        msgBox(errMsg)
+        traceback.print_exc()
+    
+    return m3u8
+
+def gdplayer(parIn):
+    import json
+    video_urls = []
+    url="https://en.freewatchtv.top/live-tv/"+parIn
+    response = requests.get(url)
+    logga ("GDPLAYER_PAGE: "+url+"\n"+response.text)
+    page = response.text.replace("\n", "").replace("\r", "").replace("\t", "")
+    match = re.search(r'data-src="https:\/\/ava\.karmakurama\.com\/\?id=(.*?)"', page, re.IGNORECASE)
+    daddyC="000"
+    try:
+        daddyC=match.group(1).strip()
+    except:
+        match1 = re.search(r'"drm":{"clearkey":{"(.*?)":', page, re.IGNORECASE)
+        try:
+            parIn=parIn+"-"+match1.group(1).strip()
+        except:
+            pass
+        pass    
+    logga ("GDPLAYER_CODE: "+daddyC)
+    if daddyC=="000":
+        video_urls.append(("ignoreMe", "[COLOR orange]No Link Found for "+parIn+"[/COLOR]" , "NO LINK ", "https://clipart-library.com/image_gallery2/Television-Free-Download-PNG.png"))
+        return video_urls
+    jj=daddyCode(daddyC)
+    for linkTmp in jj:
+        newList=list(linkTmp)
+        newLink=newList[0]
+        #logga("JJSON: "+newLink)
+        arr_t = json.loads(newLink)
+        server=arr_t["server"]
+        refe="https://en.freewatchtv.top"
+        link="https://ava.karmakurama.com/"+server+"/premium"+daddyC+"/mono.m3u8|Referer="+refe+"/&Origin="+refe+"&User-Agent=iPad"
+        video_urls.append((link, "[COLOR lime]Play Stream "+daddyC+"[/COLOR]" , "PLAY VIDEO ", "https://clipart-library.com/image_gallery2/Television-Free-Download-PNG.png"))
+        return video_urls
+
+def PlayStream(link):
+    import re, json, base64
+    logga("CH_DADDY: "+link)
+    randomUa="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.0.0 Safari/537.36 OPR/120.0.0.0"
+    
+    headers = {
+        'user-agent': randomUa,
+        'referer': "https://daddylivestream.com/"
+    }
+    s = requests.Session()
+    
+    urlAuth="https://dokoplay.xyz/premiumtv/daddylive.php?id="+link
+    fu = s.get(urlAuth, headers=headers)
+    logga ("AUTH_PAGE: %s", fu.text)
+
+    bundle64 = re.findall('const XJZ="(.*?)"', fu.text)[0]
+    logga("BUNDLE_DADDY: "+bundle64)
+    bundle=base64.b64decode(bundle64).decode("utf-8")
+    arrAuth=json.loads(bundle)
+    authTs64 = arrAuth["b_ts"]
+    authRnd64 = arrAuth["b_rnd"]
+    authSig64 = arrAuth["b_sig"]
+
+    authTs = base64.b64decode(authTs64).decode("utf-8")
+    authRnd = base64.b64decode(authRnd64).decode("utf-8")
+    authSig = base64.b64decode(authSig64).decode("utf-8")
+    
+
+
+    headers = {
+        'user-agent': randomUa,
+        'referer': "https://dokoplay.xyz/",
+        'origin': "https://dokoplay.xyz"
+    }
+    urlAuth="https://top2new.kiko2.ru/auth.php?channel_id=premium"+link+"&ts="+authTs+"&rnd="+authRnd+"&sig="+authSig
+    dataJ2 = s.get(urlAuth, headers=headers)
+    logga("DADDY AUTH %s\n%s", urlAuth, dataJ2.text)
+    
+    
+    
+    
+    urlSrv="https://dokoplay.xyz/server_lookup.php?channel_id=premium"+link
+    dataJson = s.get(urlSrv, headers=headers)
+    arrJ = json.loads(dataJson.text)
+    server=arrJ["server_key"]
+    link="https://"+server+"new.kiko2.ru/"+server+"/premium"+link+"/mono.m3u8"
+    refe="https://dokoplay.xyz/"
+    origin="https://dokoplay.xyz"
+    
+    
+    final_url=link+"|Referer="+refe+"&Origin="+origin+"&User-Agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.0.0 Safari/537.36 OPR/120.0.0.0"
+    
+
+    liz = xbmcgui.ListItem('Daddylive', path=final_url)
+    liz.setProperty('inputstream', 'inputstream.ffmpegdirect')
+    liz.setMimeType('application/x-mpegURL')
+    liz.setProperty('inputstream.ffmpegdirect.manifest_type', 'hls')
+    liz.setProperty('inputstream.ffmpegdirect.is_realtime_stream', 'true')
+    timeShift = settings.get("urlAppo4")
+    logga("TimeShift ==> "+timeShift)
+    if timeShift != "no_time_shift":
+        logga("OK TimeShift")
+        liz.setProperty('inputstream.ffmpegdirect.stream_mode', 'timeshift')
+    
+    return liz
+
+def daddyPremium(codeIn=None):
+    import re, json
+    video_urls = []
+    randomUa="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/133.0.0.0 Safari/537.36 OPR/118.0.0.0"
+    headers = {
+        'user-agent': randomUa
+    }
+    s = requests.Session()
+    urlSrv="https://dokoplay.xyz/server_lookup.php?channel_id=premium"+codeIn
+    dataJson = s.get(urlSrv, headers=headers)
+    arrJ = json.loads(dataJson.text)
+    server=arrJ["server_key"]
+    logga("DADDY_PREMIUM SERVER "+server)
+    link="https://"+server+"new.kiko2.ru/"+server+"/premium"+codeIn+"/mono.m3u8"
+    
+    liz = xbmcgui.ListItem(path=link, offscreen=True)
+    liz.setContentLookup(False)
+    liz.setProperty('inputstream', 'inputstream.adaptive')
+    liz.setMimeType("application/x-mpegURL")
+    liz.setProperty('inputstream.adaptive.file_type', 'hls')
+    ua="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.0.0 Safari/537.36 OPR/120.0.0.0"
+    host="https://dokoplay.xyz"
+    liz.setProperty('inputstream.adaptive.stream_headers', 'User-Agent='+ua+'&Referer='+host+'/&Origin='+host)
+    liz.setProperty('inputstream.adaptive.manifest_headers', 'User-Agent='+ua+'&Referer='+host+'/&Origin='+host)
+    return liz
@@ -0,0 +1,170 @@
+from __future__ import unicode_literals # turns everything to unicode
+# Module: resolvers.dazn
+# Author: ElSupremo
+# Created on: 17.10.2026
+# Last update: 17.10.2026
+# License: GPL v.3 https://www.gnu.org/copyleft/gpl.html
+
+import xbmcgui
+
+from myResolver import logga, fix_base64_padding, myParse
+
+
+def daznTokenOld(parIn):
+    logga ("PAR_DAZN: "+parIn)
+    arrT=parIn.split("SPLITTA_QUI")
+    link=arrT[0].replace("PARAMETRI_TUOI", "&")
+    key=arrT[1]
+    token=arrT[2]
+    ua=arrT[3]
+    drmType="org.w3.clearkey"
+    host="https://www.dazn.com"
+    logga ("link_DAZN: "+link)
+
+    liz = xbmcgui.ListItem(path=link, offscreen=True)
+    liz.setContentLookup(False)
+    liz.setProperty('inputstream', 'inputstream.adaptive')
+    liz.setMimeType("application/dash+xml")
+    liz.setProperty('inputstream.adaptive.file_type', 'mpd')
+    liz.setProperty('inputstream.adaptive.drm_legacy', drmType+'|'+key)
+    heads="dazn-token="+token+'&referer='+host+'/&origin='+host+'&user-agent='+ua
+    liz.setProperty('inputstream.adaptive.stream_headers', heads)
+    liz.setProperty('inputstream.adaptive.manifest_headers', heads)
+
+    return liz
+
+def amstaffTest(parIn):
+    import base64
+    if "http" in parIn:
+        logga("NO_BASE64")
+        parametro=parIn
+    else:
+        parametro=base64.b64decode(fix_base64_padding(parIn)).decode("utf-8")
+    
+    win = xbmcgui.Window(10000)
+    sessionVar1 = win.getProperty("sessionVar1")
+    logga('sessionVar1: '+sessionVar1)
+    arrT=parametro.split("|")
+    link=arrT[0]
+    key64=arrT[1]
+    token=""
+    try:
+      token=arrT[2]
+    except:
+        pass
+    drmType="org.w3.clearkey"
+    
+    liz = xbmcgui.ListItem(path=link, offscreen=True)
+    liz.setContentLookup(False)
+    liz.setProperty('inputstream', 'inputstream.adaptive')
+    if ".mpd" in link:
+        liz.setMimeType("application/dash+xml")
+        liz.setProperty('inputstream.adaptive.file_type', 'mpd')
+    
+    if ".m3u8" in link:
+        liz.setMimeType("application/x-mpegURL")
+        liz.setProperty('inputstream.adaptive.file_type', 'hls')
+        #drmType="none"
+    
+    if key64!="0000":
+        liz.setProperty('inputstream.adaptive.drm_legacy', drmType+'|'+key64)
+    
+    ua="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.0.0 Safari/537.36 OPR/120.0.0.0"
+    if "dazn" in link or "dai.google.com" in link:
+        #ua="Mozilla/5.0 (X11; Linux armv7l) AppleWebKit/537.36 (KHTML, like Gecko) QtWebEngine/5.9.7 Chrome/56.0.2924.122 Safari/537.36 Sky_STB_ST412_2018/1.0.0 (Sky, EM150UK,)"
+        ua=myParse.quote("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/143.0.0.0 Safari/537.36")
+        host="https://www.dazn.com"
+        heads='User-Agent='+ua+'&Referer='+host+'/&Origin='+host+'&verifypeer=false'
+        if token != "":
+            ua=myParse.quote_plus("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/133.0.0.0 Safari/537.36")
+            heads=token+'&referer='+host+'/&origin='+host+'&user-agent='+ua
+        liz.setProperty('inputstream.adaptive.stream_headers', heads)
+        liz.setProperty('inputstream.adaptive.manifest_headers', heads)
+    elif "lba-ew" in link:
+        ua="Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:143.0) Gecko/20100101 Firefox/143.0"
+        host="https://www.lbatv.com"
+        liz.setProperty('inputstream.adaptive.stream_headers', 'User-Agent='+ua+'&Referer='+host+'/&Origin='+host+'&verifypeer=false')
+        liz.setProperty('inputstream.adaptive.manifest_headers', 'User-Agent='+ua+'&Referer='+host+'/&Origin='+host+'&verifypeer=false')
+    elif "discovery" in link:
+        ua="Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:134.0) Gecko/20100101 Firefox/134.0"
+        host="https://www.discoveryplus.com"
+        liz.setProperty('inputstream.adaptive.stream_headers', 'User-Agent='+ua+'&Referer='+host+'/&Origin='+host+'&verifypeer=false')
+        liz.setProperty('inputstream.adaptive.manifest_headers', 'User-Agent='+ua+'&Referer='+host+'/&Origin='+host+'&verifypeer=false')
+    elif "nowitlin" in link:
+        ua="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/137.0.0.0 Safari/537.36"
+        host="https://www.nowtv.it"
+        liz.setProperty('inputstream.adaptive.stream_headers', 'User-Agent='+ua+'&Referer='+host+'/&Origin='+host+'&verifypeer=false')
+        liz.setProperty('inputstream.adaptive.manifest_headers', 'User-Agent='+ua+'&Referer='+host+'/&Origin='+host+'&verifypeer=false')
+    elif "vodafone.pt" in link:
+        ua="Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:134.0) Gecko/20100101 Firefox/134.0"
+        host="http://rr.cdn.vodafone.pt"
+        liz.setProperty('inputstream.adaptive.stream_headers', 'User-Agent='+ua+'&Referer='+host+'/&Origin='+host+'&verifypeer=false')
+        liz.setProperty('inputstream.adaptive.manifest_headers', 'User-Agent='+ua+'&Referer='+host+'/&Origin='+host+'&verifypeer=false')
+    elif "clarovideo.com" in link:
+        ua=myParse.quote_plus("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36 OPR/124.0.0.0")
+        host="https://clarovideo.com"
+        liz.setProperty('inputstream.adaptive.stream_headers', 'User-Agent='+ua+'&Referer='+host+'/&Origin='+host+'&verifypeer=false')
+        liz.setProperty('inputstream.adaptive.manifest_headers', 'User-Agent='+ua+'&Referer='+host+'/&Origin='+host+'&verifypeer=false')
+    elif "starzplayarabia" in link:
+        liz.setProperty('inputstream.adaptive.stream_headers', 'User-Agent='+ua+'&verifypeer=false')
+        liz.setProperty('inputstream.adaptive.manifest_headers', 'User-Agent='+ua+'&verifypeer=false')
+    else:
+        arrF=link.split("/")
+        host="https://"+arrF[2]
+        liz.setProperty('inputstream.adaptive.stream_headers', 'User-Agent='+ua+'&Referer='+host+'/&Origin='+host+'&verifypeer=false')
+        liz.setProperty('inputstream.adaptive.manifest_headers', 'User-Agent='+ua+'&Referer='+host+'/&Origin='+host+'&verifypeer=false')
+    if token != "":
+        liz.setProperty('inputstream.adaptive.stream_headers', 'User-Agent='+ua+'&Referer='+host+'/&Origin='+host+'&verifypeer=false') 
+    return liz
+
+def daznToken(parIn):
+    import base64
+    drmType="org.w3.clearkey"
+    parametro=base64.b64decode(fix_base64_padding(parIn)).decode("utf-8")
+    arrTmp=parametro.split("|")
+    link=arrTmp[0]
+    key=arrTmp[1]
+    token=arrTmp[2]
+    ua=myParse.quote_plus("Mozilla/5.0 (X11; Linux x86_64; rv:144.0) Gecko/20100101 Firefox/144.0")
+    try:
+        ua=arrTmp[3]
+    except:
+        pass
+    
+    liz = xbmcgui.ListItem(path=link, offscreen=True)
+    liz.setContentLookup(False)
+    liz.setProperty('inputstream', 'inputstream.adaptive')
+    liz.setProperty('inputstream.adaptive.drm_legacy', drmType+'|'+key)
+    liz.setProperty('inputstream.adaptive.stream_headers', "dazn-token="+token+"&User-Agent="+ua)
+    liz.setProperty('inputstream.adaptive.manifest_headers', "dazn-token="+token+"&User-Agent="+ua)
+    
+    return liz
+
+def amstaff(parIn):
+    import base64, urllib.parse
+    headers = dict()
+    headers["User-Agent"] = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36"
+    headers['Referer'] = "https://amstaff.city/"
+    headers['Origin'] = "https://amstaff.city"
+    parHead=urllib.parse.urlencode(headers)
+    logga("AMSTAFF_HEAD: "+parHead)
+
+
+    phd="Referer=https://amstaff.city/&Origin=https://amstaff.city&User-Agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36"
+    arrT=parIn.split("|")
+    link=arrT[0]
+    key=arrT[1]
+    b64_string = key
+    #b64_string += "=" * ((4 - len(b64_string) % 4) % 4)
+    key64=base64.b64decode(b64_string).decode("utf-8").replace("{","").replace("}","").replace('"',"")
+    logga("AMSTAFF64: "+key64)
+    liz = xbmcgui.ListItem('Amstaff', path=link)
+    liz.setMimeType('application/dash+xml')
+    liz.setContentLookup(False)
+    liz.setProperty('inputstream', 'inputstream.adaptive')
+    liz.setProperty('inputstream.adaptive.file_type', 'mpd')
+    liz.setProperty('inputstream.adaptive.license_type', 'clearkey')
+    liz.setProperty('inputstream.adaptive.license_key', key64)
+    liz.setProperty('inputstream.adaptive.stream_headers', phd)
+    liz.setProperty('inputstream.adaptive.manifest_headers', phd)
+    return liz
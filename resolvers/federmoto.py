@@ -0,0 +1,198 @@
+from __future__ import unicode_literals # turns everything to unicode
+# Module: resolvers.federmoto
+# Author: ElSupremo
+# Created on: 17.10.2026
+# Last update: 17.10.2026
+# License: GPL v.3 https://www.gnu.org/copyleft/gpl.html
+
+import requests
+
+from myResolver import logga, Listing
+
+
+class FedermotoAPI:
+    BASE_URL = "https://api.federmoto.tv/api/v1/it"
+    FANART = "https://www.stadiotardini.it/wp-content/uploads/2016/12/mandrakata.jpg"
+
+    def __init__(self, timeout=15):
+        self.timeout = timeout
+        self.headers = {
+            "Accept": "application/json",
+            "User-Agent": "Kodi-FedermotoTV"
+        }
+
+    def _get(self, url):
+        r = requests.get(url, headers=self.headers, timeout=self.timeout)
+        r.raise_for_status()
+        return r.json()
+
+    # ---------------------------------------------------
+    # 1) SPORTS
+    # ---------------------------------------------------
+    def getSports(self):
+        url = f"{self.BASE_URL}/sports"
+        data = self._get(url)
+        
+        items = []
+        for sport in data.get("data", []):
+            items.append({
+                "title": f"[COLOR lime]{sport.get('name')}[/COLOR]",
+                "thumbnail": sport.get("thumb"),
+                "fanart": self.FANART,
+                "myresolve": f"mototv@@1__{sport.get('id')}"
+            })
+
+        return {
+            "SetViewMode": "500",
+            "items": items
+        }
+
+    # ---------------------------------------------------
+    # 2) CATEGORIES BY SPORT
+    # ---------------------------------------------------
+    def getCategories(self, id_sport):
+        url = f"{self.BASE_URL}/sport/{id_sport}/categories"
+        data = self._get(url)
+
+        items = []
+        for cat in data.get("data", []):
+            items.append({
+                "title": f"[COLOR lime]{cat.get('name_category')}[/COLOR]",
+                "thumbnail": cat.get("logo"),
+                "fanart": self.FANART,
+                "myresolve": f"mototv@@2__{id_sport}__{cat.get('id_category')}__0"
+            })
+
+        return {
+            "SetViewMode": "500",
+            "items": items
+        }
+
+    # ---------------------------------------------------
+    # 3) CONTENT LIST
+    # ---------------------------------------------------
+    def getContentList(self, id_sport, id_category, offset=0):
+        url = (
+            f"{self.BASE_URL}/list?"
+            f"sport={id_sport}&category={id_category}"
+            f"&offset={offset}&status=finished&order=date.desc"
+        )
+
+        data = self._get(url)
+
+        items = []
+        widgets = data.get("data", {}).get("widgets", [])
+        for widget in widgets:
+            for content in widget.get("items", []):
+                items.append({
+                    "title": f"[COLOR lime]{content.get('title')}[/COLOR]",
+                    "thumbnail": content.get("image"),
+                    "fanart": self.FANART,
+                    "myresolve": f"mototv@@3__{content.get('id')}"
+                })
+        
+        # -----------------------------
+        # PAGINAZIONE (NEXT PAGE)
+        # -----------------------------
+        has_next = data.get("data", {}).get("continue", False)
+
+        if has_next:
+            next_offset = str(int(offset) + len(items))
+
+            items.append({
+                "title": "[COLOR yellow]>> Pagina successiva[/COLOR]",
+                "thumbnail": "",
+                "fanart": self.FANART,
+                "myresolve": (
+                    f"mototv@@2__{id_sport}"
+                    f"__{id_category}"
+                    f"__{next_offset}"
+                )
+            })
+
+        return {
+            "SetViewMode": "50",
+            "items": items
+        }
+
+    # ---------------------------------------------------
+    # 4) CONTENT DETAIL (HLS)
+    # ---------------------------------------------------
+    def getContent(self, id_content):
+        url = f"{self.BASE_URL}/content/{id_content}"
+
+        try:
+            data = self._get(url)
+        except Exception:
+            return {
+                "items": [{
+                    "title": "[COLOR red]Errore di rete[/COLOR]",
+                    "thumbnail": "",
+                    "fanart": self.FANART,
+                    "link": ""
+                }]
+            }
+
+        # -----------------------------
+        # ACCESS DENIED / NOT FREE
+        # -----------------------------
+        if not data.get("success") or not data.get("data") or data.get("success")==False:
+            error_msg = "Contenuto non disponibile"
+
+            errors = data.get("errors", [])
+            if errors:
+                error_msg = errors[0].get("message", error_msg)
+
+            return {
+                "items": [{
+                    "title": f"[COLOR red]{error_msg}[/COLOR]",
+                    "thumbnail": "",
+                    "fanart": self.FANART,
+                    "link": ""
+                }]
+            }
+
+        # -----------------------------
+        # CONTENT OK
+        # -----------------------------
+        content = data["data"]
+        videos = content.get("videos", [])
+
+        hls = None
+        if videos:
+            hls = videos[0].get("hls")
+
+        return {
+            "SetViewMode": "50",
+            "items": [{
+                "title": f"[COLOR lime]{content.get('title')}[/COLOR]",
+                "thumbnail": content.get("preview_img"),
+                "fanart": self.FANART,
+                "link": hls
+            }]
+        }
+
+def mototv(parIn):
+    mode=0
+    arrPar=parIn.split("__")
+    mode=arrPar[0]
+    logga("MODE ==> "+mode)
+    api = FedermotoAPI()
+    ret={}
+    if mode == "0":
+        ret=api.getSports()
+    if mode == "1":
+        par1=arrPar[1]
+        ret=api.getCategories(par1)
+    if mode == "2":
+        par1=arrPar[1]
+        par2=arrPar[2]
+        par3=arrPar[3]
+        ret=api.getContentList(par1, par2, par3)
+    if mode == "3":
+        par1=arrPar[1]
+        ret=api.getContent(par1)
+    
+    
+    logga("SPORT ==> %s", ret)
+    return Listing.fromJson(ret)
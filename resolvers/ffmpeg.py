@@ -0,0 +1,142 @@
+from __future__ import unicode_literals # turns everything to unicode
+# Module: resolvers.ffmpeg
+# Author: ElSupremo
+# Created on: 17.10.2026
+# Last update: 17.10.2026
+# License: GPL v.3 https://www.gnu.org/copyleft/gpl.html
+
+import requests
+
+import xbmcgui
+
+from myResolver import logga, preg_match, settings, PY3
+
+
+def antenaCode(codeIn=None):
+    import re
+    video_urls = []
+    randomUa="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/101.0.4951.64 Safari/537.36"
+    randomUa="Mozilla/5.0 (iPad; CPU OS 133 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Mobile/15E148"
+    link="https://webufffit.mizhls.ru/lb/prima"+codeIn+"/index.m3u8"
+    refe="https://1qwebplay.xyz/"
+    origin="https://1qwebplay.xyz"
+    
+    final_url=link+"|Referer="+refe+"&Origin="+origin+"&Connection=keep-alive&User-Agent="+randomUa
+        
+    video_urls.append((final_url, "[COLOR lime]PLAY STREAM "+codeIn+"[/COLOR]", "PLAY: "+codeIn, "https://www.businessmagazine.org/wp-content/uploads/2023/05/Daddylive-Alternative-2022.png"))
+    return video_urls
+
+def antena(parIn=None):
+    img="https://static.vecteezy.com/system/resources/previews/018/842/688/non_2x/realistic-play-button-video-player-and-streaming-icon-live-stream-3d-render-illustration-free-png.png"
+    video_urls = []
+    logga('PAR_ANTENA: '+parIn)
+    page_data = requests.get(parIn,headers={'user-agent':'Mozilla/5.0','accept':'*/*','Referer':'https://antenasports.ru/'}).content
+    if PY3:
+        page_data = page_data.decode('utf-8')
+    iframe_url = preg_match(page_data, r'iframe\s*src="([^"]+)')
+    logga('IFRAME ANTENA: '+iframe_url)
+    
+    arrL=iframe_url.split("=")
+    idCh=arrL[1]
+    logga('IDCH ANTENA: '+idCh)
+    
+    randomUa="Mozilla/5.0 (iPad; CPU OS 133 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Mobile/15E148"
+    link="https://webufffit.mizhls.ru/lb/"+idCh+"/index.m3u8"
+    refe="https://1qwebplay.xyz/"
+    origin="https://1qwebplay.xyz"
+    
+    final_url=link+"|Referer="+refe+"&Origin="+origin+"&Connection=keep-alive&User-Agent="+randomUa
+    
+    liz = xbmcgui.ListItem('AntenaSport', path=final_url)
+    liz.setProperty('inputstream', 'inputstream.ffmpegdirect')
+    liz.setMimeType('application/x-mpegURL')
+    liz.setProperty('inputstream.ffmpegdirect.manifest_type', 'hls')
+    liz.setProperty('inputstream.ffmpegdirect.is_realtime_stream', 'true')
+    timeShift = settings.get("urlAppo4")
+    if timeShift != "no_time_shift":
+        liz.setProperty('inputstream.ffmpegdirect.stream_mode', 'timeshift')
+    
+    
+    return liz
+
+def huhu(parIn=None):
+    link="https://huhu.to/play/"+parIn+"/index.m3u8"
+    liz = xbmcgui.ListItem(path=link, offscreen=True)
+    liz.setContentLookup(False)
+    liz.setProperty('inputstream', 'inputstream.adaptive')
+    liz.setMimeType("application/x-mpegURL")
+    liz.setProperty('inputstream.adaptive.file_type', 'hls')
+    ua="Mozilla/5.0 (X11; Linux armv7l) AppleWebKit/537.36 (KHTML, like Gecko) QtWebEngine/5.9.7 Chrome/56.0.2924.122 Safari/537.36 Sky_STB_ST412_2018/1.0.0 (Sky, EM150UK,)"
+    host="https://huhu.to"
+    liz.setProperty('inputstream.adaptive.stream_headers', 'User-Agent='+ua+'&Referer='+host+'/&Origin='+host)
+    liz.setProperty('inputstream.adaptive.manifest_headers', 'User-Agent='+ua+'&Referer='+host+'/&Origin='+host)
+    return liz
+
+def sky(parIn=None):
+    link="https://calcionew.kiko2.ru/calcio/calcioX2"+parIn+"/mono.m3u8"
+    liz = xbmcgui.ListItem(path=link, offscreen=True)
+    liz.setContentLookup(False)
+    liz.setProperty('inputstream', 'inputstream.adaptive')
+    liz.setMimeType("application/x-mpegURL")
+    liz.setProperty('inputstream.adaptive.file_type', 'hls')
+    ua="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36 OPR/116.0.0.0"
+    host="https://4kwebplay.xyz"
+    liz.setProperty('inputstream.adaptive.stream_headers', 'User-Agent='+ua+'&Referer='+host+'/&Origin='+host)
+    liz.setProperty('inputstream.adaptive.manifest_headers', 'User-Agent='+ua+'&Referer='+host+'/&Origin='+host)
+    return liz
+
+def koolto(parIn=None):
+    video_urls = []
+    logga('PAR_KOOL: '+parIn)
+    final_url = "https://www.kool.to/play/"+parIn+"/index.m3u8|Referer=https://www.kool.to/&Origin=https://www.kool.to&Connection=keep-alive&User-Agent=ipad"
+    video_urls.append((final_url, "[COLOR lime]PLAY STREAM [/COLOR]", "by @MandraKodi", "https://i.imgur.com/8EL6mr3.png"))
+    
+    final_url = "https://oha.to/play/"+parIn+"/index.m3u8|Referer=https://oha.to/&Origin=https://oha.to&Connection=keep-alive&User-Agent=ipad"
+    video_urls.append((final_url, "[COLOR gold]PLAY STREAM [/COLOR]", "by @MandraKodi", "https://i.imgur.com/8EL6mr3.png"))
+    
+    final_url = "https://vavoo.to/play/"+parIn+"/index.m3u8|Referer=https://vavoo.to/&Origin=https://vavoo.to&Connection=keep-alive&User-Agent=ipad"
+    video_urls.append((final_url, "[COLOR blue]PLAY STREAM [/COLOR]", "by @MandraKodi", "https://i.imgur.com/8EL6mr3.png"))
+    
+    final_url = "https://huhu.to/play/"+parIn+"/index.m3u8|Referer=https://huhu.to/&Origin=https://huhu.to&Connection=keep-alive&User-Agent=ipad"
+    video_urls.append((final_url, "[COLOR orange]PLAY STREAM [/COLOR]", "by @MandraKodi", "https://i.imgur.com/8EL6mr3.png"))
+    
+    return video_urls
+
+def ffmpeg(link=None):
+    randomUa="Mozilla/5.0 (iPad; CPU OS 133 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Mobile/15E148"
+    arrT=link.split("/")
+    
+    refe=arrT[0]+"//"+arrT[2]+"/"
+    origin=arrT[0]+"//"+arrT[2]
+    if "|" in link:
+        final_url=link
+    else:    
+        final_url=link+"|Referer="+refe+"&Origin="+origin+"&Connection=keep-alive&User-Agent="+randomUa
+    
+    liz = xbmcgui.ListItem('FfMpeg', path=final_url)
+    liz.setProperty('inputstream', 'inputstream.ffmpegdirect')
+    liz.setMimeType('application/x-mpegURL')
+    liz.setProperty('inputstream.ffmpegdirect.manifest_type', 'hls')
+    liz.setProperty('inputstream.ffmpegdirect.is_realtime_stream', 'true')
+    timeShift = settings.get("urlAppo4")
+    if timeShift != "no_time_shift":
+        liz.setProperty('inputstream.ffmpegdirect.stream_mode', 'timeshift')
+    
+    
+    return liz
+
+def ffmpeg_noRef(link=None):
+    liz = xbmcgui.ListItem('FfMpeg', path=link)
+    liz.setProperty('inputstream', 'inputstream.ffmpegdirect')
+    liz.setProperty('inputstream.ffmpegdirect.is_realtime_stream', 'true')
+    if "|" in link:
+        arrL=link.split("|")
+        ref=arrL[1]
+        liz.setProperty('inputstream.ffmpegdirect.stream_headers', ref)
+    
+    timeShift = settings.get("urlAppo4")
+    if timeShift != "no_time_shift":
+        liz.setProperty('inputstream.ffmpegdirect.stream_mode', 'timeshift')
+    
+    
+    return liz
@@ -0,0 +1,763 @@
+from __future__ import unicode_literals # turns everything to unicode
+# Module: resolvers.hosters
+# Author: ElSupremo
+# Created on: 17.10.2026
+# Last update: 17.10.2026
+# License: GPL v.3 https://www.gnu.org/copyleft/gpl.html
+
+import re, requests
+
+import xbmcgui
+
+from myResolver import logga, downloadHttpPage, find_single_match, find_multiple_matches, get_domain_from_url, preg_match, PY3, myParse, xbmcvfs
+from resolvers.useragents import getRandomUA
+from resolvers.daddy import daddyFind
+
+
+def girc(page_data, url, co, size='invisible'):
+    """
+    Code adapted from https://github.com/vb6rocod/utils/
+    Copyright (C) 2019 vb6rocod
+    and https://github.com/addon-lab/addon-lab_resolver_Project
+    Copyright (C) 2021 ADDON-LAB, KAR10S
+    """
+    import re, random, string
+    
+    hdrs = {'Referer': url}
+    rurl = 'https://www.google.com/recaptcha/api.js'
+    aurl = 'https://www.google.com/recaptcha/api2'
+    key = re.search(r"""(?:src="{0}\?.*?render|data-sitekey)=['"]?([^"']+)""".format(rurl), page_data)
+    if key:
+        key = key.group(1)
+        # rurl = '{0}?render={1}'.format(rurl, key)
+        page_data1 = downloadHttpPage(rurl, headers=hdrs)
+        v = re.findall('releases/([^/]+)', page_data1)[0]
+        rdata = {'ar': 1,
+                 'k': key,
+                 'co': co,
+                 'hl': 'it',
+                 'v': v,
+                 'size': size,
+                 'sa': 'submit',
+                 'cb': ''.join([random.choice(string.ascii_lowercase + string.digits) for i in range(12)])}
+        page_data2 = downloadHttpPage('{0}/anchor?{1}'.format(aurl, myParse.urlencode(rdata)), headers=hdrs)
+        rtoken = re.search('recaptcha-token.+?="([^"]+)', page_data2)
+        if rtoken:
+            rtoken = rtoken.group(1)
+        else:
+            return ''
+        pdata = {'v': v,
+                 'reason': 'q',
+                 'k': key,
+                 'c': rtoken,
+                 'sa': '',
+                 'co': co}
+        hdrs.update({'Referer': aurl})
+        page_data3 = downloadHttpPage('{0}/reload?k={1}'.format(aurl, key), post=pdata, headers=hdrs)
+        gtoken = re.search('rresp","([^"]+)', page_data3)
+        if gtoken:
+            return gtoken.group(1)
+
+    return ''
+
+def streamsb(page_url):
+    import base64
+    video_urls = []
+    logga ("PAGE_SB: "+page_url)
+    data = downloadHttpPage(page_url)
+    
+    title="VIDEO"
+    try:
+        title=find_single_match(data, r'<h1 class="(.*?)">(.*?)<\/h1>')[1].replace("Download ", "")
+    except:
+        pass
+
+    dl_url = 'https://{}/dl?op=download_orig&id={}&mode={}&hash={}'
+    
+    host = get_domain_from_url(page_url)
+    logga ("HOST_SB: "+host)
+    
+    #sources = find_multiple_matches(data, r'download_video([^"]+)[^\d]+(\d+)p')
+    sources = find_multiple_matches(data, r"download_video\('(.*?)','(.*?)','(.*?)'\)")
+    
+    if sources:
+        logga ("OK_SOURCE_SB: "+sources[0][0]+" - "+sources[0][1]+" - "+sources[0][2]) 
+        code = sources[0][0]
+        mode = "n"
+        hash = sources[0][2]
+        newUrl=dl_url.format(host, code, mode, hash)
+        logga ("NEW_URL_SB: "+newUrl)
+        data = downloadHttpPage(newUrl)
+        
+        captcha = girc(data, 'https://{0}/'.format(host), base64.b64encode('https://{0}:443'.format(host).encode('utf-8')).decode('utf-8').replace('=', ''))
+        if captcha:
+            logga ("CAPTCHA_SB: "+captcha)
+            hash = find_single_match(data, r'"hash" value="([^"]+)')
+            logga ("HASH_CAPTCHA_SB: "+hash)
+            newUrl2 = dl_url.format(host, code, mode, hash)
+            data = downloadHttpPage(newUrl2, post='op=download_orig&id='+code+'&mode='+mode+'&hash='+hash+'&g-recaptcha-response='+captcha, timeout=10, header={'Referer':newUrl})
+            media_url = find_single_match(data, r'<a href="http(.*?)" class="(.*?)">')
+            if media_url:
+                vUrl="http"+str(media_url[0])
+                video_urls.append([vUrl+"|Referer="+page_url, "[COLOR lime]PLAY "+title+"[/COLOR]"])
+            else:
+                logga ("NO_MEDIA_URL:") 
+        else:
+            logga ("NO_CAPTCHA_SB\n%s", data)
+            media_url = find_single_match(data, r'<a href="http(.*?)" class="(.*?)">')
+            if media_url:
+                vUrl="http"+str(media_url[0])
+                video_urls.append([vUrl+"|Referer="+page_url, "[COLOR gold]PLAY "+title+"[/COLOR]"])
+    else:
+       video_urls.append(["", "[COLOR red]NO LINK FOUND[/COLOR]"])
+       logga ("NO_SOURCE_SB: \n") 
+    return video_urls
+
+def mixdrop(page_url):
+    import jsunpack, ast
+    logga("url=" + page_url)
+    video_urls = []
+    # data = httptools.downloadpage(page_url).data
+    ua='Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/74.0.3729.131 Safari/537.36'
+    data  = downloadHttpPage(page_url, headers={'user-agent':'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/74.0.3729.131 Safari/537.36','referer':page_url})
+    logga("mixdrop: %s", data)
+    packed = preg_match(data, r'(eval.*?)</script>')
+    unpacked = jsunpack.unpack(packed)
+    list_vars=re.findall(r'MDCore\.\w+\s*=\s*"([^"]+)"', unpacked, re.DOTALL)
+    for var in list_vars:
+        if '.mp4' in var:
+            media_url = var
+            break
+        else:
+            media_url = ''
+    if not media_url.startswith('http'):
+        media_url = 'http:%s' % media_url
+    
+    video_urls.append((media_url+"|Referer=https://mixdrop.my/&Origin=https://mixdrop.my&User-Agent="+ua, "[COLOR lime]PLAY STREAM [/COLOR]", "PLAY: MIXDROP", "https://www.businessmagazine.org/wp-content/uploads/2023/05/Daddylive-Alternative-2022.png"))
+    return video_urls
+
+def supervideo(page_url):
+    import jsunpack, ast
+    logga("url=" + page_url)
+    video_urls = []
+    # data = httptools.downloadpage(page_url).data
+    data  = downloadHttpPage(page_url, headers={'user-agent':'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/74.0.3729.131 Safari/537.36','referer':page_url})
+    logga("supervideo: %s", data)
+
+    code_data = find_single_match(data, """<script type=["'].*text/javascript["']>(eval.*)""")
+    if code_data:
+        code = jsunpack.unpack(code_data)
+        logga("unpack: " + code)
+        # corrections
+        if 'file' in code and not '"file"'in code: code = code.replace('file','"file"')
+        if 'label' in code and not '"label"'in code: code = code.replace('label','"label"')
+
+        match = find_single_match(code, r'sources:(\[[^]]+\])')
+        lSrc = ast.literal_eval(match)
+
+        # lQuality = ['360p', '720p', '1080p', '4k'][:len(lSrc)-1]
+        # lQuality.reverse()
+
+        for source in lSrc:
+            quality = source['label'] if 'label' in source else 'auto'
+            tit = source['file'].split('.')[-1] 
+            src =  source['file']
+            arrTmp=src.split(",")
+            newSrc=arrTmp[0]+arrTmp[1]+"/index-v1-a1.m3u8"
+            video_urls.append((newSrc+"|Referer=https://supervideo.tv/&Origin=https://supervideo.tv&User-Agent=iPad", "[COLOR gold]PLAY VIDEO[/COLOR]", tit.replace(".mp4", "")))
+    else:
+        logga ("NO PACKED")
+        matches = find_multiple_matches(data, r'src:\s*"([^"]+)",\s*type:\s*"[^"]+"(?:\s*, res:\s(\d+))?')
+        for url, quality in matches:
+            if url.split('.')[-1] != 'm3u8':
+                video_urls.append([url, url.split('.')[-1] + ' [' + quality + '] [SuperVideo]'])
+            else:
+                video_urls.append([url, url.split('.')[-1]])
+
+    return video_urls
+
+def checkUnpacked(page_in, refe=""):
+    import jsunpack
+    toRet=""
+    myRefe=page_in
+    if refe != "":
+        myRefe=refe
+    logga("checkUnpacked: %s", page_in)
+    fu = downloadHttpPage(page_in, headers={'user-agent':'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/74.0.3729.131 Safari/537.36','referer':myRefe})
+    if fu != "":
+        #logga("RESULT: "+fu)
+        find = ""
+        try:
+            find = re.findall('eval\(function(.+?.+)', fu)[0]
+            unpack = jsunpack.unpack(find)
+            logga('UNPACK: '+unpack)
+            try:
+                toRet = re.findall('src:"([^"]*)',unpack)[0]
+            except:
+                try:
+                    toRet = re.findall('file:"([^"]*)',unpack)[0]
+                except:
+                    try:
+                        toRet = re.findall('src="([^"]*)',unpack)[0]
+                    except:
+                        try:
+                            toRet = re.findall('source:"([^"]*)',unpack)[0]
+                        except:
+                            pass
+            logga('URL_UNPACK '+toRet)
+        except:
+            pass
+    else:
+        logga('LA PAGINA '+page_in+' NON RISPONDE')
+        toRet="NO_PAGE"
+    toRet = 'https:' + toRet if toRet.startswith('//') else toRet
+    return toRet
+
+def decodeProtected(linkIn):
+    headers = {
+        'user-agent': "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/74.0.3729.131 Safari/537.36"
+    }
+    s = requests.Session()
+    page=s.get(linkIn, allow_redirects=False,timeout=20)
+    redir=page.headers["Location"]
+    logga("TROVATO: "+redir+" FROM "+page.url)
+    return redir
+
+def GetLSProData(page_in, refe=None):
+    import jsunpack, time
+
+    logga('page_in %s', page_in)
+    if refe != None:
+        logga('REFER '+refe)
+    
+    c = checkUnpacked(page_in)
+    if c == "NO_PAGE":
+        dialog = xbmcgui.Dialog()
+        mess = 'La pagina '+page_in+' non risponde'
+        dialog.ok("Mandrakodi", mess)
+        return ""
+    if c != "":
+        logga('UNPACKED')
+        return c
+
+    if "streamhide.to" in page_in:
+        logga('URL_STREAMHIDE ')
+        return findM3u8(page_in, page_in)
+
+    headers = {
+        'user-agent': "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/74.0.3729.131 Safari/537.36"
+    }
+    s = requests.Session()
+    r = s.get(page_in, headers=headers) 
+
+    headers = {
+        'user-agent': "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/74.0.3729.131 Safari/537.36"
+    }
+    time.sleep(2)
+    s = requests.Session()
+    page_data = s.get(page_in, headers=headers).content
+
+    #page_data = requests.get(page_in,headers={'user-agent':'iPad','accept':'*/*','referer':refe}).content
+
+    if PY3:
+        try:
+            page_data = page_data.decode('utf-8')
+        except:
+            page_data = page_data.decode('latin1')
+
+    src = preg_match(page_data, '<iframe src="([^"]*)')
+
+    if src == "":
+        src = preg_match(page_data, "<iframe src='([^']*)")
+
+    if src == "": 
+        src = preg_match(page_data, '<iframe width="100%" height="100%" src="([^"]*)')
+
+    if src == "":
+        src = preg_match(page_data, "<iframe allow='encrypted-media' src='([^']*)")
+
+    if src == "":
+        rsx='<iframe width="100%" height="100%" '+"allow='encrypted-media'"+' src="([^"]*)'
+        logga('REGEX: '+rsx)
+        src = preg_match(page_data, rsx)
+
+    if src == "":
+        try:
+            c = re.findall('src="//wigistream.to/embed/([^"]*)',page_data)[0]
+            src = "https://wigistream.to/embed/"+c
+        except:
+            pass
+
+
+    src = 'https:' + src if src.startswith('//') else src
+    logga('GetLSProData_iframe_url '+src)
+
+    if "nopay2.info" in page_in and src.startswith('/ch/'):
+        logga('starlive.xyz ')
+        pageNew="https://nopay2.info"+src
+        fu = requests.get(pageNew, headers={'user-agent':'iPad','referer':page_in}).text
+        find = re.findall("source: '(.*?)'", fu)[0]
+        return find+"|referer=https://nopay.info"+src
+    elif "enigma4k.live" in page_in:
+        logga('enigma4k.live ')
+        return GetLSProData(src, page_in)
+    elif "buzztv" in src:
+        logga('BUZZTV ')
+        return GetLSProData(src)
+    elif "embed" in src and ("tutele1" in page_in or "starlive" in page_in or "elixx" in page_in or "sportsonline" in page_in or "pepperlive" in page_in or "l1l1.to" in page_in or "buzztv" in page_in):
+        logga('iframe_embed for %s', page_in)
+    elif "starlive.xyz" in src:
+        logga('starlive.xyz ')
+        return GetLSProData(src)
+    elif "protectlink.stream" in src:
+        logga('protectlink.stream')
+        newSrc=decodeProtected(src)
+        return resolveMyUrl(newSrc)
+    elif "cloudstream" in src:
+        logga('CLOUDSTREAM')
+        return GetLSProData(src)
+    elif "supervideo.tv" in src:
+        logga('SUPERVIDEO')
+        return supervideo(src)
+    elif "pepperlive" in src or "projectlive" in src:
+        logga('PEPPER/PROJECT')
+        return GetLSProData(src.replace('projectlive', 'pepperlive'))
+    elif "hdmario" in src:
+        logga('HDMARIO')
+        return GetLSProData(src)
+    else:
+        logga('CALL findM3u8 FUNCTION ')
+        return findM3u8(src, page_in)
+
+    fu = requests.get(src, headers={'user-agent':'iPad','referer':page_in}).text
+    try:
+        find = re.findall('eval\(function(.+?.+)', fu)[0]
+        logga('EVAL ==> '+find)
+        unpack = jsunpack.unpack(find)
+        logga('UNPACK ==> '+unpack)
+        c = re.findall('var src="([^"]*)',unpack)[0]
+        return c + '|referer=' + src
+    except:
+        return page_in
+
+def findM3u8(linkIframe, refPage):
+    import time
+    vUrl = ""
+    ua = getRandomUA
+    try:
+        headers = {
+            'user-agent': ua
+        }
+        s = requests.Session()
+        r = s.get(linkIframe, headers=headers) 
+
+        headers = {
+            'user-agent': ua,
+            'referer': refPage
+        }
+        time.sleep(2)
+        s = requests.Session()
+        page_data2 = s.get(linkIframe,headers=headers).content
+
+        if PY3:
+            try:
+                page_data2 = page_data2.decode('utf-8')
+            except:
+                page_data2 = page_data2.decode('latin1')
+
+        
+        
+        video_url = preg_match(page_data2, r'source:\s*"([^"]+)')
+        if video_url == "":
+            video_url = preg_match(page_data2, r"source:\s*'([^']+)")
+        if video_url == "":
+            express1 = r'file:"(.*?)"'
+            video_url = preg_match(page_data2, express1)
+        if video_url != "":
+            vUrl = video_url + '|connection=keepalive&User-Agent='+myParse.quote(ua)+'&Referer='+linkIframe
+        logga('video_url '+vUrl)
+
+    except:
+        pass
+
+    return vUrl
+
+def resolveMyUrl(url):
+    try:
+        import resolveurl
+    except:
+        dialog = xbmcgui.Dialog()
+        mess = "Lo script 'script.module.resolveurl' non risulta installato."
+        dialog.ok("Mandrakodi", mess)
+        return url
+
+    xxx_plugins_path = 'special://home/addons/script.module.resolveurl.xxx/resources/plugins/'
+    if xbmcvfs.exists(xxx_plugins_path):
+        resolveurl.add_plugin_dirs(xbmcvfs.translatePath(xxx_plugins_path))
+    logga ("TRY TO RESOLVE "+url)
+    resolved = ""
+    try:
+        hmf = resolveurl.HostedMediaFile(url)
+        if hmf:
+            resolved = hmf.resolve()
+    except:
+        pass
+    if resolved:
+        return resolved
+    else:
+        dialog = xbmcgui.Dialog()
+        mess = "Spiacenti, ResolveUrl non ha trovato il link su "+url
+        dialog.ok("Mandrakodi", mess)
+    return url
+
+def proData(parIn=None, flat=0):
+    video_urls = []
+    logga('PAR: '+parIn)
+    if "supervideo.tv" in parIn or "supervideo.cc" in parIn:
+        logga('CALL SUPERVIDEO')
+        return supervideo(parIn)
+    video_url = GetLSProData(parIn)
+    logga('URL PRODATA: '+video_url)
+    if "sportsonline.ps" in parIn:
+        arrTT=video_url.split("|")
+        ref=arrTT[1]
+        vid=arrTT[0]
+        video_url = vid + "|Referer=https://forgepattern.net&Origin=https://forgepattern.net&User-Agent=Mozilla%2F5.0+%28Windows+NT+10.0%3B+Win64%3B+x64%3B+rv%3A98.0%29+Gecko%2F20100101+Firefox%2F98.0&Keep-Alive=true"
+        #video_url += ref.replace("referer", "&Origin") + "&User-Agent=Mozilla%2F5.0+%28Windows+NT+10.0%3B+Win64%3B+x64%3B+rv%3A98.0%29+Gecko%2F20100101+Firefox%2F98.0&Keep-Alive=true"
+        logga('URL sportsonline: '+video_url)
+    if flat==1:
+        return video_url
+    video_urls.append((video_url, "[COLOR lime]PLAY STREAM [/COLOR]", "by @MandraKodi"))
+    video_urls.append((video_url+"&verifypeer=false", "[COLOR orange]PLAY STREAM 2 [/COLOR]", "by @MandraKodi"))
+    return video_urls
+
+def gaga(linkIn):
+    video_urls = []
+    url=checkUnpacked(linkIn, "https://calcio.events")
+    logga ("URL_GAGA: "+url)
+    video_urls.append((url, "[COLOR lime]PLAY STREAM GAGA[/COLOR]", "by @MandraKodi"))
+    return video_urls
+
+def vudeo(parIn):
+    video_urls = []
+    page_in="https://vudeo.ws/"+parIn+".html"
+    page_data = requests.get(page_in,headers={'user-agent':'iPad','accept':'*/*','referer':page_in}).content
+
+    if PY3:
+        page_data = page_data.decode('utf-8')
+    nf = preg_match(page_data, '<b>File Not Found</b>')
+    if nf != "":
+        img = "https://www.online-tech-tips.com/wp-content/uploads/2019/08/cropped-video-not-found.png"
+        video_urls.append(("ignore", "[COLOR red]VIDEO NOT FOUND[/COLOR]", "Video non trovato", img))
+        return video_urls
+    src = preg_match(page_data, 'sources: \["(.*?)"\]')
+    tit = preg_match(page_data, '<title>(.*?)<\/title>')
+    img = preg_match(page_data, 'poster: "(.*?)"')
+
+    video_urls.append((src+"|referer="+page_in, "[COLOR lime]PLAY VIDEO[/COLOR]", tit.replace("Watch", ""), img))
+    video_urls.append((src+"|referer="+page_in+"&verifypeer=false", "[COLOR orange]PLAY VIDEO[/COLOR]", tit.replace("Watch", ""), img))
+    return video_urls
+
+def voe(parIn):
+    import base64
+    logga('VOE PAGE: '+parIn)
+    page_data = requests.get(parIn,headers={'user-agent':'iPad','accept':'*/*','referer':parIn}).content
+    if PY3:
+        page_data = page_data.decode('utf-8')
+
+    logga ("VOE ==> %s", page_data)
+    tit = preg_match(page_data, '<h1 class="mt-1">(.*?)<span')
+    src = preg_match(page_data, "'hls': '(.*?)'")
+    src1 = preg_match(page_data, "'mp4': '(.*?)'")
+
+    video_urls = []
+    video_urls.append((base64.b64decode(src).decode("utf-8")+"|referer="+parIn, "[COLOR lime]PLAY VIDEO[/COLOR]", tit.replace(".mp4", "")))
+    video_urls.append((base64.b64decode(src1).decode("utf-8")+"|referer="+parIn, "[COLOR gold]PLAY VIDEO[/COLOR]", tit.replace(".mp4", "")))
+    return video_urls
+
+def streamTape(parIn):
+    video_urls = []
+    ppIn = myParse.unquote(parIn)
+    logga('PAR_STAPE: '+ppIn)
+    randomUa=getRandomUA()
+    head={'user-agent':randomUa,'Content-Type':'application/x-www-form-urlencoded','Referer':'https://toonitalia.green/'}
+    page_data = requests.get(ppIn, headers=head).content
+    if PY3:
+        page_data = page_data.decode('utf-8')
+    htmlCodice = preg_match(page_data, r'<\/video><script>(.*?)<\/body>')
+    #iframe_url = preg_match(page_data, r'<div id="videoolink" style="display:none;">(.*?)<\/div>')
+    iframe_url = preg_match(htmlCodice, r'style="display:none;">(.*?)<\/div>')
+    logga('IFRAME: '+iframe_url)
+    if (iframe_url != ""):
+        link1 = iframe_url.split('&token=')
+        linkPre = link1[0];
+        logga('LINK_PRE: '+linkPre)
+        #info = preg_match(page_data, r"<script>document.getElementById\('videoolink'\)(.*?)<\/script>")
+        info1 = preg_match(page_data, r"<script>document.getElementById(.*?)<\/script>")
+        info = info1.split(';')[0]
+        tkn = preg_match(info, r"&token=(.*?)'")
+        #tkn = preg_match(htmlCodice, r"&token=(.*?)'\).substring")
+        linkSplit = linkPre.split("?")[1]
+        info2 = "https://streamta.pe/get_video?"+linkSplit+"&token="+tkn+"&stream=1"
+        logga('LINK_FINAL: '+info2)
+        video_urls.append((info2, ""))
+    else:
+        logga('NO IFRAME')
+        video_urls.append(("ignore", "[COLOR red]NO LINK FOUND[/COLOR]", ppIn))
+    return video_urls
+
+def filemoon(parIn):
+    headers = {
+        'user-agent': "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/74.0.3729.131 Safari/537.36"
+    }
+    s = requests.Session()
+    page = s.get(parIn, headers=headers)
+    link = re.findall('<iframe src="(.*?)" frameborder="0"',page.text)[0]
+    return urlsolver(link)
+
+def uprot(parIn):
+    video_urls = []
+    logga("UPROT URL IN: "+parIn)
+    headers = {
+        "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/74.0.3729.131 Safari/537.36",
+        "Referer": "https://toonita.green/"
+    }
+    s = requests.Session()
+    fu = s.get(parIn, headers=headers)
+    logga("UPROT TEXT: %s", fu.text)
+    video_url = parIn
+    try:
+        fu2=fu.text.replace("\n", "").replace("\r", "").replace("\t", "")
+        find = preg_match(fu2, r'<div id="ad_space">\s*<center><a href="(.*?)"><button')
+        #logga("HTML\n"+fu2+"\n"+find)
+        if "maxstream.video" in find:
+            fu = s.get(find, headers=headers)
+            fu3=fu.text.replace("\n", "").replace("\r", "").replace("\t", "")
+            find2 = preg_match(fu3, r'src="https://maxstream.video/(.*?)" scrolling="no">')
+            #logga("UPROT URL maxstream: "+find2+"\n"+fu3)
+            if find2!="":
+                find=find2
+        return resolveMyUrl(find)
+    except:
+        logga("NO link \n"+fu2)
+        video_urls.append(("ignore", "[COLOR red]NO LINK FOUND[/COLOR]"))	
+        pass
+    return video_urls
+
+def sibNet(parIn=None):
+    video_urls = []
+    
+    #randomUa=getRandomUA()
+    randomUa="iPad"
+    urlP="https://video.sibnet.ru/shell.php?videoid="+parIn
+    dataJson = requests.get(urlP,headers={'user-agent':randomUa,'accept':'*/*','Referer':'https://video.sibnet.ru/','Origin':'https://video.sibnet.ru'}).content
+    
+    if PY3:
+        dataJson = dataJson.decode('Latin-1')
+    
+    logga('SIBNET_CONTENT: %s', dataJson)
+    tito = preg_match(dataJson, "title: '(.*?)',")
+    if tito != None:
+        tito= tito.replace("[B]","").replace("[/B]","").replace("[/COLOR]","")
+        tito= tito.replace("[COLOR lime]","").replace("[COLOR aqua]","").replace("[COLOR gold]","")
+        tito= tito.replace("[COLOR white]","").replace("[COLOR red]","").replace("[COLOR blue]","")
+        tito = "[COLOR lime]"+tito+"[/COLOR]"
+    else:
+        tito = "[COLOR orange]PLAY STREAM[/COLOR]"
+    iframe_url = preg_match(dataJson, 'player.src\(\[\{src: "(.*?)", type')
+    logga('URL SIB: '+iframe_url)
+    if iframe_url != None:
+        iframe_url ="https://video.sibnet.ru"+iframe_url
+    else:
+        iframe_url = "https://static.videezy.com/system/resources/previews/000/039/863/original/Movie-countdown-2.mp4"
+        tito = "[COLOR red]NO LINK FOUND[/COLOR]"
+    video_urls.append((iframe_url+"|Referer=https://video.sibnet.ru/&Origin=https://video.sibnet.ru&User-Agent=iPad", tito , "PLAY VIDEO ", "https://clipart-library.com/image_gallery2/Television-Free-Download-PNG.png"))
+    return video_urls
+
+def hunterjs(parIn):
+    video_urls = []
+    
+    _0xce1e="0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ+/"
+    def duf(d,e,f):
+        g = list(_0xce1e)
+        h = g[0:e]
+        i = g[0:f]
+        d = list(d)[::-1]
+        j = 0
+        for c,b in enumerate(d):
+            if b in h:
+                j = j + h.index(b)*e**c
+    
+        k = ""
+        while j > 0:
+            k = i[j%f] + k
+            j = (j - (j%f))//f
+    
+        return int(k) or 0
+    
+    def hunter(h,u,n,t,e,r):
+        r = "";
+        i = 0
+        while i < len(h):
+            j = 0
+            s = ""
+            while h[i] is not n[e]:
+                s = ''.join([s,h[i]])
+                i = i + 1
+    
+            while j < len(n):
+                s = s.replace(n[j],str(j))
+                j = j + 1
+    
+            r = ''.join([r,''.join(map(chr, [duf(s,e,10) - t]))])
+            i = i + 1
+    
+        return r
+
+
+    logga('HUNTER PAGE: '+parIn)
+    page_data = requests.get(parIn,headers={'user-agent':'iPad','accept':'*/*','referer':parIn}).content
+
+    if PY3:
+        page_data = page_data.decode('utf-8')
+    
+    flatPage = page_data.replace("\n", "").replace("\r", "").replace("\t", "")
+    tit = preg_match(flatPage, '<div id="player"><\/div><script>(.*?)\)\)<\/script>')
+    logga("HUNTER CODE: "+tit)
+    if tit == "":
+        video_urls.append(("ignore", "[COLOR red]NO VIDEO FOUND[/COLOR]"))
+        return video_urls
+    
+    sd=tit.split("(")
+    code = sd[-1]
+    logga("HUNTER CODE2: "+code)
+
+    #code = 'YYmojrWojmWojYjojmmojYaojrWoYProjYaojYjojYYojYaorPaojmmoYarorYjoYarojmrojrjojYjorPPojrrojmWojYaojYjoYaroYWjoYWaoYarojjroYYmojYYojmYojrroYarojYWojYYorPaojjmojmYojrmoYarorYjoYarojYjojmYojrWoYarorrrojYYorPaojYWojYWojrmoYProraYojYYorPaojjmojmYojrmoYWjojjroYYmojrYojYaojrjojrmorPPojmYorYmoYaroYWrojmaojrrojrrojYWojrYorYmoYPjoYPjorPPorPaojrmojrmojmWojmYojYrojYaojrmojmYoYProrPPojYYojrjorPWoYPjojmaojYYojrYoYPjojrrojrYojYjormYoYPjojYWojYYorPaojjmojYYojmWojrYojrroYProjYrormmojrjormWoYWroYPmoYYmojmaojmYojmWojmjojmaojrrorYmoYaroYWroYPWoYPaoYPaoYWmoYWroYPmoYYmojrWojmWojmmojrrojmaorYmoYaroYWroYPWoYPaoYPaoYWmoYWroYPmoYYmojYWorPaojrmojmYojYjojrrorjYojmmorYmoYaroYWroYaWojYWojYYorPaojjmojmYojrmoYWroYPmoYYmorPaojrjojrrojYaoraYojYYorPaojjmorYmoYarojmrorPaojYYojrYojmYoYPmoYYmojYWojYYorPaojjmorjYojYjojYYojmWojYjojmYorYmoYarojrrojrmojrjojmYoYPmoYYmojYrojmWojYrojmYoraWojjmojYWojmYorYmoYaroYaaorPaojYWojYWojYYojmWorPPorPaojrrojmWojYaojYjoYPjojrPoYPYojYrojYWojmYojmjoraPorajorjaoYaaoYPmoYYmojYWojYYojrjojmjojmWojYjojrYorYmoYarojjroYWrorPPojYaojrmojmYoYWrorYmoYarorWWorjaojmYojraojmYojYYoraaojmYojYYojmYorPPojrrojYaojrmorPmojjaoYPmoYYmojYrojmYojmmojmWorPaorPPojYaojYjojrrojrmojYaojYYorYmoYarojjroYYmojrYojmYojmYojYmorPWorPaojrmorYmoYaroYWroYaWoYPaoYPWormYorrmorrWorrWoYWroYPmoYYmorPWojrjojrrojrrojYaojYjojrYorYmoYaroYWroYaWorrWorrWorrWoYWroYYmojjaoYYmojjaoYWaorYYoYYmojjaorYYoYYmojrYojmYojrroraWojmWojYrojmYojYaojrjojrroYWjojmrojrjojYjorPPojrrojmWojYaojYjoYWjoYWaoYarojjroYYmoYaPoYWjoYWroYProjYrojmYojmmojmWorPaoYPYorPPojYaojYjojrrojrmojYaojYYoYPYojYYojmYojmrojrroYPYojYWorPaojYjojmYojYYoYWroYWaorWWoYWrorPaojYWojYWojmYojYjojmmoYWrorPmoYWjoYWrorYrorPWojrjojrrojrrojYaojYjoYarojrYojrrojjmojYYojmYorYjoYaaoYaaoYarojrrojjmojYWojmYorYjoYaaorPWojrjojrrojrrojYaojYjoYaaoYarorPPojYYorPaojrYojrYorYjoYaaojYrojmYojmmojmWorPaoYPYorPPojYaojYjojrrojrmojYaojYYoYPYorPWojrjojrrojrrojYaojYjoYarojYrojmYojmmojmWorPaoYPYorPPojYaojYjojrrojrmojYaojYYoYPYojmWorPPojYaojYjoYarojmYojYjorPaorPWojYYojmYojmmoYaaoYarojmmorPaojrrorPaoYPYojmaojmmoYPYojmWojYjojmmojmWorPPorPaojrrojYaojrmorYjoYaaoYaaoYarorPaojrmojmWorPaoYPYojYYorPaorPWojmYojYYorYjoYaaojmaojmmoYPYojmWojYjojmmojmWorPPorPaojrrojYaojrmoYaaorYaorYrorPaoYarojmaojrmojmYojmrorYjoYaaojmaojrrojrrojYWojrYorYmoYPjoYPjojmjojmWojraojmYojYrojmYojrmojmYojmmojmmojmWojrrojrYojrrojrmojmYorPaojYrojrYoYProjrPojjmojjYoYPjojYjorPWorPaoYaaoYarojrrorPaojrmojmjojmYojrrorYjoYaaorProrPWojYYorPaojYjojYmoYaaorYaorYrojmWojYrojmjoYarojrYojrmorPPorYjoYaaojmaojrrojrrojYWojrYorYmoYPjoYPjojmjojmWojraojmYojYrojmYojrmojmYojmmojmmojmWojrroYProjmYojrjoYPjoYPPoYProjYWojYjojmjoYaaoYarojrWojmWojmmojrrojmaorYjoYaaoYPWormmoYPaojYWojrPoYaaoYarojmaojmYojmWojmjojmaojrrorYjoYaaoYPPoYPaojYWojrPoYaaoYaroYPjorYaorYroYPjorPaorYaorYroYPjorPWojrjojrrojrrojYaojYjorYaoYWroYWaoYYmojjaoYPmoYarormroYPaoYPaoYPaoYWaorYYoYYmo",58,"mYrjaWPoi",47,7,24'
+    code_list = code.split(',')
+    for idx,code in enumerate(code_list):
+        if code.isdigit():
+            code_list[idx] = int(code)
+        else:
+            code_list[idx] = code.replace('\"','')
+    
+    result = hunter(*code_list)
+    logga("HUNTER CODE3: "+result)
+    link = preg_match(result, "source: '(.*?)'")
+    logga("HUNTER LINK: "+link)
+    video_urls.append((link+"|referer="+parIn, "[COLOR lime]PLAY VIDEO[/COLOR]"))
+
+    return video_urls
+
+def urlsolver(url):
+    video_urls = []
+
+    resolvedUrl=get_resolved(url)
+    if isinstance(resolvedUrl, list):
+        for linkTmp in resolvedUrl:
+            logga('video_tmp_url '+''.join(linkTmp))
+            video_urls.append((''.join(linkTmp), "[COLOR gold]PLAY STREAM[/COLOR]"))
+            return video_urls
+    else:
+        logga('video_resolved_url '+resolvedUrl)
+        if (resolvedUrl != url):
+            video_urls.append((resolvedUrl, "[COLOR gold]LINK 1[/COLOR]"))
+            if "|" in resolvedUrl:
+                video_urls.append((resolvedUrl+"&verifypeer=false", "[COLOR lime]LINK 2[/COLOR]"))
+                arrV = resolvedUrl.split("|")
+                linkClean=arrV[0]
+                logga('video_resolved_cleaned '+linkClean)
+                video_urls.append((linkClean, "[COLOR orange]LINK 3[/COLOR]"))		
+            else:
+                randomUa=getRandomUA()
+                final_url = resolvedUrl + "|verifyPeer=false&connection=keepalive&Referer="+url+"&User-Agent="+randomUa
+                video_urls.append((final_url, "[COLOR lime]LINK 2[/COLOR]"))
+            return video_urls
+    
+    return url
+
+def get_resolved(url):
+    resolved = daddyFind(url)
+    if resolved != "" and resolved != url:
+        return resolved
+    else:
+        logga("NO RESOLVER DADDY")		
+
+    resolved = wizhdFind(url)
+    if resolved != "" and resolved != url:
+        return resolved
+    else:
+        logga("NO RESOLVER WIZHD")		
+
+    resolved = assiaFind(url)
+    if resolved != "" and resolved != url:
+        return resolved
+    else:
+        logga("NO RESOLVER ASSIA")		
+
+    resolved = GetLSProData(url)
+    if resolved != "" and resolved != url:
+        return resolved
+    else:
+        logga("NO RESOLVER DATA")		
+
+    return resolveMyUrl(url)
+
+def wizhdFind(parIn):
+    randomUa=getRandomUA()
+    logga('CALL: '+parIn)
+    page_data = requests.get(parIn,headers={'user-agent':randomUa,'accept':'*/*','Referer':'http://wizhdsports.net/'}).content
+    if PY3:
+        try:
+            page_data = page_data.decode('utf-8')
+        except:
+            page_data = page_data.decode('latin1')
+
+    iframe_url = preg_match(page_data, r'iframe\s*src="([^"]+)')
+    logga('IFRAME WIZ: '+iframe_url)
+    if iframe_url.startswith("//"):
+        iframe_url="https:"+iframe_url
+    if "embed" in iframe_url:
+        logga("CALL proData")
+        vUrl = GetLSProData(iframe_url, parIn)+"|connection=keepalive&Referer="+parIn+"&User-Agent="+randomUa
+    else:
+        vUrl = findM3u8(iframe_url, parIn)
+    return vUrl
+
+def wizhd(parIn=None):
+    video_urls = []
+    if parIn.startswith('http'):
+        page_url = parIn
+    else:
+        page_url = "http://wizhdsports.net/"+parIn
+    
+    vUrl = wizhdFind(page_url)
+    video_urls.append((vUrl, ""))
+    if "|" in vUrl:
+        arrV = vUrl.split("|")
+        video_urls.append((arrV[0], ""))		
+
+    return video_urls
+
+def assiaFind(parIn):
+    logga('ASSIA_PAR: '+parIn)
+    randomUa=getRandomUA()
+    page_data = requests.get(parIn,headers={'user-agent':randomUa,'accept':'*/*','Referer':'http://assia1.tv/'}).content
+    if PY3:
+        try:
+            page_data = page_data.decode('utf-8')
+        except:
+            page_data = page_data.decode('latin1')
+    video_url = preg_match(page_data, "source: '(.*?)'")
+    
+    logga('video_url '+video_url)
+    return video_url
+
+def assia(parIn=None):
+    video_urls = []
+    randomUa=getRandomUA()
+    video_url = assiaFind(parIn) + "|connection=keepalive&Referer=http://assia1.tv/&User-Agent="+randomUa
+    video_urls.append((video_url, ""))
+    if "|" in video_url:
+        arrV = video_url.split("|")
+        video_urls.append((arrV[0], ""))		
+    return video_urls
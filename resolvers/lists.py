@@ -0,0 +1,350 @@
+from __future__ import unicode_literals # turns everything to unicode
+# Module: resolvers.lists
+# Author: ElSupremo
+# Created on: 17.10.2026
+# Last update: 17.10.2026
+# License: GPL v.3 https://www.gnu.org/copyleft/gpl.html
+
+import json
+import requests
+from urllib.parse import urljoin
+
+import xbmcgui
+
+import mandraCore
+from myResolver import logga, makeRequest, Listing
+
+
+def m3uPlus(parIn=None):
+    headers = {
+        'user-agent':"ipad"
+    }
+    s = requests.Session()
+        
+    win = xbmcgui.Window(10000)
+    
+    arrIn=parIn.split("_@|@_")
+    mode=arrIn[0]
+    logga("M3UPLUS_MODE: "+mode)
+    listing = Listing("503")
+    if mode=="0":
+        win.setProperty("sessionVar1", parIn)
+        host=arrIn[1]
+        usr=arrIn[2]
+        pwd=arrIn[3]
+        apiUrl="http://"+host+"/player_api.php?username="+usr+"&password="+pwd+"&action=get_live_categories"
+        response = s.get(apiUrl, headers=headers)
+        #logga("M3UPLUS_JSON: "+response.text)
+        
+        lista = response.json()
+        for item in lista:
+            catId = item.get("category_id")
+            name = item.get("category_name")
+            listing.add("[COLOR orange]=*= "+name+" =*=[/COLOR]", myresolve="m3uPlus@@1_@|@_"+name+"_@|@_"+catId,
+                thumbnail="https://static.vecteezy.com/system/resources/thumbnails/065/914/783/small/stylized-3d-rendering-of-a-file-folder-icon-for-data-management-free-png.png",
+                info="by MandraKodi")
+
+    if mode=="1":
+        parSess=win.getProperty("sessionVar1")
+        catId=arrIn[2]
+        arrSess=parSess.split("_@|@_")
+        host=arrSess[1]
+        usr=arrSess[2]
+        pwd=arrSess[3]
+        apiUrl="http://"+host+"/player_api.php?username="+usr+"&password="+pwd+"&action=get_live_streams&category_id="+catId
+        response = s.get(apiUrl, headers=headers)
+
+        lista = response.json()
+        for item in lista:
+            stream_id = item.get("stream_id")
+            linkUrl="http://"+host+"/live/"+usr+"/"+pwd+"/"+str(stream_id)+".ts"
+            name = item.get("name")
+            stream_icon = item.get("stream_icon")
+            listing.add("[COLOR lime]"+name+"[/COLOR]", link=linkUrl+"|!User-Agent=VLC/3.0.9 LibVLC/3.0.9",
+                thumbnail=stream_icon, info="by MandraKodi")
+
+
+    return listing
+
+def macLink(parIn=None):
+    from portal_api import PortalApi
+    arrData = parIn.split("@PAR@")
+    #0==>HOST
+    #1==>MAC
+    #2==>ID_CH
+
+    host=arrData[0]
+    mac=arrData[1]
+    url=host+"?"+mac
+    logga("PORTAL URL: "+url)
+    portal = PortalApi(url)
+    idCh=arrData[2]
+    cmdCh="ffmpeg http://localhost/ch/"+idCh+"_"
+    logga("PORTAL CMD: "+cmdCh)
+    link = portal.get_link(cmdCh)
+    logga("PORTAL LINK: "+link)
+
+    try:
+        link = link.split(" ")[1]
+    except:
+        pass
+
+    video_urls = []
+    video_urls.append((link, "[COLOR gold]PLAY CH "+idCh+"[/COLOR]"))
+    return video_urls
+
+def webcam(parIn):
+    import re
+    listing = Listing("503")
+    arrT=parIn.split('_')
+    mode=arrT[0]
+    page=parIn[2:]
+    urlPage="https://www.skylinewebcams.com/it/"+page+".html";
+    headers = {
+        'user-agent': "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/74.0.3729.131 Safari/537.36"
+    }
+
+    s = requests.Session()
+    r = s.get(urlPage, headers=headers)
+    htmlFlat=r.text.replace("\n", '').replace("\r", '').replace("\t", '')
+    logga("FIND CAM ON "+urlPage)
+    if mode == "0":
+        express1 = r'<a href="it/webcam/(.*?)" class="col-xs-12 col-sm-6 col-md-4">(.*?)</a>'
+        lista = re.compile(express1, re.MULTILINE | re.DOTALL).findall(htmlFlat)
+        
+        listaCam = []
+
+        for (link, tit) in lista:
+            titolo="Cam"
+            express1 = r'<p class="tcam">(.*?)</p>'
+            try:
+                titolo = re.compile(express1, re.MULTILINE | re.DOTALL).findall(tit)[0]
+            except:
+                pass
+            
+            img="https://image.winudf.com/v2/image1/Y29tLm1pY3pvbi5hbmRyb2lkLndlYmNhbWFwcGxpY2F0aW9uX2ljb25fMTU3MjUxMTU1M18wNDU/icon.png?w=512&fakeurl=1"
+            express1 = r'<img src="(.*?)"'
+            try:
+                img = re.compile(express1, re.MULTILINE | re.DOTALL).findall(tit)[0]
+            except:
+                pass
+            
+            info="by MandraKodi"
+            express1 = r'<p class="subt">(.*?)</p>'
+            try:
+                info = re.compile(express1, re.MULTILINE | re.DOTALL).findall(tit)[0]
+            except:
+                pass
+            
+            infoPlus=""
+            express1 = r'<span class="lcam">(.*?)</span>'
+            try:
+                infoPlus = re.compile(express1, re.MULTILINE | re.DOTALL).findall(tit)[0]
+            except:
+                pass
+            
+            strCam=titolo+"@@"+img+"@@"+link+"@@"+info+"@@"+infoPlus
+            listaCam.append(strCam)
+
+        listaCam.sort()
+        for wCam in listaCam:
+            arrWcam=wCam.split("@@")
+            titolo=arrWcam[0]
+            img=arrWcam[1]
+            link=arrWcam[2]
+            info=arrWcam[3]
+            infoPlus=arrWcam[4]
+            infoP=""
+            if infoPlus!="":
+                infoP=" [COLOR lime]("+infoPlus+")[/COLOR]"
+            listing.add("[COLOR gold]"+titolo+"[/COLOR]"+infoP, myresolve="webcam@@1_webcam/"+link.replace(".html", ''),
+                thumbnail=img, info=info)
+    
+    if mode == "1":
+        titolo="Watch Stream"
+        info="by @mandrakodi"
+        infoPlus=""
+        img="https://image.winudf.com/v2/image1/Y29tLm1pY3pvbi5hbmRyb2lkLndlYmNhbWFwcGxpY2F0aW9uX2ljb25fMTU3MjUxMTU1M18wNDU/icon.png?w=512&fakeurl=1"
+
+        express1 = r'<h1>(.*?)</h1>'
+        try:
+            titolo = re.compile(express1, re.MULTILINE | re.DOTALL).findall(htmlFlat)[0].replace("Live webcam", "")
+        except:
+            pass
+
+        express1 = r'<h2>(.*?)</h2>'
+        try:
+            info = re.compile(express1, re.MULTILINE | re.DOTALL).findall(htmlFlat)[0]
+        except:
+            pass
+
+        express1 = r'<meta property="og:description" content="(.*?)"'
+        try:
+            infoPlus = " "+re.compile(express1, re.MULTILINE | re.DOTALL).findall(htmlFlat)[0]
+        except:
+            pass
+
+        express1 = r'<meta property="og:image" content="(.*?)"'
+        try:
+            img = re.compile(express1, re.MULTILINE | re.DOTALL).findall(htmlFlat)[0]
+        except:
+            pass
+        tube=0
+        url1="ignore"
+        express1 = r"source:'(.*?)'"
+        try:
+            url = re.compile(express1, re.MULTILINE | re.DOTALL).findall(htmlFlat)[0]
+            url1 = "https://hd-auth.skylinewebcams.com/"+url.replace("livee", 'live')+"|Referer="+urlPage+"&User-Agent=Mozilla%2F5.0+%28Windows+NT+10.0%3B+Win64%3B+x64%29+AppleWebKit%2F537.36+%28KHTML%2C+like+Gecko%29+Chrome%2F109.0.0.0+Safari%2F537.36"
+        except:
+            pass
+
+        if url1=="ignore":
+            express1 = r"videoId:'(.*?)'"
+            try:
+                url = re.compile(express1, re.MULTILINE | re.DOTALL).findall(htmlFlat)[0]
+                url1 = "https://www.youtube.com/watch?v="+url
+                tube=1
+            except:
+                pass
+
+
+
+
+
+        if tube==0:
+            listing.add("[COLOR gold]"+titolo+"[/COLOR]", link=url1, thumbnail=img, info=info+infoPlus)
+        else:
+            listing.add("[COLOR gold]"+titolo+"[/COLOR]", myresolve="risolvi@@"+url1, thumbnail=img, info=info+infoPlus)
+        
+
+    logga('JSON-WEBCAM: %s', listing.items)
+    return listing
+
+def taxi(parIn):
+    import re
+    listing = Listing("503")
+
+    sc_url="https://raw.githubusercontent.com/mandrakodi/mandrakodi.github.io/main/data/taxi_url.txt"
+    scUrl=makeRequest(sc_url)
+    url=scUrl.replace("\n", '')+"stream/"+parIn
+
+    #url="https://guardaserie.events/serietv/"+parIn+".html"
+    
+    headers = {
+        'user-agent': "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/74.0.3729.131 Safari/537.36"
+    }
+    s = requests.Session()
+    r = s.get(url, headers=headers) 
+
+    headers = {
+        'user-agent': "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/74.0.3729.131 Safari/537.36"
+    }
+
+    s = requests.Session()
+    r = s.get(url, headers=headers)
+    page=r.text.replace("\n", "").replace("\r", "").replace("\t", "")
+    #logga("FIND HOSTS AT "+url+"\n"+page)
+    ret1 = "by @mandrakodi"
+    express1 = r'<title>(.*?)</title>'
+    ret1 = re.compile(express1, re.MULTILINE | re.DOTALL).findall(page)[0]
+
+    express2 = r'<a href="#" allowfullscreen data-link="(.*?)" id="(.*?)" data-num="(.*?)" data-title="(.*?)">\d+</a>(.*?)</li>'
+    ret = re.compile(express2, re.MULTILINE | re.DOTALL).findall(page)
+    for (link, id, ep, tito, mirror) in ret:
+        #express3 = r'<a href="#" class="mr" data-m="dropload" data-link="(.*?)">'
+        #express3 = r'<a href="#" class="mr" data-m="supervideo" data-link="(.*?)">'
+        express3 = r'<a href="#" class="mr" data-link="(.*?)">'
+        ret2 = re.compile(express3, re.MULTILINE | re.DOTALL).findall(mirror)[0]
+        if "supervideo" in ret2: 
+            ret2 = re.compile(express3, re.MULTILINE | re.DOTALL).findall(mirror)[1]
+        link=ret2
+        listing.add("[COLOR lime]"+ep+"[/COLOR]", myresolve="proData@@"+link,
+            thumbnail="https://www.giardiniblog.it/wp-content/uploads/2018/12/serie-tv-streaming.jpg", info=tito)
+
+    if len(listing)==0:
+        listing.add("[COLOR red]NO HOST FOUND[/COLOR]", link="ignore",
+            thumbnail="https://www.giardiniblog.it/wp-content/uploads/2018/12/serie-tv-streaming.jpg", info="NO INFO")
+
+    logga('JSON-TAXI: %s', listing.items)
+    return listing
+
+# radio.json divisa per regione da scripts/generate_radio_shards.py:
+# un indice piccolo per il menu e un file per regione, con l'hash nel nome
+RADIO_BASE = "https://raw.githubusercontent.com/mandrakodi/mandrakodi.github.io/main/data/"
+RADIO_INDEX = RADIO_BASE+"radio/index.json"
+RADIO_FULL = RADIO_BASE+"radio.json"
+RADIO_SHARD_TTL = 30*86400
+RADIO_THUMB = "https://worldlivetv.github.io/images/icons/radio0.png"
+
+def radioIndex():
+    response = mandraCore.fetchCached(RADIO_INDEX)
+    if not response.ok():
+        raise Exception("HTTP "+str(response.status)+" from "+RADIO_INDEX)
+    return json.loads(response.text())
+
+def radioShard(region):
+    # the name changes with the content: a cached shard never needs a revalidation
+    url = urljoin(RADIO_INDEX, region["url"])
+    response = mandraCore.fetchCached(url, ttl=RADIO_SHARD_TTL)
+    if not response.ok():
+        raise Exception("HTTP "+str(response.status)+" from "+url)
+    stations = json.loads(response.text())
+    if mandraCore.groupHash(stations) != region["hash"]:
+        raise Exception("RADIO SHARD CHANGED: "+url)
+    return stations
+
+def radioFull(regionId):
+    # old single file, only when the shards are not reachable
+    try:
+        response = mandraCore.fetchCached(RADIO_FULL)
+        if not response.ok():
+            raise Exception("HTTP "+str(response.status)+" from "+RADIO_FULL)
+        data = json.loads(response.text())
+    except Exception as err:
+        logga("RADIO LIST NOT AVAILABLE: %s", err)
+        return []
+    regions = {}
+    for entry in data.get("radio", []):
+        for station in (entry if isinstance(entry, list) else [entry]):
+            regions.setdefault(station.get("GroupId", ""), []).append(station)
+    if regionId is None:
+        return [{"id": key, "name": val[0].get("GroupName", key), "count": len(val)} for key, val in regions.items()]
+    return regions.get(regionId, [])
+
+def radio(parIn=None):
+    # 0 = regions menu, 1_@|@_<GroupId> = stations of one region
+    arrIn=(parIn or "0").split("_@|@_")
+    mode=arrIn[0]
+    listing = Listing("503")
+    try:
+        index = radioIndex()
+        regions = index.get("regions", [])
+    except Exception as err:
+        logga("RADIO INDEX NOT AVAILABLE: %s", err)
+        index = None
+        regions = radioFull(None)
+
+    regionId = ""
+    if mode=="0" or len(arrIn) < 2:
+        for region in regions:
+            listing.add("[COLOR orange]=*= "+region["name"]+" =*=[/COLOR]", myresolve="radio@@1_@|@_"+region["id"],
+                thumbnail=RADIO_THUMB, info=str(region["count"])+" radio")
+    else:
+        regionId=arrIn[1]
+        stations = []
+        for region in regions:
+            if region["id"] == regionId:
+                try:
+                    stations = radioShard(region) if index is not None else radioFull(regionId)
+                except Exception as err:
+                    logga("RADIO SHARD NOT AVAILABLE: %s", err)
+                    stations = radioFull(regionId)
+                break
+        for station in stations:
+            listing.add(station.get("Name", ""), link=station.get("StreamUrl", ""),
+                thumbnail=station.get("TvgLogo") or RADIO_THUMB, info=station.get("GroupName", ""))
+
+    if len(listing)==0:
+        listing.add("[COLOR red]NO RADIO FOUND[/COLOR]", link="ignore", thumbnail=RADIO_THUMB, info="NO INFO")
+    logga('RADIO %s: %s stations', regionId, len(listing))
+    return listing
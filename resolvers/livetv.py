@@ -0,0 +1,809 @@
+from __future__ import unicode_literals # turns everything to unicode
+# Module: resolvers.livetv
+# Author: ElSupremo
+# Created on: 17.10.2026
+# Last update: 17.10.2026
+# License: GPL v.3 https://www.gnu.org/copyleft/gpl.html
+
+import re, requests, uuid, os
+
+import xbmcgui
+import xbmc
+
+from myResolver import logga, downloadHttpPage, msgBox, preg_match, makeRequest, settings, PY3, myParse, xbmcvfs, versione, Listing
+from resolvers.useragents import getRandomUA
+from resolvers.hosters import GetLSProData, findM3u8, resolveMyUrl, urlsolver
+
+
+def skyTV(parIn=None):
+    links = []
+    requrl = "https://apid.sky.it/vdp/v1/getLivestream?id={}&isMobile=false".format(parIn)
+    url = requests.get(requrl).json()["streaming_url"]
+    links.append((url, "[COLOR gold]PLAY SKY CH[/COLOR]"))
+    return links
+
+def discovery(parIn=None):
+    import uuid
+    links = []
+    host = "https://www.discoveryplus.com"
+    deviceId = uuid.uuid4().hex
+    logga("URL DEVICEID 4 DISCOVERY: "+deviceId)
+    session = requests.Session()
+    domain = 'https://' + session.get("https://prod-realmservice.mercury.dnitv.com/realm-config/www.discoveryplus.com%2Fit%2Fepg").json()["domain"]
+    urlTk='{}/token?deviceId={}&realm=dplay&shortlived=true'.format(domain, deviceId)
+    logga("URL TOKEN DISCOVERY: "+urlTk)
+    token = session.get(urlTk).json()['data']['attributes']['token']
+    session.headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            'Referer': host,
+            'Origin': host,
+            'Cookie': 'st={}'.format(token),
+            'content-type': 'application/json',
+            'x-disco-client': 'WEB:UNKNOWN:dplus_us:2.46.0',
+            'x-disco-params': 'realm=dplay,siteLookupKey=dplus_it'}
+    content = 'channel'
+    #post = {content + 'Id': parIn, 'deviceInfo': {'adBlocker': False,'drmSupported': True}}
+
+    post =  {content + 'Id': parIn,
+            'deviceInfo': {
+                'adBlocker': 'true',
+                'drmSupported': 'true',
+                'hwDecodingCapabilities': [],
+                'screen':{
+                    'width':1920,
+                    'height':1080
+                },
+                'player':{
+                    'width':1920,
+                    'height':1080
+                }
+            },
+            'wisteriaProperties':{
+                'advertiser': {
+                    'firstPlay': 0,
+                    'fwIsLat': 0
+                },
+                'device':{
+                    'browser':{
+                        'name': 'chrome',
+                        'version': '120.0.6099.225'
+                    },
+                    'type': 'desktop'
+                },
+                'platform': 'desktop',
+                'product': 'dplus_emea',
+                'sessionId': deviceId,
+                'streamProvider': {
+                    'suspendBeaconing': 0,
+                    'hlsVersion': 6,
+                    'pingConfig': 1
+                }
+            }
+        }
+
+    url = ""
+    dataStr = "NO_DATA"
+    try:
+        dataStr = session.post('{}/playback/v3/{}PlaybackInfo'.format(domain, content), json=post)
+        data = dataStr.json().get('data',{}).get('attributes',{})
+        url = data['streaming'][0]['url']
+    except:
+        logga("ERRORE DISCOVERY: %s", dataStr)
+        pass
+    links.append((url, "[COLOR gold]PLAY DISCOVERY[/COLOR]"))
+    return links
+
+def rocktalk(parIn=None):
+    from base64 import b64encode, b64decode
+    from binascii import a2b_hex
+    from Cryptodome.Cipher import PKCS1_v1_5 as Cipher_PKCS1_v1_5
+    from Cryptodome.Cipher import DES
+    from Cryptodome.PublicKey import RSA
+    from Cryptodome.Util.Padding import unpad
+    import json
+
+    def payload():
+        _pubkey = RSA.importKey(
+            a2b_hex(
+                "30819f300d06092a864886f70d010101050003818d003081890281"
+                "8100bfa5514aa0550688ffde568fd95ac9130fcdd8825bdecc46f1"
+                "8f6c6b440c3685cc52ca03111509e262dba482d80e977a938493ae"
+                "aa716818efe41b84e71a0d84cc64ad902e46dbea2ec61071958826"
+                "4093e20afc589685c08f2d2ae70310b92c04f9b4c27d79c8b5dbb9"
+                "bd8f2003ab6a251d25f40df08b1c1588a4380a1ce8030203010001"
+            )
+        )
+        _msg = a2b_hex(
+            "7b224d4435223a22695757786f45684237686167747948392b58563052513d3d5c6e222c22534"
+            "84131223a2242577761737941713841327678435c2f5450594a74434a4a544a66593d5c6e227d"
+        )
+        cipher = Cipher_PKCS1_v1_5.new(_pubkey)
+        ret64=b64encode(cipher.encrypt(_msg))
+        logga('JSON PAYLOAD: %s', ret64)
+        return ret64
+
+    logga('TVTAP PARIN: '+parIn)
+    links = []
+    
+    player_user_agent = "mediaPlayerhttp/1.8 (Linux;Android 7.1.2) ExoPlayerLib/2.5.3"
+    key = b"98221122"
+    user_agent = 'USER-AGENT-tvtap-APP-V2'
+    if parIn=="0":
+        headers = {
+            'User-Agent': user_agent,
+            'app-token': '37a6259cc0c1dae299a7866489dff0bd',
+            'Content-Type': 'application/x-www-form-urlencoded; charset=UTF-8',
+            'Host': 'taptube.net',
+        }
+        
+        r = requests.post('https://rocktalk.net/tv/index.php?case=get_all_channels', headers=headers, data={"payload": payload(), "username": "603803577"}, timeout=15)
+        jj=str(r.json())
+        logga('JSON ALL_CH: '+jj.replace("'", '"'))
+
+        jsonText='{"SetViewMode":"503","items":['
+        numIt=0
+        arrJ = json.loads(jj)
+        for ep in arrJ["msg"]["channels"]:
+            chId=ep["pk_id"]
+            chName=ep["channel_name"]
+            chCountry=ep["country"]
+            logoCh=ep["img"]
+            tit=chName+" ("+chCountry+")"
+            if (numIt > 0):
+                jsonText = jsonText + ','    
+            jsonText = jsonText + '{"title":"[COLOR gold]'+tit+'[/COLOR]","myresolve":"rocktalk@@'+chId+'",'
+            jsonText = jsonText + '"thumbnail":"https://rocktalk.net/tv/'+logoCh+'",'
+            jsonText = jsonText + '"fanart":"https://www.stadiotardini.it/wp-content/uploads/2016/12/mandrakata.jpg",'
+            jsonText = jsonText + '"info":"by MandraKodi"}'
+            numIt=numIt+1
+        
+        jsonText = jsonText + "]}"
+        logga('JSON-ANY: %s', jsonText)
+        links.append((jsonText, "PLAY VIDEO", "No info", "noThumb", "json"))
+
+        
+        #links.append(("ignoreme", "[COLOR gold]END JOB[/COLOR]"))
+        return links
+
+    ch_id = parIn
+    
+    r = requests.post('https://rocktalk.net/tv/index.php?case=get_channel_link_with_token_latest', 
+        headers={"app-token": "37a6259cc0c1dae299a7866489dff0bd"},
+        data={"payload": payload(), "channel_id": ch_id, "username": "603803577"},
+        timeout=15)
+
+    logga('JSON TVTAP: %s', r.json())
+    msgRes = r.json()["msg"]
+    if msgRes == "Invalid request!":
+        links.append(("ignoreme", "[COLOR red]No Link Found[/COLOR]"))
+        return links
+    
+    from pyDes import des, PAD_PKCS5
+    
+    jch = r.json()["msg"]["channel"][0]
+    for stream in jch.keys():
+        if "stream" in stream or "chrome_cast" in stream:
+            d = des(key)
+            link = d.decrypt(b64decode(jch[stream]), padmode=PAD_PKCS5)
+    
+            if link:
+                link = link.decode("utf-8")
+                if not link == "dummytext" and link not in links:
+                    links.append((link, "[COLOR gold]PLAY STREAM[/COLOR]"))
+                    links.append((link+ "|connection=keepalive&Referer=https://rocktalk.net/&User-Agent="+player_user_agent, "[COLOR lime]PLAY STREAM[/COLOR]"))
+    
+    return links
+
+def livetv(page_url):
+    import json
+    video_urls = []
+    randomUa=getRandomUA()
+    logga ("PAGE_LIVETV: "+page_url)
+
+    arrP=page_url.split("webplayer2.php?")
+    try:
+        newStr=arrP[1]
+        arrP1=newStr.split("&")
+        if (arrP1[0]=="t=youtube" or arrP1[0]=="t=youtub"):
+            codeYT=arrP1[1].split("c=")[1]
+            ytp="https://www.youtube.com/watch?v="+codeYT
+            logga ("PAGE_YOUTUBE: "+ytp)
+            return resolveMyUrl(ytp)
+        if (arrP1[0]=="t=alieztv"):
+            codeAL=arrP1[1].split("c=")[1]
+            alp="https://emb.apl375.me/player/live.php?id="+codeAL+"&w=700&h=480"
+            page_data = downloadHttpPage(alp)
+            page_data_flat=page_data.replace("\n", "").replace("\r", "").replace("\t", "")
+            logga ("HTML_ALP375: %s", page_data_flat)
+            src = preg_match(page_data, "pl.init\('([^']*)")
+            logga ("SRC ==> "+src)
+            video_urls.append(("https:"+src, "[COLOR lime]PLAY STREAM AL[/COLOR]", "by @MandraKodi", "https://cdn.livetv822.me/img/minilogo.gif"))
+            return video_urls
+    except:
+        pass
+    page_data = downloadHttpPage(page_url)
+    page_data_flat=page_data.replace("\n", "").replace("\r", "").replace("\t", "")
+    logga ("HTML_LIVETV: %s", page_data_flat)
+    src = preg_match(page_data, '<iframe  allowFullScreen="true" scrolling=no frameborder="0 "width="700" height="480" src="([^"]*)')
+    if src != "":
+        arrHost=src.split("/")
+        host="https://"+arrHost[2]
+        final_url=""
+        try:
+            logga ("PAGE2_LIVETV: "+src)
+            if "topembed.pw" in src:
+                extCode=arrHost[-1].replace("ex", "bet")
+                logga("topembed code: "+extCode)
+                urlTopServer="https://topembed.pw/server_lookup.php?channel_id="+extCode
+                serverTop = requests.get(urlTopServer).json()["server_key"]
+                logga("topembed server: "+serverTop)
+                
+                if serverTop=="top1/cdn":
+                    final_url= "https://top1.kiko2.ru/top1/cdn/" + extCode + "/mono.m3u8"
+                else:
+                    final_url= "https://" + serverTop + "new.kiko2.ru/" + serverTop + "/" + extCode + "/mono.m3u8"
+            else:
+                arrP2=src.split("play?url=")
+                try:
+                    m3url=arrP2[1]
+                    video_urls.append((myParse.unquote(m3url), "[COLOR lime]PLAY STREAM PL[/COLOR]", "by @MandraKodi", "https://cdn.livetv822.me/img/minilogo.gif"))
+                    return video_urls
+                except Exception as err:
+                    import traceback
+                    errMsg="ERRORE MANDRAKODI: {0}".format(err)
+                    dialog = xbmcgui.Dialog()
+                    dialog.ok("Mandrakodi", errMsg)
+                if (src.startswith("//")):
+                    src="https:"+src
+                page_data2 = downloadHttpPage(src)
+                logga ("PAGE2_LIVETV_HTML:\n%s", page_data2)
+                final_url=preg_match(page_data2, "source: '(.*?)'")
+                if final_url == "":
+                    jsCode=preg_match(page_data2, '<script type="text/javascript" src="(.*?)"')
+                    if jsCode != "":
+                        #logga ("JSCODE: "+jsCode)
+                        arrJs=jsCode.split("/")
+                        urlJs="https://"+arrJs[2]+"/player/m/"+arrJs[-1]+"/"+arrJs[-2]
+                        #logga ("JSCODE_A: "+urlJs)
+                        page_data3 = downloadHttpPage(urlJs)
+                        #logga ("PAGE3_LIVETV_HTML:\n"+page_data3)
+                        final_url=preg_match(page_data3, "\"file\": '(.*?)'")+"|connection=keepalive&Referer="+page_url+"&User-Agent="+randomUa
+                    else:
+                        final_url = findM3u8(src, page_url)
+        except:
+            pass
+        if final_url == "" or final_url == src:
+            logga ("GetLSProData: "+src)
+            final_url = GetLSProData(src)
+        last_url=""
+        if "|" in final_url:
+            last_url=final_url
+        else:
+            last_url=final_url+"|Referer="+host+"/&Origin="+host+"&User-Agent=iPad"
+        
+        video_urls.append((last_url, "[COLOR lime]PLAY STREAM[/COLOR]", "by @MandraKodi", "https://cdn.livetv821.me/img/minilogo.gif"))
+        video_urls.append((final_url, "[COLOR gold]PLAY STREAM[/COLOR]", "by @MandraKodi", "https://cdn.livetv821.me/img/minilogo.gif"))
+    else:
+        video_urls.append((page_url, "[COLOR red]NO LINK FOUND[/COLOR]", "by @MandraKodi", "https://cdn.livetv821.me/img/minilogo.gif"))
+    return video_urls
+
+def myStream(parIn=None):
+    video_urls = []
+    page_url = "https://embed.mystream.to/"+parIn
+    logga('CALL: '+page_url)
+    page_data = requests.get(page_url,headers={'user-agent':'Mozilla/5.0','accept':'*/*'}).content
+    if PY3:
+        page_data = page_data.decode('utf-8')
+
+    page_decode = decodeMyStream(page_data)
+    video_url = preg_match(page_decode, r"'src',\s*'([^']+)")
+
+    logga('video_url '+video_url)
+    video_urls.append((video_url, ""))
+
+    return video_urls
+
+def decodeMyStream(data):
+    # adapted from MyStream.py code - https://github.com/kodiondemand/addon/blob/master/servers/mystream.py
+    first_group = preg_match(data, r'"\\"("\+.*?)"\\""\)\(\)\)\(\)')
+    match = preg_match(first_group, r"(\(!\[\]\+\"\"\)\[.+?\]\+)")
+    if match:
+        first_group = first_group.replace(match, 'l').replace('$.__+', 't').replace('$._+', 'u').replace('$._$+', 'o')
+
+        tmplist = []
+
+        js = preg_match(data, r'(\$={.+?});')
+        if js:
+            js_group = js[3:][:-1]
+            second_group = js_group.split(',')
+
+            i = -1
+            for x in second_group:
+                a, b = x.split(':')
+
+                if b == '++$':
+                    i += 1
+                    tmplist.append(("$.{}+".format(a), i))
+
+                elif b == '(![]+"")[$]':
+                    tmplist.append(("$.{}+".format(a), 'false'[i]))
+
+                elif b == '({}+"")[$]':
+                    tmplist.append(("$.{}+".format(a), '[object Object]'[i]))
+
+                elif b == '($[$]+"")[$]':
+                    tmplist.append(("$.{}+".format(a), 'undefined'[i]))
+
+                elif b == '(!""+"")[$]':
+                    tmplist.append(("$.{}+".format(a), 'true'[i]))
+
+            tmplist = sorted(tmplist, key=lambda z: str(z[1]))
+            for x in tmplist:
+                first_group = first_group.replace(x[0], str(x[1]))
+
+            first_group = first_group.replace('\\"', '\\').replace("\"\\\\\\\\\"", "\\\\").replace('\\"', '\\').replace('"', '').replace("+", "")
+
+    return first_group.encode('ascii').decode('unicode-escape').encode('ascii').decode('unicode-escape')
+
+def testDns(parIn=""):
+    import time
+    dns1 = xbmc.getInfoLabel('Network.DNS1Address')
+    dns2 = xbmc.getInfoLabel('Network.DNS2Address')
+    video_urls = []
+    
+    logga('CALL DNS TEST '+parIn)
+    randomUa=getRandomUA()
+    testUrl="https://daddylivestream.com/embed/stream-877.php"
+    head={'user-agent':randomUa,'Content-Type':'application/x-www-form-urlencoded','Referer':'https://daddylivestream.com/'}
+    resolve="daddyCode@@877"
+    if parIn=="StrCom":
+        sc_url="https://raw.githubusercontent.com/mandrakodi/mandrakodi.github.io/main/data/cs_url.txt"
+        scUrl=makeRequest(sc_url)
+        testUrl=scUrl.replace("\n", "")+"it/iframe/4474-febbre-da-cavallo"
+        head={'user-agent':randomUa}
+        resolve="scws2@@4474-febbre-da-cavallo"
+    page_data = ""
+    time.sleep(2)
+    ret="[COLOR lime]TEST DNS: OK[/COLOR]"
+    thumb="https://upload.wikimedia.org/wikipedia/commons/f/fb/2000px-ok_x_nuvola_green.png"
+    try:
+        logga('URL DNS TEST '+testUrl)
+        currSess = requests.Session()
+        page_data1 = currSess.get(testUrl, headers=head)
+        page_data = page_data1.content
+        
+        if (page_data1.status_code != 200):
+            ret="[COLOR red]ERRORE DNS[/COLOR] [COLOR gold]("+str(page_data1.status_code)+")[/COLOR]"
+            thumb="https://icon-library.com/images/error-icon-transparent/error-icon-transparent-24.jpg"
+        else:
+            if PY3:
+                try:
+                    page_data = page_data.decode('utf-8')
+                except:
+                    page_data = page_data.decode('latin-1')
+           
+            iframe_url = preg_match(page_data, r'iframe\s*src="([^"]+)')
+            if parIn=="StrCom":
+                iframe_url = preg_match(page_data, r'src="(.*?)"')
+            if (iframe_url==""):
+                ret="[COLOR red]DNS ERRORS[/COLOR]"
+                thumb="https://icon-library.com/images/error-icon-transparent/error-icon-transparent-24.jpg"
+    except Exception as err:
+        import traceback
+        
+        #errMsg="ERROR_MK2: {0}".format(err)
+        #msgBox(errMsg)
+        traceback.print_exc()
+        ret="[COLOR red]ERRORE REQUEST[/COLOR]"
+        thumb="https://icon-library.com/images/error-icon-transparent/error-icon-transparent-24.jpg"
+    
+    dns1 = xbmc.getInfoLabel('Network.DNS1Address')
+    dns2 = xbmc.getInfoLabel('Network.DNS2Address')
+
+    ret += "[COLOR yellow] ["+dns1+" - "+dns2+"][/COLOR]"
+
+    jsonText='{"SetViewMode":"51","items":['
+    jsonText = jsonText + '{"title":"'+ret+'","myresolve":"'+ resolve+'",'
+    jsonText = jsonText + '"thumbnail":"'+thumb+'",'
+    jsonText = jsonText + '"fanart":"https://www.stadiotardini.it/wp-content/uploads/2016/12/mandrakata.jpg",'
+    jsonText = jsonText + '"info":"by MandraKodi"}'
+    jsonText = jsonText + "]}"
+    video_urls.append((jsonText, "PLAY VIDEO", "No info", "noThumb", "json"))
+    
+    return video_urls
+
+def markky(parIn):
+    video_urls = []
+    vUrl = ""
+    logga('CALL NOPAY FOR: '+parIn)
+    randomUa=getRandomUA()
+    head={'user-agent':randomUa,'Content-Type':'application/x-www-form-urlencoded','Referer':'https://markkystreams.com/'}
+    page_data = ""
+    
+    try:
+        currSess = requests.Session()
+        page_data = currSess.get(parIn,headers=head).content
+    except:
+        video_urls.append(("ignoreme", "[COLOR red]REQUEST ERROR[/COLOR]", "ERROR", "https://icon-library.com/images/error-icon-transparent/error-icon-transparent-24.jpg"))
+        return video_urls
+    if PY3:
+        try:
+            page_data = page_data.decode('utf-8')
+        except:
+            page_data = page_data.decode('latin1')
+    
+    logga("page_soloper %s", page_data)
+    url = preg_match(page_data, r'source: "(.*?)"')
+    video_urls.append((url+"|connection=keepalive&verifypeer=false&Referer="+parIn, "[COLOR gold]PLAY STREAM[/COLOR]", "PLAY STREAM", "https://res.9appsinstall.com/group4/M00/51/F1/ghoGAFy4guuAJwiKAAAquIT5LH0862.png"))
+    return video_urls
+
+def enigma4k(parIn=None):
+    import json
+    
+    randomUa=getRandomUA()
+    urlP="https://enigma4k.live/get_video_link.php?id="+parIn
+    dataJson = requests.get(urlP,headers={'user-agent':randomUa,'accept':'*/*','Referer':'https://enigma4k.live'}).content
+    if PY3:
+        dataJson = dataJson.decode('utf-8')
+    logga("JSON ENIGMA: %s", dataJson)
+    arrJ = json.loads(dataJson)
+    videoLink=arrJ["videoLink"]
+    logga("LINK ENIGMA: "+videoLink)
+    return urlsolver(videoLink)
+
+def wikisport(parIn=None):
+    video_urls = []
+    randomUa = getRandomUA()
+    pageUrl = "https://fiveyardlab.com/wiki.php?player=desktop&live="+parIn
+    page_data = requests.get(pageUrl,headers={'user-agent':randomUa,'accept':'*/*','Referer':'https://wikisport.click'}).content
+    if PY3:
+        page_data = page_data.decode('utf-8')
+    #logga('wikisport page: '+pageUrl+"\n"+page_data)
+    iframe_url = preg_match(page_data, 'return\(\[(.*?)\]')
+    final_url = iframe_url.replace('"', '').replace(",", "").replace("\\", "").replace("https:////", "https://")
+    logga('URL wikisport: '+final_url)
+    video_urls.append((final_url+ "|connection=keepalive&Referer="+pageUrl+"&Origin=https://wikisport.click&User-Agent="+randomUa, "[COLOR lime]PLAY STREAM[/COLOR]", "PLAY: ", "https://www.pepperlive.info/Live1.jpg"))
+    return video_urls
+
+def daily(parIn=None):
+    import json
+    video_urls = []
+    randomUa=getRandomUA()
+    urlAny="https://www.dailymotion.com/player/metadata/video/"+parIn
+    data = requests.get(urlAny,headers={'user-agent':randomUa,'accept':'*/*','Referer':'https://www.dailymotion.com'}).content
+    if PY3:
+        data = data.decode('utf-8')
+    logga('JSON DAILY: %s', data)
+    dataJ = json.loads(data)
+    name=dataJ["title"]
+    url=dataJ["qualities"]["auto"][0]["url"]
+    img="https://png.pngtree.com/png-vector/20230124/ourmid/pngtree-arrow-icon-3d-play-png-image_6565151.png"
+    try:
+        img=dataJ["posters"]["720"]
+    except:
+        pass
+    video_urls.append((url, "[COLOR lime]"+name+"[/COLOR]", "by MandraKodi", img))
+    return video_urls
+
+def anyplay(parIn=None):
+    import json
+    logoCh="https://png.pngtree.com/png-vector/20230124/ourmid/pngtree-arrow-icon-3d-play-png-image_6565151.png"
+    video_urls = []
+    randomUa=getRandomUA()
+    urlAny="https://aniplay.co/series/"+parIn
+    page_data = requests.get(urlAny,headers={'user-agent':randomUa,'accept':'*/*','Referer':'https://aniplay.co/'}).content
+    if PY3:
+        page_data = page_data.decode('utf-8')
+    dataJ = preg_match(page_data, 'const data = \[(.*?)\];')
+    #logga('ANY JSON'+dataJ)
+    arrP1 = dataJ.split(',episodes:')
+    srrs = arrP1[1]
+    arrP2 = srrs.split(',similarSeries:')
+    dj2='{"episodes":'+arrP2[0]
+    #logga("ANY PAGE ANTE\n"+dj2)
+    mapping = {'old_id:':'"old_id":', 'id:':'"id":', 'subbed:':'"subbed":', 'download_link:':'"download_link":', 'title:':'"title":', 'slug:':'"slug":', 'number:':'"number":', 'score:':'"score":', 'user:':'"user":', 'username:':'"username":', 'email:':'"email":', 'provider:':'"provider":', 'password:':'"password":', 'resetPasswordToken:':'"resetPasswordToken":', 'confirmationToken:':'"confirmationToken":', 'confirmed:':'"confirmed":', 'blocked:':'"blocked":', 'avatar_url:':'"avatar_url":', 'gender:':'"gender":', 'banner_url:':'"banner_url":', 'bio:':'"bio":', 'settingsProfileVisibility:':'"settingsProfileVisibility":', 'title:':'"title":', 'temp_sub:':'"temp_sub":', 'quality:':'"quality":', 'release_date:':'"release_date":', 'seconds:null':'"seconds":"0"', 'streaming_link:':'"streaming_link":', 'birth_date:':'"birth_date":', 'seconds:':'"seconds":', 'embed:':'"embed":', 'createdAt:':'"createdAt":', 'updatedAt:':'"updatedAt":', 'publishedAt:':'"publishedAt":', 'settingsProfileComments:':'"settingsProfileComments":', 'home_visibile:':'"home_visibile":', 'location:':'"location":', 'release_hour:':'"release_hour":'}
+    for k, v in mapping.items():
+        dj2 = dj2.replace(k, v)
+
+    #logga("ANY PAGE POST\n"+dj2)
+    jsonText='{"SetViewMode":"503","items":['
+    numIt=0
+    arrJ = json.loads(dj2)
+    for ep in arrJ["episodes"]:
+        link=ep["streaming_link"]
+        title=""
+        if not ep["title"] is None: 
+            title=ep["title"]
+        numEp=str(ep["number"])
+        if (int(numEp)<0):
+            numEp="0"+numEp
+        tit="Ep. "+numEp+" - "+title
+        #logga(tit+" "+link) 
+        if (numIt > 0):
+            jsonText = jsonText + ','    
+        jsonText = jsonText + '{"title":"[COLOR gold]'+tit+'[/COLOR]","link":"'+link+'",'
+        jsonText = jsonText + '"thumbnail":"'+logoCh+'",'
+        jsonText = jsonText + '"fanart":"https://www.stadiotardini.it/wp-content/uploads/2016/12/mandrakata.jpg",'
+        jsonText = jsonText + '"info":"by MandraKodi"}'
+        numIt=numIt+1
+    
+    jsonText = jsonText + "]}"
+    logga('JSON-ANY: %s', jsonText)
+    video_urls.append((jsonText, "PLAY VIDEO", "No info", "noThumb", "json"))
+    return video_urls
+
+def getSourceFrame(parIn):
+    import re
+    from urllib.parse import quote_plus
+    toRet="ignore"
+    video_urls = []
+    UA='Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:98.0) Gecko/20100101 Firefox/98.0'
+    referer = parIn
+    headers = {
+        'user-agent': UA
+    }
+
+    s = requests.Session()
+    r = s.get(parIn, headers=headers)
+    express = r"<iframe src='(.*?)'"
+    try:
+        srcIfra = re.compile(express, re.MULTILINE | re.DOTALL).findall(r.text)[0]
+        logga("FIND IFRAME: "+srcIfra)
+        headers = {
+            "user-agent": UA,
+            "referer": parIn
+        }
+        a = s.get(srcIfra, headers=headers)
+        express = r"source:'(.*?)'"
+        toRet = re.compile(express, re.MULTILINE | re.DOTALL).findall(a.text)[0]
+    except:
+        pass
+    texto="[COLOR red]NO LINK FOUND[/COLOR]"
+    if toRet != "ignore":
+        from urllib.parse import urlparse
+        parsed_uri = urlparse(srcIfra)
+        result = '{uri.scheme}://{uri.netloc}'.format(uri=parsed_uri)
+        referer = quote_plus(srcIfra)
+        origin = quote_plus(parIn)
+        user_agent = quote_plus(UA)
+        toRet += "|Referer="+srcIfra+"&Origin="+result+"&Keep-Alive=true&User-Agent="+user_agent
+        texto="[COLOR lime]PLAY[/COLOR]"
+    video_urls.append((toRet, texto))
+    return video_urls
+
+def tvapp(parIn=None):
+    import json
+    video_urls = []
+    randomUa="Mozilla/5.0"
+    #randomUa=getRandomUA()
+    headers = {
+        'user-agent': randomUa,
+        'referer': "https://thetvapp.to/"
+    }
+    s = requests.Session()
+    urlAuth="https://thetvapp.to/tv/"+parIn
+    fu = s.get(urlAuth, headers=headers)
+    divUrl = preg_match(fu.text, '<div id="stream_name" name="(.*?)">')
+    urlJsonLink="https://thetvapp.to/token/"+divUrl
+    fuJson = s.get(urlJsonLink, headers=headers).text
+    logga("JSON TVAPP: %s", fuJson)
+    arrJ = json.loads(fuJson)
+    videoLink=arrJ["url"]
+    logga("LINK TVAPP: "+videoLink)
+    
+    video_urls.append((videoLink, "[COLOR lime]PLAY STREAM (PLAYER EST.)[/COLOR]", "PLAY STREAM", "https://www.pepperlive.info/Live1.jpg"))
+    return video_urls
+
+def freeshot(codeIn=None):
+    video_urls = []
+    randomUa="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.0.0 Safari/537.36 OPR/120.0.0.0"
+    #randomUa=getRandomUA()
+    headers = {
+        'user-agent': randomUa,
+        'referer': "https://thisnot.business/"
+    }
+    s = requests.Session()
+    #urlAuth="https://popcdn.day/go.php?stream="+codeIn
+    urlAuth="https://popcdn.day/player/"+codeIn
+    fu = s.get(urlAuth, headers=headers)
+    #logga("FREE_PAGE: "+fu.text)
+
+    '''
+    frameUrl = preg_match(fu.text, 'frameborder="0" src="(.*?)"')
+    arrTk=frameUrl.split("token=")
+    tk1=arrTk[1]
+    arrTk2=tk1.split("&")
+    token=arrTk2[0]
+    '''
+    token = preg_match(fu.text, 'currentToken: "(.*?)"')
+    #logga ("TOKEN: "+token)
+    
+    link_ch="https://planetary.lovecdn.ru/"+codeIn+"/tracks-v1a1/mono.m3u8?token="+token
+    #link_ch=frameUrl.replace("embed.html", "index.fmp4.m3u8")
+    jsonText='{"SetViewMode":"50","items":['
+    jsonText = jsonText + '{"title":"[COLOR orange]PLAY STREAM [/COLOR] [COLOR gold](FFMPEG)[/COLOR]","myresolve":"ffmpeg_noRef@@'+link_ch+'",'
+    jsonText = jsonText + '"thumbnail":"https://i.imgur.com/8EL6mr3.png",'
+    jsonText = jsonText + '"fanart":"https://www.stadiotardini.it/wp-content/uploads/2016/12/mandrakata.jpg",'
+    jsonText = jsonText + '"info":"by MandraKodi"},'
+    jsonText = jsonText + '{"title":"[COLOR lime]PLAY STREAM [/COLOR] [COLOR gold](PLAYER EST.)[/COLOR]","link":"'+link_ch+'",'
+    jsonText = jsonText + '"thumbnail":"https://i.imgur.com/8EL6mr3.png",'
+    jsonText = jsonText + '"fanart":"https://www.stadiotardini.it/wp-content/uploads/2016/12/mandrakata.jpg",'
+    jsonText = jsonText + '"info":"by MandraKodi"}'
+    
+    
+   
+    
+    jsonText = jsonText + "]}"
+    logga('JSON-FREE: %s', jsonText)
+    video_urls.append((jsonText, "PLAY VIDEO", "No info", "noThumb", "json"))
+    
+    return video_urls
+
+def pulive(parIn=None):
+    url = "https://pulivetv146.com/player.html?id="+parIn
+    page_data = requests.get(url, headers={'user-agent':'Mozilla/5.0','accept':'*/*'}).content
+    if PY3:
+        page_data = page_data.decode('utf-8')
+    patron=r'window.config=(.*?)<\/script>'
+    txt = preg_match(page_data, patron)
+    x = txt.split("match:")
+    rr=x[1]
+    patron=r'source:"(.*?)"'
+    txt2 = preg_match(rr, patron)
+    video_urls = []
+    video_urls.append((txt2+"|verifypeer=false", "[COLOR lime]PLAY STREAM[/COLOR]", "by @mandrakodi"))
+    return video_urls
+
+def dplay(parIn):
+    import json, functools
+    parIn=25081
+    video_urls = []
+    session = requests.Session()
+    session.request = functools.partial(session.request, timeout=30)
+    deviceId = uuid.uuid4().hex
+    domain = 'https://' + requests.get("https://prod-realmservice.mercury.dnitv.com/realm-config/www.discoveryplus.com%2Fit%2Fepg").json()["domain"]
+    apiUrl = domain + "/token?deviceId="+deviceId+"&realm=dplay&shortlived=true"
+    logga('APIURL_DPLAY: '+apiUrl)
+    token = session.get(apiUrl).json()['data']['attributes']['token']
+    logga('TOKEN_DPLAY: '+token)
+    myHeaders = {'User-Agent': 'Mozilla/50.0 (Windows NT 10.0; WOW64; rv:45.0) Gecko/20100101 Firefox/45.0',
+            'Referer': 'https://discoveryplus.it',
+            'Origin': 'https://discoveryplus.it',
+            'Cookie' : 'st=' + token,
+            'content-type': 'application/json',
+            'x-disco-params': 'realm=dplay,siteLookupKey=dplus_it'}
+    session.headers = myHeaders
+
+
+
+
+    content="video"
+    apiUrl2 = domain + "/playback/v3/"+content+"PlaybackInfo/"
+    post = {content+'Id': parIn, 'deviceInfo': {'adBlocker': False,'drmSupported': True}}
+    data2 = session.post(apiUrl2, json=post).content
+    data3 = json.loads(data2)
+    logga('POST_DPLAY: %s', data2)
+
+    data = requests.get('https://eu1-prod-direct.discoveryplus.com/playback/videoPlaybackInfo/{}?usePreAuth=true'.format(parIn), headers=myHeaders).content
+    logga('RESP_DPLAY: %s', data)
+    dataJ = json.loads(data)
+    dataJ2=dataJ.get('data',{}).get('attributes',{})
+    dataErr = "[COLOR lime]PLAY VIDEO[/COLOR]"
+    try:
+        if dataJ2.get('protection', {}).get('drmEnabled',False):
+            link = dataJ2['streaming']['dash']['url']
+            #item.drm = 'com.widevine.alpha'
+            #item.license ="{}|PreAuthorization={}|R{{SSM}}|".format(data['protection']['schemes']['widevine']['licenseUrl'], data['protection']['drmToken'])
+        else:
+            link = dataJ2['streaming'][0]['url']
+            #item.manifest = 'hls'
+        #link = dataJ["data"]["attributes"]["streaming"]["hls"]["url"]
+    except:
+        dataErr = "[COLOR red]"+dataJ["errors"][0]["detail"]+"[/COLOR]"
+        link = dataJ["errors"][0]["detail"]
+    logga('LINK_DPLAY: '+link)
+    video_urls.append((link, dataErr))
+    return video_urls
+
+def dplayLive(parIn):
+    import json
+    video_urls = []
+    token = requests.get('https://disco-api.discoveryplus.it/token?realm=dplayit').json()['data']['attributes']['token']
+    logga('TOKEN_DPLAY: '+token)
+    headers = {'User-Agent': 'Mozilla/50.0 (Windows NT 10.0; WOW64; rv:45.0) Gecko/20100101 Firefox/45.0',
+           'Referer': 'https://discoveryplus.it',
+           'Cookie' : 'st=' + token}
+    data = requests.get('https://disco-api.discoveryplus.it/playback/channelPlaybackInfo/{}?usePreAuth=true'.format(parIn), headers=headers).content
+    dataJ = json.loads(data)
+    dataErr = "[COLOR lime]PLAY VIDEO[/COLOR]"
+    try:
+        link = dataJ["data"]["attributes"]["streaming"]["hls"]["url"]
+    except:
+        dataErr = "[COLOR red]"+dataJ["errors"][0]["detail"]+"[/COLOR]"
+        link = dataJ["errors"][0]["detail"]
+    logga('LINK_DPLAY: '+link)
+    video_urls.append((link, dataErr))
+    return video_urls
+
+def nflinsider(parIn):
+    video_urls = []
+    #urlPage="https://basketball-video.com/"+parIn
+    urlPage="https://nbaontv.com/"+parIn
+    page_data = requests.get(urlPage,headers={'user-agent':'iPad','accept':'*/*','referer':'https://basketball-video.com/'}).content
+
+    if PY3:
+        page_data = page_data.decode('utf-8')
+    
+    #link = preg_match(page_data, '<iframe allowfullscreen="" frameborder="0" height="315" src="(.*?)"')
+    link = preg_match(page_data, 'frameborder="0" height="315" src="(.*?)"')
+    if (link.startswith("//")):
+        link="https:"+link
+    logga("NFLINSIDER LINK: "+link)
+    if ".mkv" in link:
+        video_urls.append((link+"|referer=https://basketball-video.com/", "[COLOR lime]PLAY VIDEO[/COLOR]", "PLAY VIDEO"))
+        return video_urls
+    return urlsolver(link)
+
+def ppv_to(parIn):
+    import base64
+    user_agent = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36 OPR/124.0.0.0'
+    headers = {
+        'user-agent': user_agent,
+        'referer': "https://ppvs.to/"
+    }
+    s = requests.Session()
+        
+    response = s.get(parIn, headers=headers)
+    logga ("PPV_PAGE ==> %s", response.text)
+    stream_url = re.findall('const src = atob\("(.*?)"\)', response.text)[0]
+    stream_url = base64.b64decode(stream_url).decode("utf-8")
+    logga ("URL IN ==> "+parIn)
+    link=stream_url.replace("index.m3u8", "tracks-v1a1/mono.ts.m3u8|Referer=https://playembed.top/&Origin=https://playembed.top&User-Agent="+user_agent)
+    
+    listing = Listing("50")
+    listing.add("[COLOR lime]PLAY STREAM [/COLOR] [COLOR gold](DIRECT)[/COLOR]", "https://i.imgur.com/8EL6mr3.png", link=link, info="by MandraKodi")
+    listing.add("[COLOR orange]PLAY STREAM [/COLOR] [COLOR gold](FFMPEG)[/COLOR]", "https://i.imgur.com/8EL6mr3.png", myresolve="ffmpeg_noRef@@"+link, info="by MandraKodi")
+    
+    return listing
+
+def sansat(parIn):
+    import ast
+    page="https://vividmosaica.com/embed3.php?player=desktop&live=do"+parIn
+    head={
+        "User-Agent":"Mozilla",
+        "Referer":"https://sansat.link/",
+        "Origin":"https://sansat.link"
+    }
+    s = requests.Session()
+    response = s.get(page, headers=head)
+    pattern = r"\(\s*(\[[^\]]+\])\.join\(\"\"\)"
+    array_match = re.findall(pattern, response.text, re.DOTALL)
+    chars = ast.literal_eval(array_match[0])
+    url = "".join(chars)
+    normalized = url.replace("\\/", "/")
+    finalUrl=normalized.replace("https:////", "https://")
+    logga ("SANSAT URL ==> "+finalUrl)
+    video_urls = []
+    video_urls.append((finalUrl+"|Referer=https://vividmosaica.com/&Origin=https://vividmosaica.com&User-Agent=Mozilla", "[COLOR lime]PLAY STREAM[/COLOR]"))
+    return video_urls
+
+def infoCode(parIn=''):
+    logga('ParIn: '+parIn)
+    video_urls = []
+    launcher_vers="1.0.0"
+    home = ''
+    if PY3:
+        home = xbmcvfs.translatePath(settings.addonInfo('path'))
+    else:
+        home = xbmc.translatePath(settings.addonInfo('path').decode('utf-8'))
+    launcher_file = os.path.join(home, 'launcher.py')
+    if os.path.exists(launcher_file)==True:
+        resF = open(launcher_file)
+        resolver_content = resF.read()
+        resF.close()
+        launcher_vers = re.findall("versione='(.*)'",resolver_content)[0]
+    mess="L_V: "+launcher_vers+" - R_V: "+versione
+    msgBox(mess)
+    return None
+
+def showMsg(parIn):
+    msgBox(parIn)
@@ -0,0 +1,312 @@
+from __future__ import unicode_literals # turns everything to unicode
+# Module: resolvers.movies
+# Author: ElSupremo
+# Created on: 17.10.2026
+# Last update: 17.10.2026
+# License: GPL v.3 https://www.gnu.org/copyleft/gpl.html
+
+import re, requests
+
+import xbmcgui
+
+from myResolver import logga, preg_match, Listing
+from resolvers.hosters import assia
+
+
+def get_tmdb_video(tmdb_id="926899"):
+    import json
+    to_ret = "ignoreMe"
+    url = "https://vixsrc.to/movie/"+tmdb_id+"/?lang=it"
+    
+    try:
+        response = requests.get(url)
+        page = response.text.replace("\n", "").replace("\r", "").replace("\t", "")
+        logga ("TMDB_PAGE: %s", page)
+        match = re.search(r'window\.masterPlaylist\s*=\s*(.*?)\s*window\.canPlayFHD', page, re.IGNORECASE)
+        if match:
+            jj = match.group(1).strip()
+            ff = jj[:-3] + "}"
+            ff = ff.replace("'", '"')
+            ff = ff.replace("url", '"url"')
+            ff = ff.replace("params", '"params"')
+            ff = re.sub(r',\s*}', '}', ff)
+            logga("TMDB_FF: "+ff)
+            arr_t = json.loads(ff)
+            token = arr_t["params"]["token"]
+            expires = arr_t["params"]["expires"]
+            url_v = arr_t["url"]
+            
+            to_ret = f"{url_v}?token={token}&expires={expires}&h=1"
+        else:
+            logga("NO TMDB_JSON")
+    except Exception as e:
+        logga(f"Error: {e}")
+    
+    listing = Listing("50")
+    thumb = "https://cdn3d.iconscout.com/3d/premium/thumb/watching-movie-4843361-4060927.png"
+    listing.add("[COLOR lime]PLAY STREAM (IT)[/COLOR]", thumb, link=to_ret+"&lang=it", info="by MandraKodi")
+    listing.add("[COLOR lime]PLAY STREAM (EN)[/COLOR]", thumb, link=to_ret+"&lang=en", info="by MandraKodi")
+    logga('JSON-TMDB: %s', listing.items)
+    
+    return listing
+
+def get_tmdb_episode_video(tmdb_id="1416_1_1"):
+    import json
+    to_ret = "ignoreMe"
+    arrV=tmdb_id.split("_")
+    serieId=arrV[0]
+    season=arrV[1]
+    episode=arrV[2]
+    url = "https://vixsrc.to/tv/{serieId}/{season}/{episode}?lang=it"
+    
+    try:
+        response = requests.get(url)
+        page = response.text.replace("\n", "").replace("\r", "").replace("\t", "")
+        
+        match = re.search(r'window\.masterPlaylist\s*=\s*(.*?)\s*window\.canPlayFHD', page, re.IGNORECASE)
+        if match:
+            jj = match.group(1).strip()
+            ff = jj[:-3] + "}"
+            ff = ff.replace("'", '"')
+            ff = ff.replace("url", '"url"')
+            ff = ff.replace("params", '"params"')
+            ff = re.sub(r',\s*}', '}', ff)
+            
+            arr_t = json.loads(ff)
+            token = arr_t["params"]["token"]
+            expires = arr_t["params"]["expires"]
+            url_v = arr_t["url"]
+            
+            to_ret = f"{url_v}?token={token}&expires={expires}&h=1&lang=it"
+    except Exception as e:
+        print(f"Error: {e}")
+    
+    video_urls = []
+    jsonText='{"SetViewMode":"50","items":['
+    jsonText = jsonText + '{"title":"[COLOR lime]PLAY STREAM[/COLOR]","link":"'+to_ret+'",'
+    jsonText = jsonText + '"thumbnail":"https://cdn3d.iconscout.com/3d/premium/thumb/watching-movie-4843361-4060927.png",'
+    jsonText = jsonText + '"fanart":"https://www.stadiotardini.it/wp-content/uploads/2016/12/mandrakata.jpg",'
+    jsonText = jsonText + '"info":"URL: '+to_ret+'"}'
+    
+    
+    jsonText = jsonText + "]}"
+    logga('JSON-TMDB: %s', jsonText)
+    video_urls.append((jsonText, "PLAY VIDEO", "No info", "noThumb", "json"))
+    
+    return video_urls
+
+def toonIta(parIn):
+    logga("TOONITA URL IN: "+parIn)
+    video_urls = []
+    headers = {
+        "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/74.0.3729.131 Safari/537.36",
+        "Referer": "https://toonita.green/"
+    }
+    s = requests.Session()
+    fu = s.get(parIn, headers=headers)
+    video_url = parIn
+    try:
+        pageHtml=fu.text
+        logga("TOONITA HTML: %s", pageHtml)
+        listaHtml=pageHtml.split("</td>")
+        numero=len(listaHtml)
+        logga("TOONITA TR: "+str(numero))
+        my_list = []
+        for (row) in listaHtml:
+            logga("TOONITA ROW: "+row)
+            regEx= r'href="https:\/\/uprot.net\/(.*?)\/(.*?)" target="_blank" rel="noopener nofollow" title="(.*?)"'
+            list=preg_match(row, regEx)
+            #list = re.compile(regEx, re.MULTILINE | re.DOTALL).findall(row)
+            for (host, id, title) in list:
+                ep=title.replace("Streaming di ", "").replace(" su StreamTape", "").replace(" su Max", "").replace(" su Flexy", "")
+                my_list.append(ep+"@@"+host+"@@"+id)
+
+
+        #list = re.findall(regEx, fu.text)
+        numero=len(my_list)
+        logga("TOONITA TROVATI: "+str(numero))
+        jsonText='{"SetViewMode":"51","channels":['
+        numIt = 0
+        numCh = -1
+        oldEp = ""
+        for (elem) in my_list:
+            arrEl=elem.split("@@")
+            title=arrEl[0]
+            host=arrEl[1]
+            id=arrEl[2]
+            ep=title.replace("Streaming di ", "").replace(" su StreamTape", "").replace(" su Max", "").replace(" su Flexy", "")
+            #logga("EP_07:"+ep[:7])
+            if ep[:7]=="Scarica":
+                continue
+            
+            if oldEp != ep:
+                numCh = numCh+1
+                oldEp = ep
+                numIt = 0
+                if (numCh > 0):
+                    jsonText = jsonText + ']},'
+                jsonText = jsonText + '{"name":"[COLOR lime]'+ep+'[/COLOR]",'
+                jsonText = jsonText + '"thumbnail":"https://pbs.twimg.com/profile_images/848686618466816000/8MaqE-n5_400x400.jpg",'
+                jsonText = jsonText + '"fanart":"https://www.stadiotardini.it/wp-content/uploads/2016/12/mandrakata.jpg",'
+                jsonText = jsonText + '"SetViewMode":"51","items":['
+            
+            if (numIt > 0):
+                jsonText = jsonText + ',' 
+            #jsonText = jsonText + '{"title":"[COLOR gold]'+host+'[/COLOR]","myresolve":"uprot@@https://uprot.net/'+host+'/'+id+'",'
+            jsonText = jsonText + '{"title":"[COLOR gold]'+host+'[/COLOR]","myresolve":"uprot@@https://uprot.net/'+host+'/'+id+'",'
+            jsonText = jsonText + '"thumbnail":"https://pbs.twimg.com/profile_images/848686618466816000/8MaqE-n5_400x400.jpg",'
+            jsonText = jsonText + '"fanart":"https://www.stadiotardini.it/wp-content/uploads/2016/12/mandrakata.jpg",'
+            jsonText = jsonText + '"info":"by MandraKodi"}'
+            numIt=numIt+1
+        
+        
+        
+        if numIt==0:
+            jsonText = jsonText + '{"title":"[COLOR red]NO HOST FOUND[/COLOR]","link":"ignore",'
+            jsonText = jsonText + '"thumbnail":"https://pbs.twimg.com/profile_images/848686618466816000/8MaqE-n5_400x400.jpg",'
+            jsonText = jsonText + '"fanart":"https://www.stadiotardini.it/wp-content/uploads/2016/12/mandrakata.jpg",'
+            jsonText = jsonText + '"info":"NO INFO"}'
+
+        jsonText = jsonText + "]}]}"
+        logga("TOONITA JSON: %s", jsonText)
+        video_urls.append((jsonText, "PLAY VIDEO", "No info", "noThumb", "json"))
+    except Exception as err:
+        import traceback
+        errMsg="ERRORE MANDRAKODI: {0}".format(err)
+        #logging.warning(errMsg+"\nPAR_ERR --> ")
+        traceback.print_exc()
+        dialog = xbmcgui.Dialog()
+        dialog.ok("Mandrakodi", errMsg)
+        logga("NO PACKED \n%s", fu.text)
+        video_urls.append(("ignore", "[COLOR red]NO LINK FOUND[/COLOR]"))	
+        pass
+    return video_urls
+
+def imdbList(parIn):
+    import re
+    page=1
+    info = "NO - TIT"
+    listing = Listing("503")
+    while page < 6:
+        urlPage="https://www.imdb.com/list/"+parIn+"/?page="+str(page)
+        headers = {
+            'user-agent': "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/74.0.3729.131 Safari/537.36"
+        }
+
+        s = requests.Session()
+        r = s.get(urlPage, headers=headers)
+        htmlFlat=r.text.replace("\n", '').replace("\r", '').replace("\t", '')
+        
+        if page==1:
+            info = preg_match(htmlFlat, '<title>(.*?)</title>')
+        
+        express1 = r'<img alt="(.*?)"class="loadlate"loadlate="(.*?)"data-tconst="(.*?)"height="209"(.*?)<span class="lister-item-year text-muted unbold">(.*?)</span>'
+        lista = re.compile(express1, re.MULTILINE | re.DOTALL).findall(htmlFlat)
+        
+        for (titolo, img, idImdb, par4, year) in lista:
+            listing.add("[COLOR gold]"+titolo+" "+year+"[/COLOR]", img, myresolve="imdb@@"+idImdb, info=idImdb+" - "+info.replace(" - IMDB", ''))
+        
+        intEnd=1
+        intMax=1
+        try:
+            (start, end, max) = preg_match(htmlFlat, '<span class="pagination-range">(.*?) - (.*?) of (.*?)</span>')
+            logga('NUM REC: '+max)
+            intEnd=int(end)
+            intMax=int(max)
+        except:
+            pass
+        nump = 1
+        if intMax > intEnd:
+            page = page + 1
+        else:
+            page = 6
+
+    return listing
+
+def cb01(parIn):
+    import re
+    
+    url="https://cb01.red/stream/"+parIn+"-movie.html";
+    headers = {
+        'user-agent': "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/74.0.3729.131 Safari/537.36"
+    }
+
+    s = requests.Session()
+    r = s.get(url, headers=headers)
+    logga("FIND IMDB CODE")
+
+    express1 = r'<script src="https://guardahd.stream/ddl/tt(.*?)"'
+    code = re.compile(express1, re.MULTILINE | re.DOTALL).findall(r.text)[0]
+    
+    return imdb("tt"+code)
+
+def bing(parIn):
+    import re
+    video_urls = []
+    headers = {
+        'user-agent': "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/74.0.3729.131 Safari/537.36"
+    }
+
+    s = requests.Session()
+    r = s.get(parIn, headers=headers)
+    logga("FIND HOSTS FOR "+parIn)
+
+    express = r'<iframe src="(.*?)"'
+    link = re.compile(express, re.MULTILINE | re.DOTALL).findall(r.text)[0]
+    if "assia" in link:
+        return assia(link)
+    
+    video_urls.append(("ignore", "[COLOR red]NO LINK FOUND[/COLOR]"))
+    return video_urls
+
+def imdb(parIn):
+    import re
+    video_urls = []
+
+    url="https://mostraguarda.stream/set-movie-a//"+parIn
+    headers = {
+        'user-agent': "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/74.0.3729.131 Safari/537.36"
+    }
+
+    s = requests.Session()
+    r = s.get(url, headers=headers)
+    logga("FIND HOSTS FOR "+parIn)
+    jsonText='{"SetViewMode":"503","items":['
+    numIt=0
+    
+    if "not found" in r.text:
+        logga("NO LINK FOUND FOR "+parIn)
+    else:
+        express = r'<title>(.*?)</title>'
+        title = re.compile(express, re.MULTILINE | re.DOTALL).findall(r.text)[0]
+        
+        
+        
+        express1 = r'<ul class="_player-mirrors">(.*?)</ul>'
+        ret1 = re.compile(express1, re.MULTILINE | re.DOTALL).findall(r.text)[0]
+        htmlFlat=ret1.replace("\n", '').replace("\r", '').replace("\t", '')
+        express2 = r'data-link="(.*?)">(.*?)<\/li>'
+        ret = re.compile(express2, re.MULTILINE | re.DOTALL).findall(htmlFlat)
+        for (link, ep) in ret:
+            if "Player 4K" not in ep:
+                if link[0:2] == "//":
+                    link = "https:"+link
+                #logga('LINK-IMDB: '+link+" "+ep)
+                if (numIt > 0):
+                    jsonText = jsonText + ','    
+                jsonText = jsonText + '{"title":"[COLOR lime]'+ep.strip()+'[/COLOR]","myresolve":"risolvi@@'+link+'",'
+                jsonText = jsonText + '"thumbnail":"https://cdn3d.iconscout.com/3d/premium/thumb/watching-movie-4843361-4060927.png",'
+                jsonText = jsonText + '"fanart":"https://www.stadiotardini.it/wp-content/uploads/2016/12/mandrakata.jpg",'
+                jsonText = jsonText + '"info":"'+title+'"}'
+                numIt=numIt+1
+    
+    if numIt==0:
+        jsonText = jsonText + '{"title":"[COLOR red]NO HOST FOUND[/COLOR]","link":"ignore",'
+        jsonText = jsonText + '"thumbnail":"https://cdn3d.iconscout.com/3d/premium/thumb/watching-movie-4843361-4060927.png",'
+        jsonText = jsonText + '"fanart":"https://www.stadiotardini.it/wp-content/uploads/2016/12/mandrakata.jpg",'
+        jsonText = jsonText + '"info":"NO INFO"}'
+
+    jsonText = jsonText + "]}"
+    logga('JSON-IMDB: %s', jsonText)
+    video_urls.append((jsonText, "PLAY VIDEO", "No info", "noThumb", "json"))
+    return video_urls
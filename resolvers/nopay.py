@@ -0,0 +1,252 @@
+from __future__ import unicode_literals # turns everything to unicode
+# Module: resolvers.nopay
+# Author: ElSupremo
+# Created on: 17.10.2026
+# Last update: 17.10.2026
+# License: GPL v.3 https://www.gnu.org/copyleft/gpl.html
+
+import re, requests
+
+from myResolver import logga, preg_match, PY3, myParse
+from resolvers.useragents import getRandomUA
+from resolvers.hosters import GetLSProData, checkUnpacked, proData
+
+
+def nopay(parIn):
+    import time
+    video_urls = []
+    vUrl = ""
+    logga('CALL NOPAY FOR: '+parIn)
+    randomUa=getRandomUA()
+    head={'user-agent':randomUa,'Content-Type':'application/x-www-form-urlencoded','Referer':'https://amstaff.city/index.php'}
+    page_data = ""
+    
+    try:
+        currSess = requests.Session()
+        p=currSess.get("https://amstaff.city/index.php")
+        time.sleep(1)
+        indexP = currSess.post("https://amstaff.city/index.php", data="password=equino", headers=head)
+        time.sleep(1)
+        page_data = currSess.get(parIn,headers=head).content
+    except:
+        video_urls.append(("ignoreme", "[COLOR red]REQUEST ERROR[/COLOR]", "ERROR", "https://icon-library.com/images/error-icon-transparent/error-icon-transparent-24.jpg"))
+        return video_urls
+    if PY3:
+        try:
+            page_data = page_data.decode('utf-8')
+        except:
+            page_data = page_data.decode('latin1')
+    
+    logga("page_soloper %s", page_data)
+    iframe_url = preg_match(page_data, r"iframe\s*src='([^']+)")
+    
+    logga('IFRAME NOPAY: '+iframe_url)
+    if iframe_url == "":
+        iframe_url = preg_match(page_data, r'iframe\s*src="([^"]+)')
+        logga('IFRAME_2 NOPAY: '+iframe_url)
+
+    if "olalivehdplay.ru" in iframe_url:
+        mpdUrl="https://asdfasdft.hlsjs.ru/fls/cdn/"+iframe_url.split("=")[-1]+"/index.m3u8|connection=keepalive&verifypeer=false&Referer=https:"+iframe_url+"&User-Agent="+randomUa
+        video_urls.append((mpdUrl, "[COLOR lime]PLAY VIDEO[/COLOR]", "PLAY STREAM", "https://res.9appsinstall.com/group4/M00/51/F1/ghoGAFy4guuAJwiKAAAquIT5LH0862.png"))
+        return video_urls
+
+    if (iframe_url.startswith("mix.php") or iframe_url.startswith("italia.php")):
+        mpdUrl=iframe_url.split("#")[1]+"|connection=keepalive&verifypeer=false&Referer="+parIn+"&User-Agent="+randomUa
+        video_urls.append((mpdUrl, "[COLOR lime]PLAY STREAM[/COLOR]", "PLAY STREAM", "https://res.9appsinstall.com/group4/M00/51/F1/ghoGAFy4guuAJwiKAAAquIT5LH0862.png"))
+        mpdUrl=iframe_url.split("#")[1]
+        video_urls.append((mpdUrl, "[COLOR gold]PLAY EXTERNAL[/COLOR]", "PLAY STREAM", "https://res.9appsinstall.com/group4/M00/51/F1/ghoGAFy4guuAJwiKAAAquIT5LH0862.png"))
+        return video_urls
+    
+    if (iframe_url.startswith("hls.php")):
+        mpdUrl=iframe_url.split("#")[1]+"|connection=keepalive&verifypeer=false&Referer="+parIn+"&User-Agent="+randomUa
+        video_urls.append((mpdUrl, "[COLOR lime]PLAY STREAM[/COLOR]", "PLAY STREAM", "https://res.9appsinstall.com/group4/M00/51/F1/ghoGAFy4guuAJwiKAAAquIT5LH0862.png"))
+        mpdUrl=iframe_url.split("#")[1]
+        video_urls.append((mpdUrl, "[COLOR gold]PLAY EXTERNAL[/COLOR]", "PLAY STREAM", "https://res.9appsinstall.com/group4/M00/51/F1/ghoGAFy4guuAJwiKAAAquIT5LH0862.png"))
+        return video_urls
+    
+    if iframe_url.startswith("chrome-extension"):
+        arrV = iframe_url.split("#")
+        video_urls.append((arrV[1], "[COLOR lime]PLAY STREAM[/COLOR]"))
+        return video_urls
+
+    if (iframe_url.startswith("https")):
+        newPage=iframe_url 
+    else:
+        newPage="https:"+iframe_url 
+
+    if "sportsonline" in newPage:
+        return proData(newPage)
+    
+    if "daddylivehd.sx" in newPage or "dlhd.sx" in newPage:
+        jsonText='{"SetViewMode":"503","items":['
+        jsonText = jsonText + '{"title":"[COLOR lime]FIND DADDY VIDEO[/COLOR]","myresolve":"daddy@@'+newPage+'",'
+        jsonText = jsonText + '"thumbnail":"https://techvig.net/wp-content/uploads/2022/07/Daddylive-Alternative-2022.png",'
+        jsonText = jsonText + '"fanart":"https://www.stadiotardini.it/wp-content/uploads/2016/12/mandrakata.jpg",'
+        jsonText = jsonText + '"info":"by MandraKodi"}'
+        jsonText = jsonText + "]}"
+        video_urls.append((jsonText, "FIND VIDEO", "No info", "noThumb", "json"))
+        return video_urls
+    
+    if "projectlive.info" in newPage:
+        return pepper(newPage)
+    
+    if "tutele1.net" in newPage:
+        logga("CALL proData 4 tutele1")
+        vUrl = GetLSProData(newPage, parIn)
+        final_url = vUrl + "|connection=keepalive&verifypeer=false&Referer="+newPage+"&User-Agent="+randomUa
+        video_urls.append((final_url, "[COLOR lime]PLAY STREAM[/COLOR]", "PLAY: "+vUrl, "https://res.9appsinstall.com/group4/M00/51/F1/ghoGAFy4guuAJwiKAAAquIT5LH0862.png"))
+        return video_urls
+    
+    if "embed" in newPage:
+        logga("CALL proData")
+        vUrl = GetLSProData(newPage, parIn)
+        final_url = vUrl + "|connection=keepalive&verifypeer=false&Referer="+newPage+"&User-Agent="+randomUa
+        video_urls.append((final_url, "[COLOR lime]PLAY STREAM[/COLOR]", "PLAY: "+vUrl, "https://res.9appsinstall.com/group4/M00/51/F1/ghoGAFy4guuAJwiKAAAquIT5LH0862.png"))
+        return video_urls
+    
+    try:
+        new_page_data = currSess.get(newPage,headers={'user-agent':randomUa,'accept':'*/*','Referer':parIn}, verify=False).content
+    except:
+        video_urls.append(("ignoreme", "[COLOR red]REQUEST ERROR[/COLOR]", "ERROR", "https://icon-library.com/images/error-icon-transparent/error-icon-transparent-24.jpg"))
+        return video_urls
+    if PY3:
+        try:
+            new_page_data = new_page_data.decode('utf-8')
+        except:
+            new_page_data = new_page_data.decode('latin1')
+
+    video_url = preg_match(new_page_data, r'source:\s*"([^"]+)')
+    if video_url == "":
+        video_url = preg_match(new_page_data, r"source:\s*'([^']+)")
+    if video_url == "":
+        express1 = r"source:'(.*?)'"
+        video_url = preg_match(new_page_data, express1)
+    
+    if video_url != "":
+        vUrl = video_url + '|connection=keepalive&User-Agent='+myParse.quote(randomUa)+'&Referer='+newPage
+    logga('video_url '+vUrl)
+
+    final_url = vUrl
+    video_urls.append((final_url, "[COLOR lime]PLAY STREAM[/COLOR]", "PLAY: "+vUrl, "https://res.9appsinstall.com/group4/M00/51/F1/ghoGAFy4guuAJwiKAAAquIT5LH0862.png"))
+    return video_urls
+
+def pepper(parIn=None):
+    video_urls = []
+    randomUa=getRandomUA()
+    page_data = requests.get(parIn,headers={'user-agent':randomUa,'accept':'*/*','Referer':'https://www.pepperlive.info'}).content
+    if PY3:
+        page_data = page_data.decode('utf-8')
+    iframe_url = preg_match(page_data, '<iframe width="100%" height="100%" allow=\'encrypted-media\' src="(.*?)"')
+    logga('URL PEPPER: https:'+iframe_url)
+    if "amstaff.city" in iframe_url:
+        iframe_url2=iframe_url
+        return nopay("https:"+iframe_url2)
+    if "embed" in iframe_url:
+        iframe_url2=iframe_url
+        video_url=checkUnpacked("https:"+iframe_url2)
+    else:
+        page_data2 = requests.get("https:"+iframe_url,headers={'user-agent':randomUa,'accept':'*/*','Referer':parIn}).content
+        if PY3:
+            try:
+                page_data2 = page_data2.decode('utf-8')
+            except:
+                page_data2 = page_data2.decode('latin1')
+        iframe_url2 = preg_match(page_data2, '<iframe src="(.*?)"')
+        logga('URL PEPPER2: https:'+iframe_url2)
+        video_url = GetLSProData("https:"+iframe_url2, parIn)
+    final_url = video_url + "|connection=keepalive&Referer=https:"+iframe_url2+"&User-Agent="+randomUa
+    video_urls.append((final_url, "[COLOR lime]PLAY STREAM[/COLOR]", "PLAY: "+video_url, "https://www.pepperlive.info/Live1.jpg"))
+    return video_urls
+
+def wigi(parIn=None):
+    import jsunpack
+    logga('PAR_WIGI: '+parIn)
+    if "amstaff.city" in parIn or "nopay2.info" in parIn:
+        return nopay(parIn.replace("nopay.info", "nopay2.info"))
+    
+    video_urls = []
+
+    refe = ""
+    wigiUrl = ""
+    headers = {
+        'user-agent': "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/74.0.3729.131 Safari/537.36"
+    }
+    if "|" in parIn:
+        arr=parIn.split("|")
+        wigiUrl = arr[0]
+        refe = arr[1]
+        headers = {
+            "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/74.0.3729.131 Safari/537.36",
+            "Referer": refe
+        }
+    else:
+       wigiUrl = parIn
+       refe = parIn 
+        
+    logga('URL_WIGI: '+wigiUrl)
+    logga('URL_REFE: '+refe)
+
+    s = requests.Session()
+    fu = s.get(wigiUrl, headers=headers)
+    video_url = wigiUrl
+    try:
+        find = re.findall('eval\(function(.+?.+)', fu.text)[1]
+        unpack = jsunpack.unpack(find)
+        c = re.findall('var src="([^"]*)',unpack)[0]
+        video_url = c + '|referer=' + wigiUrl
+    except:
+        logga("NO PACKED \n%s", fu.text)
+        pass
+
+
+    logga('video_url '+video_url)
+    msg = "[COLOR lime]PLAY STREAM[/COLOR]"
+    if video_url == '' or video_url == wigiUrl:
+        msg = "NO LINK FOUND"
+    video_urls.append((video_url+"&connection=keepalive", msg))
+    return video_urls
+
+def sportOnline(parIn=None):
+    logga('PAR_SPONL: '+parIn)
+    headers = {
+        'user-agent': "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/74.0.3729.131 Safari/537.36"
+    }
+    s = requests.Session()
+    fu = s.get(parIn, headers=headers)
+    find = re.findall('<iframe src="(.*?)"', fu.text)[0]
+    if (find[0:1]=="/"):
+        find="https:"+find
+    logga('IFRAME_SPONL: '+find)
+    return wigi(find+"|https://sportsonline.si/")
+
+def platin(parIn=None):
+    video_urls = []
+    randomUa=getRandomUA()
+    
+    headers = {
+        'user-agent': randomUa
+    }
+
+    s = requests.Session()
+    r = s.get(parIn, headers=headers)
+    logga("FIND HOSTS")
+    ret1 = "by @mandrakodi"
+    
+    express1 = r'<a href="acestream://(.*?)" rel="nofollow">(.*?)</a>'
+    ret1 = re.compile(express1, re.MULTILINE | re.DOTALL).findall(r.text)
+
+    for aceId, aceTit in ret1:
+        video_urls.append(("acestream://"+aceId, "[COLOR lime]"+aceTit+" (ACE)[/COLOR]"))
+    
+    express2 = r'<a href="(.*?)" target="_blank" rel="noopener"><button'
+    ret2 = re.compile(express2, re.MULTILINE | re.DOTALL).findall(r.text)
+    numL=0
+    for linkTmp in ret2:
+        logga("TRY FOR "+linkTmp)
+        try:
+            video_url = proData(linkTmp.replace(" ", ""), 1)
+            numL=numL+1
+            video_urls.append((video_url, "[COLOR aqua]STREAM "+str(numL)+"[/COLOR]"))
+        except:
+            pass
+    return video_urls
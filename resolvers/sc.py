@@ -0,0 +1,278 @@
+from __future__ import unicode_literals # turns everything to unicode
+# Module: resolvers.sc
+# Author: ElSupremo
+# Created on: 17.10.2026
+# Last update: 17.10.2026
+# License: GPL v.3 https://www.gnu.org/copyleft/gpl.html
+
+import re, requests, sys, logging
+
+import xbmcgui
+
+from myResolver import logga, preg_match, makeRequest, settings, PY3
+from resolvers.useragents import getRandomUA
+
+
+def scommunity(parIn=None):
+    import time, json
+    sc_url="https://raw.githubusercontent.com/mandrakodi/mandrakodi.github.io/main/data/cs_url.txt"
+    scUrl=makeRequest(sc_url)
+    base=scUrl.replace("\n", '')+"watch/"
+    
+    randomUA=getRandomUA()
+
+    headSCt={'user-agent':randomUA}
+    urlComm = base + parIn
+    logga("urlComm => "+urlComm)
+    s = requests.Session()
+    r = s.get(urlComm, headers=headSCt) 
+
+    time.sleep(2.5)
+
+    s = requests.Session()
+    page_data = s.get(urlComm, headers=headSCt).content
+    if PY3:
+        page_data = page_data.decode('utf-8')
+    #writeFileLog("SCOMM_PAGE: "+urlComm+"\n\n"+page_data, "w+")
+    #patron = r'<video-player response="(.*?)">'
+    patron = r'<div id="app" data-page="(.*?)">'
+    jsonVideo = preg_match(page_data, patron)
+    dataJson=jsonVideo.replace('&quot;', '"')
+    arrJ = json.loads(dataJson)
+    nameEp=arrJ["props"]["episode"]["name"]
+    numEp=arrJ["props"]["episode"]["number"]
+    numSeason=arrJ["props"]["episode"]["season"]["number"]
+    titleEp=str(numSeason)+"x"+str(numEp)+" - "+nameEp
+    scws_id = arrJ["props"]["episode"]["scws_id"]
+    logga("scws_id => "+str(scws_id))
+    return getUrlSc(str(scws_id), titleEp)
+
+def getUrlSc(scws_id, tit=None):
+    logga('getUrlSc '+scws_id)
+    from time import time
+    from base64 import b64encode
+    from hashlib import md5
+    import json
+    titolo="PLAY VIDEO"
+    if tit != None:
+        titolo=tit
+    video_urls = []
+    randomUA=getRandomUA()
+    
+    randomUA="PlusMediaPlayer/0.0.9"
+    page_data = requests.get("http://test34344.herokuapp.com/getMyIp.php", headers={'user-agent':'Mozilla/5.0','accept':'*/*'}).content
+    if PY3:
+        page_data = page_data.decode('utf-8')
+    logga('IP_community %s', page_data)
+    try:
+        arrJ2 = json.loads(page_data)
+        clientIp = arrJ2["client_ip"]
+        logga("LOCAL IP: "+clientIp)
+    except:
+        logga("NO LOCAL IP")
+    if clientIp:
+        expires = int(time() + 172800)
+        token = b64encode(md5('{}{} Yc8U6r8KjAKAepEA'.format(expires, clientIp).encode('utf-8')).digest()).decode('utf-8').replace('=', '').replace('+', '-').replace('/', '_')
+        url = 'https://scws.work/master/{}?token={}&expires={}&canCast=1&b=1&n=1'.format(scws_id, token, expires)
+        url4 = url
+        #url4 = url + "|User-Agent="+randomUA
+        video_urls.append((url4, "[COLOR lime]"+titolo+"[/COLOR]", "by @mandrakodi", "https://cdn3d.iconscout.com/3d/premium/thumb/watching-movie-4843361-4060927.png"))
+    return video_urls
+
+def scwsNew(parIn=None, parInp2=0):
+    import json
+    logga("SCWS: "+parIn)
+    video_urls = []
+
+    sc_url="https://raw.githubusercontent.com/mandrakodi/mandrakodi.github.io/main/data/cs_url.txt"
+    scUrl=makeRequest(sc_url)
+    base=scUrl.replace("\n", '')+"it/iframe/"+parIn
+
+    randomUA=getRandomUA()
+
+    headSCt={'user-agent':randomUA}
+
+    pageT = requests.get(base,headers=headSCt).content
+    if PY3:
+        pageT = pageT.decode('utf-8')
+    pageT = pageT.replace("\n", "").replace("\r", "").replace("\t", "")
+    #logga("SC_PAGE: "+pageT)
+    patron = r'src="(.*?)"'
+    m3u8Url = preg_match(pageT, patron)
+    logga("URL_M3U8: "+m3u8Url)
+    arrT=m3u8Url.split("?")
+    arrPar=m3u8Url.split("&amp;")
+    baseUrl=arrT[0]
+    pageT2 = requests.get(m3u8Url.replace("&amp;", "&"),headers=headSCt).content
+    if PY3:
+        pageT2 = pageT2.decode('utf-8')
+    pageT3=pageT2.replace("\n", "").replace("\r", "").replace("\t", "")
+    logga("pageT2: %s", pageT3)
+    urlSc="ignore"
+    tito="[COLOR lime]PLAY VIDEO SC[/COLOR]"
+    try:    
+        patron = r"window.masterPlaylist\s=\s{\s.*params:\s(.*?)},\s.*url:\s'(.*?)'"
+        res = preg_match(pageT3, patron)
+        jsonUrl = ""
+        jsonUrl = res[0]+'"url":"'+res[1]+'"}'
+            
+        #jsonUrl = preg_match(pageT3, patron)+'"sex":"ok"}'
+        logga("JSON_M3U8: "+jsonUrl.replace("'", '"'))
+        arrJ2 = json.loads(jsonUrl.replace("'", '"'))
+        urlSc=baseUrl.replace("embed", "playlist")+"?token="+arrJ2["token"]+"&expires="+arrJ2["expires"]+"&n=1"
+        urlTmp=arrJ2["url"]
+        if "?" in urlTmp:
+            urlSc=urlTmp+"&token="+arrJ2["token"]+"&expires="+arrJ2["expires"]+"&n=1"
+        else:
+           urlSc=urlTmp+"?token="+arrJ2["token"]+"&expires="+arrJ2["expires"]+"&n=1" 
+        newPar=""
+        numPar=0
+        for param in arrPar:
+            if numPar > 0:
+                arrP2=param.split("=")
+                if (arrP2[0]=="canPlayFHD"):
+                    urlSc= urlSc + "&h=1"
+                if (arrP2[0]=="b"):
+                    urlSc= urlSc + "&b=1"
+                #newPar = newPar+"&"+param
+            numPar=numPar+1
+        #urlSc= urlSc + newPar
+        logga("FINAL URL: "+urlSc)
+    except:
+        tito="[COLOR red]NO VIDEO FOUND[/COLOR]"
+    newUrl=urlSc+"|referer="+scUrl.replace("\n", '')+"&user-agent=Mozilla"
+    video_urls.append((newUrl, tito, "by @mandrakodi", "https://cdn3d.iconscout.com/3d/premium/thumb/watching-movie-4843361-4060927.png"))
+    
+    if parInp2==1:
+        liz = xbmcgui.ListItem('MovieUnity', path=newUrl)
+        liz.setProperty('inputstream', 'inputstream.ffmpegdirect')
+        liz.setMimeType('application/x-mpegURL')
+        liz.setProperty('inputstream.ffmpegdirect.manifest_type', 'hls')
+        liz.setProperty('inputstream.ffmpegdirect.is_realtime_stream', 'true')
+        timeShift = settings.get("urlAppo4")
+        if timeShift != "no_time_shift":
+            liz.setProperty('inputstream.ffmpegdirect.stream_mode', 'timeshift')
+        
+        return liz
+    
+    return video_urls
+
+def scws(parIn=None):
+    import json
+    
+    
+    sc_url="https://raw.githubusercontent.com/mandrakodi/mandrakodi.github.io/main/data/cs_url.txt"
+    scUrl=makeRequest(sc_url)
+    base=scUrl.replace("\n", '')+"it/titles/"+parIn
+    randomUA=getRandomUA()
+
+    headSCt={'user-agent':randomUA}
+    pageT = requests.get(base,headers=headSCt).content
+    if PY3:
+        pageT = pageT.decode('utf-8')
+    patron = r'<div id="app" data-page="(.*?)"'
+    jsonCode = preg_match(pageT, patron)
+    scwsId = 0
+    titolo="NOT FOUND";
+    try:
+        arrJ2 = json.loads(jsonCode.replace("&quot;", '"'))
+        scwsId = arrJ2["props"]["title"]["scws_id"]
+        titolo = arrJ2["props"]["title"]["name"]
+    except:
+        logga("NO SCWS_ID FROM "+base)
+    return getUrlSc(scwsId, titolo)
+
+def getScSerie(parIn=None):
+    import json
+    logga("PAR_IN "+parIn)
+    video_urls = []
+    jsonText=""
+    x = parIn.split("---")
+    idSea=x[0]
+    numSea=x[1]
+    sc_url="https://raw.githubusercontent.com/mandrakodi/mandrakodi.github.io/main/data/cs_url.txt"
+    scUrl=makeRequest(sc_url)
+    base=scUrl.replace("\n", '')+"it/titles/"+idSea+"/season-"+numSea
+    randomUA=getRandomUA()
+
+    headSCt={'user-agent':randomUA}
+    pageT = requests.get(base,headers=headSCt).content
+    if PY3:
+        pageT = pageT.decode('utf-8')
+    patron = r'<div id="app" data-page="(.*?)"'
+    jsonCode = preg_match(pageT, patron)
+    scwsId = 0
+    titolo="NOT FOUND";
+    logga ("JSON_CODE: %s", jsonCode)
+    try:
+        arrJ2 = json.loads(jsonCode.replace("&quot;", '"'))
+        
+        titolo = arrJ2["props"]["title"]["name"]
+        logga("titolo: "+titolo)
+        img=""
+        jsonText='{"SetViewMode":"503","items":['
+        numIt=0
+        for (immagine) in arrJ2["props"]["title"]["images"]:
+            if (immagine["type"]=="cover"):
+                img="https://cdn."+scUrl.replace("\n", '').replace("https://", '')+"images/"+immagine["filename"]
+                logga("img: "+img)
+        for (episodio) in arrJ2["props"]["loadedSeason"]["episodes"]:
+            scwsId = str(episodio["scws_id"])
+            urlIframe=idSea+"?episode_id="+str(episodio["id"])
+            logga("urlIframe: "+urlIframe)
+            numEp=str(episodio["number"])
+            if (len(numEp)==1):
+                numEp="0"+numEp
+            logga("numEp: "+numEp)
+            plot = "by MandraKodi"
+            try:
+                plot = episodio["plot"].replace("&#39;", "'").replace("&amp;", "&").replace("\n", " ").replace("\r", " ")
+            except:
+                pass    
+            
+            try:
+                imgEp="https://cdn."+scUrl.replace("\n", '').replace("https://", '')+"images/"+episodio["images"][0]["filename"]
+            except:
+                imgEp=img
+            
+            eps="Episodio "+numEp
+            try:
+                eps=episodio["name"].replace("&#39;", "'").replace("&amp;", "&")
+            except:
+                pass
+
+            
+            try:
+                titolo=numSea+"x"+numEp+" - "+eps
+            
+                newJson = '{"title":"[COLOR lime]'+titolo+'[/COLOR]","myresolve":"scws2@@'+urlIframe+'",'
+                newJson += '"thumbnail":"'+imgEp+'",'
+                newJson += '"fanart":"https://www.stadiotardini.it/wp-content/uploads/2016/12/mandrakata.jpg",'
+                newJson += '"info":"'+plot.replace('"','\\"')+'"}'
+                json.loads(newJson)
+                if (numIt > 0):
+                    jsonText += ','
+                jsonText +=  newJson
+                numIt += 1
+            except:
+                logga("BAD ITEMS: %s", newJson)
+                pass
+    except Exception as err:
+        import traceback
+        
+        errMsg="ERROR_MK2: {0}".format(err)
+        par=re.split('%3f', sys.argv[2])
+        parErr = par[-1]
+        logging.warning(errMsg+"\nPAR_ERR --> "+parErr)
+        traceback.print_exc()
+
+        logga("NO SCWS_ID FROM "+base)
+        jsonText = jsonText + '{"title":"[COLOR red]NO PAGE FOUND[/COLOR]","link":"ignore",'
+        jsonText = jsonText + '"thumbnail":"https://cdn-icons-png.flaticon.com/512/2748/2748558.png",'
+        jsonText = jsonText + '"fanart":"https://www.stadiotardini.it/wp-content/uploads/2016/12/mandrakata.jpg",'
+        jsonText = jsonText + '"info":"NO PAGE FOUND"}'
+
+    jsonText = jsonText + "]}"
+    #logga('JSON-SC: '+jsonText)
+    video_urls.append((jsonText, "PLAY VIDEO", "No info", "noThumb", "json"))
+    return video_urls
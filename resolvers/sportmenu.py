@@ -0,0 +1,566 @@
+from __future__ import unicode_literals # turns everything to unicode
+# Module: resolvers.sportmenu
+# Author: ElSupremo
+# Created on: 17.10.2026
+# Last update: 17.10.2026
+# License: GPL v.3 https://www.gnu.org/copyleft/gpl.html
+
+import re, requests
+
+from myResolver import logga
+
+
+def createSportMenu(parIn=""):
+    if parIn=="nopay":
+        return nopayMenu()
+    if parIn=="zonline":
+        return sportsonlineMenu()
+    if parIn=="daddy":
+        return daddyLiveMenu()
+    if parIn=="platin":
+        return platinumMenu()
+    if parIn=="ppv":
+        return ppvMenu()
+
+def ppvMenu():
+    import json
+    from datetime import datetime
+    video_urls = []
+
+    # Scarica la pagina
+    page = requests.get("https://ppvs.su/api/streams").text
+    arrJ = json.loads(page)
+
+    arrEv = []
+
+    # Prima parte: costruzione dell'array ordinabile
+    for event in arrJ["streams"]:
+        sport = event["category"]
+        if sport == "Football":
+            sport =" Calcio"
+        for gara in event["streams"]:
+            comp = gara["tag"]
+            match = gara["name"]
+            poster = gara["poster"]
+            url = gara["iframe"]
+            date = gara["starts_at"]
+
+            arrEv.append(f"{sport}@@{date}@@{comp}@@{match}@@{poster}@@{url}")
+
+    # Ordina come in PHP
+    arrEv.sort()
+
+    # Seconda parte: costruzione struttura finale
+    toRet = {"SetViewMode": "50", "channels": []}
+
+    numGroup = -1
+    oldSport = ""
+    numIt = 0
+
+    for row in arrEv:
+        sport, date, comp, match, poster, url = row.split("@@")
+
+        # PHP: $quando = date("Y-m-d H:i", intval($date)+3600)
+        quando = datetime.utcfromtimestamp(int(date) + 3600).strftime("%Y-%m-%d %H:%M")
+
+        if sport == "24/7 Streams":
+            continue
+        
+        
+        # Nuovo gruppo di sport
+        if oldSport != sport:
+            numGroup += 1
+            oldSport = sport
+
+            toRet["channels"].append({
+                "name": f"[COLOR gold]{sport}[/COLOR]",
+                "thumbnail": "https://thumbs.dreamstime.com/b/logos-d-annata-misto-di-sport-di-vettore-73688323.jpg",
+                "fanart": "https://www.stadiotardini.it/wp-content/uploads/2016/12/mandrakata.jpg",
+                "SetViewMode": "50",
+                "items": []
+            })
+            numIt = 0
+
+        # Aggiunge item evento
+        toRet["channels"][numGroup]["items"].append({
+            "title": f"[COLOR gold]{quando}[/COLOR] [COLOR aqua]{comp}[/COLOR] [COLOR lime]{match}[/COLOR]",
+            "myresolve": f"ppv@@{url}",
+            "thumbnail": poster,
+            "fanart": "https://www.stadiotardini.it/wp-content/uploads/2016/12/mandrakata.jpg",
+            "info": match
+        })
+
+        numIt += 1
+
+    # Output finale JSON formattato
+    jsonText=json.dumps(
+        toRet,
+        ensure_ascii=False,
+        indent=4
+    )
+    video_urls.append((jsonText, "PLAY VIDEO", "No info", "noThumb", "json"))
+    return video_urls
+
+def platinumMenu():
+    video_urls = []
+
+    url="https://www.platinsport.com/"
+    headers = {
+        'user-agent': "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/74.0.3729.131 Safari/537.36"
+    }
+    s = requests.Session()
+    ret1 = s.get(url, headers=headers)
+    htmlFlat=ret1.text.replace("\n", '').replace("\r", '').replace("\t", '')
+    express2 = r'<td><img decoding="async" class="(.*?)" src="(.*?)" (.*?)/></td><td>(.*?)</td><td><a href="http://bc.vc/(.*?)/(.*?)" target="_blank" rel="noopener noreferrer">'
+    #express2 = r'<td><img decoding="async" loading="lazy" class="(.*?)" src="(.*?)" (.*?)/></td><td>(.*?)</td><td><a href="http://bc.vc/(.*?)/(.*?)" target="_blank" rel="noopener noreferrer">'
+    ret = re.compile(express2, re.MULTILINE | re.DOTALL).findall(htmlFlat)
+    jsonText='{"SetViewMode":"51","items":['
+    numIt=0
+    for (par1, img, par2, tit, par3, link) in ret:
+        if (numIt > 0):
+            jsonText = jsonText + ','    
+        newTit = re.sub('[^a-zA-Z0-9 \n\.]', 'I', tit)
+        jsonText = jsonText + '{"title":"[COLOR lime]'+newTit.replace("II", 'I')+'[/COLOR]","myresolve":"platin@@'+link+'",'
+        jsonText = jsonText + '"thumbnail":"'+img+'",'
+        jsonText = jsonText + '"fanart":"https://www.stadiotardini.it/wp-content/uploads/2016/12/mandrakata.jpg",'
+        jsonText = jsonText + '"info":"'+tit+'"}'
+        numIt=numIt+1
+    
+    if numIt==0:
+        jsonText = jsonText + '{"title":"[COLOR red]NO MATCH FOUND[/COLOR]","link":"ignore",'
+        jsonText = jsonText + '"thumbnail":"https://cdn3d.iconscout.com/3d/premium/thumb/watching-movie-4843361-4060927.png",'
+        jsonText = jsonText + '"fanart":"https://www.stadiotardini.it/wp-content/uploads/2016/12/mandrakata.jpg",'
+        jsonText = jsonText + '"info":"NO INFO"}'
+
+    jsonText = jsonText + "]}"
+    logga('JSON-PLATIN: %s', jsonText)
+    video_urls.append((jsonText, "PLAY VIDEO", "No info", "noThumb", "json"))
+    return video_urls
+
+def getSportLogo(sportName):
+    toRet="https://autyzmwszkole.files.wordpress.com/2015/11/sport2.jpg"
+    if (sportName=="Soccer" or sportName==" Calcio"):
+        toRet="https://play-lh.googleusercontent.com/lsJjbVdV5fNzgVS9RALpiPxUWcZkHkCQAxD7I_26d-gGejt45r1SNZV5-lFBfQtcHg"
+    if (sportName=="Cricket"):
+        toRet="https://seeklogo.com/images/C/cricket-logo-DC6957DD66-seeklogo.com.png"
+    if (sportName=="Tennis"):
+        toRet="https://img.bestdealplus.com/ae04/kf/Hf448267801434196b98c876992ed9bc3Y.jpg";
+    if (sportName=="MMA"):
+        toRet="https://i.pinimg.com/originals/ac/00/d5/ac00d52d06acbbd6ce3af3777e785e23.jpg";
+    if "Moto" in sportName or "moto" in sportName:
+        toRet="https://i.pinimg.com/originals/c6/1d/d2/c61dd299176c82de8bde053331e76e17.jpg";
+    if (sportName=="Golf"):
+        toRet="https://chip-ing.com/wp-content/uploads/2021/10/Golfer_1-1170x10331-1-1024x904.png";
+    if (sportName=="Baseball"):
+        toRet="https://seeklogo.com/images/R/red-and-black-baseball-logo-BAE3744108-seeklogo.com.png";
+    if (sportName=="Basketball" or sportName=="Basket"):
+        toRet="https://i.pinimg.com/originals/97/b5/95/97b595b930ac325d7e03a2c0d84c265b.jpg";
+    if "Hockey" in sportName:
+        toRet="https://image.freepik.com/vettori-gratuito/distintivo-di-hockey-su-ghiaccio-logo-modello-di-torneo-della-squadra-emblema_7112-199.jpg";
+    if "Combat"in sportName:
+        toRet="https://pngimg.com/d/ufc_PNG75.png";
+    if (sportName=="Cycling"):
+        toRet="https://freepngimg.com/download/bike/23211-1-bike-ride-image.png";
+    if (sportName=="Beach Soccer"):
+        toRet="https://images.squarespace-cdn.com/content/v1/5a32532ae9bfdfec59a39d04/1516203783799-49KUS1XV4XH0174U1E5E/Beach+Soccer.png";
+    if (sportName=="Darts"):
+        toRet="https://img.freepik.com/free-vector/darts-game-emblem_109132-92.jpg";
+    if (sportName=="Badminton"):
+        toRet="https://banner2.cleanpng.com/20180324/fye/kisspng-badminton-shuttlecock-yonex-logo-sport-badminton-5ab6916c3415b0.2726775915219142202134.jpg";
+    if (sportName=="Futsal"):
+        toRet="https://images-platform.99static.com/2YNHyBVTpcMsiCsLid0oJkDtUkQ=/0x0:2000x2000/500x500/top/smart/99designs-contests-attachments/112/112918/attachment_112918109";
+    if "Rugby" in sportName:
+        toRet="https://image.freepik.com/vettori-gratuito/rugby-logo-american-logo-sport_7112-532.jpg"
+    if "Aussie" in sportName:
+        toRet="https://image.freepik.com/vettori-gratuito/rugby-logo-american-logo-sport_7112-532.jpg"
+    if "Equestrian" in sportName or "Horse" in sportName:
+        toRet="https://i.pinimg.com/originals/43/72/58/437258335411310ed156680a78f1b911.jpg"
+    if (sportName=="Tennis da tavolo"):
+        toRet="https://e7.pngegg.com/pngimages/783/738/png-clipart-table-tennis-racket-addicting-games-ping-pong-game-sports-thumbnail.png"
+    if (sportName=="Chess"):
+        toRet="https://i.pinimg.com/736x/3c/4f/18/3c4f1886e5b1d47f3126703fd20f56b7.jpg"
+    if (sportName=="Pallamano" or sportName=="Handball"):
+        toRet="https://png.pngitem.com/pimgs/s/19-197475_handball-logo-minis-handball-logo-hd-png-download.png"
+    if (sportName=="Pallavolo" or sportName=="Volleyball"):
+        toRet="https://cdn6.f-cdn.com/contestentries/1471562/33395594/5c789de756a88_thumb900.jpg"
+    if (sportName=="WWE"):
+        toRet="https://www.wrestling-news.net/wp-content/uploads/2019/04/WWE.png"
+    if (sportName=="Snooker"):
+        toRet="https://t3.ftcdn.net/jpg/03/20/04/28/360_F_320042878_AJvfy22rnAtFZ6msEOhXlGMM2hbCBXYC.jpg"
+    if "Ski" in sportName:
+        toRet="https://us.123rf.com/450wm/baldyrgan/baldyrgan1701/baldyrgan170100008/69262433-sci-simbolo-stilizzato-logo-o-emblema-modello.jpg?ver=6"
+    if (sportName=="Boxe" or sportName=="Boxing" or sportName=="Pugilato"):
+        toRet="https://image.freepik.com/vecteurs-libre/logo-graphique-insigne-boxe_24908-54891.jpg"
+    if (sportName=="Lacrosse"):
+        toRet="https://img0-placeit-net.s3-accelerate.amazonaws.com/uploads/stage/stage_image/30400/optimized_large_thumb_stage.jpg"
+    if (sportName=="WaterPolo"):
+        toRet="https://images.vexels.com/media/users/3/203460/isolated/preview/57a4cd98f07284a832f66e0c726e1e30-waterpolo-male-player-blue.png"
+    if (sportName=="Biathlon"):
+        toRet="https://skitrax.com/wp-content/uploads/2017/02/IBU-Logo.3-2017-01-22-at-6.55.22-AM.png"
+    if (sportName=="Squash"):
+        toRet="https://www.pngkit.com/png/full/206-2061953_squash-player-png.png"
+    if (sportName=="Kick Volleyball"):
+        toRet="https://i.pinimg.com/originals/4f/59/af/4f59af612f275a1420724dff57baecff.png"
+    if "Sailing" in sportName or "Boating" in sportName:
+        toRet="https://second-hand.decathlon.it/bundles/front/img/icons-sports/minis/canoeing.png"
+	
+    return toRet
+
+def daddyLiveMenu():
+    import re, datetime
+    video_urls = []
+    url="https://daddylivehd.sx/"
+    headers = {
+        'user-agent': "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/74.0.3729.131 Safari/537.36"
+    }
+    s = requests.Session()
+    r = s.get(url, headers=headers)
+    dataFile = r.text.replace("\n", "").replace("\r", "").replace("\t", "")
+    arrDiv = dataFile.split("<h2")
+    #logga("H2: "+str(len(arrDiv)))
+    arrTemp = []
+    logoSp="https://autyzmwszkole.files.wordpress.com/2015/11/sport2.jpg"
+    cont=0
+    okRow=0
+    for div in arrDiv:
+        cont=cont+1
+        if cont==1:
+            continue
+        #logga ("DIV DADDY: "+div)
+        if "background-color" in div:
+            #logga ("OK BGR")
+            express = r'>(.*?)</h2>'
+            try:
+                sportName = re.compile(express, re.MULTILINE | re.DOTALL).findall(div)[0]
+                #logga("sportName: "+sportName)
+                if sportName == "Soccer":
+                    sportName = " Calcio"
+                    okRow=1
+            except:
+                pass
+            if okRow==0:
+                continue
+            logoSp=getSportLogo(sportName)
+            arrH=div.split("<hr>")
+            #logga("HR: "+str(len(arrH)))
+            conta=0
+            for hr in arrH:
+                conta=conta+1
+                if conta==1:
+                    continue
+                arrEv=hr.split("<span")
+                titol=arrEv[0].replace("<strong>", "").replace("</strong>", "")
+                #logga ("titolo: "+titol)
+                if "<" in titol or len(titol) < 6:
+                    continue
+                hh = titol[0:2]
+                mm = titol[3:5]
+                dt = datetime.datetime(2000, 6, 10, int(hh), int(mm), 45)
+                dt1 = dt + datetime.timedelta(hours=-3)
+                newDate = dt1 + datetime.timedelta(minutes=-30)
+                hh2=str(newDate.hour)
+                if newDate.hour < 10:
+                    hh2="0"+str(newDate.hour)
+                mm2=str(newDate.minute)
+                if newDate.minute < 10:
+                    mm2="0"+str(newDate.minute)
+                timeMatch=hh2+":"+mm2
+                titolo=timeMatch+titol[5:]
+                links=hr[len(titolo):]
+                if "|" in links:
+                    arrPP = links.split("|")
+                    for tfgr in arrPP:
+                        express = r'href="(.*)" target'
+                        ret1 = re.compile(express, re.MULTILINE | re.DOTALL).findall(tfgr)
+                        express = r'"noopener">(.*)</a>'
+                        ret2 = re.compile(express, re.MULTILINE | re.DOTALL).findall(tfgr)
+                        numRe=0
+                        oldTit=""
+                        for linkR in ret1:
+                            if linkR.startswith("/extra"):
+                                logga("NO BUONO")
+                            else:
+                                try:
+                                    titR=ret2[numRe]
+                                    oldTit=titR
+                                except:
+                                    logga("NO TIT FOR "+sportName+" - "+titolo+" ["+str(numRe))
+                                    titR=oldTit
+
+                                arrTemp.append(sportName+"@@"+titolo+"@@"+logoSp+"@@"+linkR+"@@"+titR)
+                                numRe=numRe+1
+                else:
+                    express = r'href="(.*)" target'
+                    ret1 = re.compile(express, re.MULTILINE | re.DOTALL).findall(links)
+                    express = r'"noopener">(.*)</a>'
+                    ret2 = re.compile(express, re.MULTILINE | re.DOTALL).findall(links)
+                    numRe=0
+                    for linkR in ret1:
+                        titR=ret2[numRe]
+                        if linkR.startswith("/extra"):
+                            logga("NO BUONO")
+                        else:
+                            arrTemp.append(sportName+"@@"+titolo+"@@"+logoSp+"@@"+linkR+"@@"+titR)
+                            numRe=numRe+1
+
+                
+
+            
+    jsonText='{"SetViewMode":"50","channels":['
+    sorted(arrTemp)
+    oldSport=""
+    numCh=0
+    numIt=0
+    for row in arrTemp:
+        arrRow=row.split("@@")        
+        sport=arrRow[0]
+        match=arrRow[1]
+        logo=arrRow[2]
+        link=arrRow[3]
+        ch=arrRow[4]
+        if oldSport != sport:
+            if (numCh > 0):
+                jsonText = jsonText + ']},'    
+            jsonText = jsonText + '{"name":"[COLOR gold]'+sport.strip()+'[/COLOR] ",'
+            jsonText = jsonText + '"thumbnail":"'+logo+'",'
+            jsonText = jsonText + '"fanart":"https://www.stadiotardini.it/wp-content/uploads/2016/12/mandrakata.jpg",'
+            jsonText = jsonText + '"SetViewMode":"51","items":['
+            oldSport = sport
+            numIt=0
+            numCh=numCh+1
+        if (numIt > 0):
+            jsonText = jsonText + ','    
+        
+        jsonText = jsonText + '{"title":"[COLOR lime]'+match.strip()+'[/COLOR] [COLOR orange]'+ch+'[/COLOR]",'
+        jsonText = jsonText + '"myresolve":"daddy@@https://dlhd.sx'+link+'",'
+        jsonText = jsonText + '"thumbnail":"'+logo+'",'
+        jsonText = jsonText + '"fanart":"https://www.stadiotardini.it/wp-content/uploads/2016/12/mandrakata.jpg",'
+        jsonText = jsonText + '"info":"by MandraKodi"}'
+        numIt=numIt+1
+    
+    if (numIt > 0):
+        jsonText = jsonText + ']}' 
+
+    
+    if numIt==0:
+        jsonText = '{"SetViewMode":"503","items":[{"title":"[COLOR red]NO MATCH FOUND[/COLOR]","link":"ignore",'
+        jsonText = jsonText + '"thumbnail":"https://www.avis.it/wp-content/uploads/2018/06/Sport_balls.png",'
+        jsonText = jsonText + '"fanart":"https://www.stadiotardini.it/wp-content/uploads/2016/12/mandrakata.jpg",'
+        jsonText = jsonText + '"info":"NO INFO"}'
+
+    jsonText = jsonText + "]}"
+    logga('JSON-DADDY: %s', jsonText)
+    video_urls.append((jsonText, "PLAY VIDEO", "No info", "noThumb", "json"))
+    return video_urls
+
+def sportsonlineMenu():
+    import datetime
+    video_urls = []
+
+    arrWeek={"SUNDAY", "MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY", "SATURDAY"}
+    url="https://sportsonline.st/prog.txt"
+    headers = {
+        'user-agent': "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/74.0.3729.131 Safari/537.36"
+    }
+    s = requests.Session()
+    r = s.get(url, headers=headers)
+    jsonText='{"SetViewMode":"500","channels":['
+    #arrLine = r.text.splitlines
+    numIt=0
+    numCh=0
+    start=0
+    for line in r.text.splitlines():
+        if line == "" or line[0:1]== "." or line[0:1]== "|":
+            continue
+        logga("ROW: "+line)
+        for day in arrWeek:
+            if day in line:
+                if (numCh > 0):
+                    jsonText = jsonText + ']},'    
+                jsonText = jsonText + '{"name":"[COLOR gold]'+line.strip()+'[/COLOR] ",'
+                jsonText = jsonText + '"thumbnail":"https://freepngimg.com/download/calendar/4-2-calendar-png-hd.png",'
+                jsonText = jsonText + '"fanart":"https://www.stadiotardini.it/wp-content/uploads/2016/12/mandrakata.jpg",'
+                jsonText = jsonText + '"SetViewMode":"51","items":['
+                numIt=0
+                numCh=numCh+1
+                start=1
+        if start==1:
+            if "|" in line:
+                arrT=line.split("|")
+                titolMatch=arrT[0].replace(" x ", " vs ").replace(" @ ", " vs ")
+                hh = titolMatch[0:2]
+                mm = titolMatch[3:5]
+                titMatch=titolMatch[6:].strip()
+                newTit = re.sub('[^a-zA-Z0-9 \n\.]', '*', titMatch)
+                timeMatch="00:00"
+                try:
+                    dt = datetime.datetime(2000, 6, 10, int(hh), int(mm), 45)
+                    newDate = dt + datetime.timedelta(hours=1)
+                    hh2=str(newDate.hour)
+                    if newDate.hour < 10:
+                        hh2="0"+str(newDate.hour)
+                    mm2=str(newDate.minute)
+                    if newDate.minute < 10:
+                        mm2="0"+str(newDate.minute)
+                    timeMatch=hh2+":"+mm2
+                except:
+                    pass
+                linkMatch=arrT[1].strip()
+                arrL=linkMatch.split("/")
+                tit=arrL[-1].replace(".php", "")
+                if (numIt > 0):
+                    jsonText = jsonText + ','    
+                
+                jsonText = jsonText + '{"title":"[COLOR gold]'+timeMatch+'[/COLOR] [COLOR lime]'+newTit.strip()+'[/COLOR] [COLOR aqua]('+tit+')[/COLOR]",'
+                #jsonText = jsonText + '"myresolve":"spon@@'+linkMatch.replace("v2.sportsonline", "sportsonline")+'",'
+                jsonText = jsonText + '"myresolve":"spon@@'+linkMatch+'",'
+                jsonText = jsonText + '"thumbnail":"https://www.avis.it/wp-content/uploads/2018/06/Sport_balls.png",'
+                jsonText = jsonText + '"fanart":"https://www.stadiotardini.it/wp-content/uploads/2016/12/mandrakata.jpg",'
+                jsonText = jsonText + '"info":"by MandraKodi"}'
+                numIt=numIt+1
+            #except:
+                #logga("ERRORE")
+                #pass
+    if (numIt > 0):
+        jsonText = jsonText + ']}' 
+
+
+    
+    
+    
+    if numIt==0:
+        jsonText = '{"SetViewMode":"503","items":[{"title":"[COLOR red]NO MATCH FOUND[/COLOR]","link":"ignore",'
+        jsonText = jsonText + '"thumbnail":"https://www.giardiniblog.it/wp-content/uploads/2018/12/serie-tv-streaming.jpg",'
+        jsonText = jsonText + '"fanart":"https://www.stadiotardini.it/wp-content/uploads/2016/12/mandrakata.jpg",'
+        jsonText = jsonText + '"info":"NO INFO"}'
+
+    jsonText = jsonText + "]}"
+    logga('JSON-ZONLINE: %s', jsonText)
+    video_urls.append((jsonText, "PLAY VIDEO", "No info", "noThumb", "json"))
+    return video_urls
+
+def nopayMenu(parIn=""):
+    import re
+    video_urls = []
+
+    url="https://nopay2.info/"
+
+    
+    headers = {
+        'user-agent': "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/74.0.3729.131 Safari/537.36"
+    }
+    s = requests.Session()
+    r = s.get(url, headers=headers)
+    
+    express1 = r'<div class="card text(.*?)>(.*?)</div></div></div>'
+    htmlFlat=r.text.replace("\n", "").replace("\r", "").replace("\t", "")
+    #logga("HTML\n"+htmlFlat)
+    ret1 = re.compile(express1, re.MULTILINE | re.DOTALL).findall(htmlFlat)
+    #logga("TROVATI "+str(len(ret1[0]))+" RECORDS")
+    arrTemp = []
+    for card, div in ret1:
+        express2 = r'<div class="card-header" style="background-image: (.*?)">(.*?)</div>'
+        ret2 = re.compile(express2, re.MULTILINE | re.DOTALL).findall(div)
+        immagine=""
+        evento=""
+        for (img, event) in ret2:
+            immagine=img.replace("url(", "").replace(");", "")
+            evento=event.replace("\n", "").replace("\r", "").replace("\t", "").replace("<br>", "")
+
+        expressDay = r'<div class="card-body"><p>(.*?)</p>'
+        day = re.compile(expressDay, re.MULTILINE | re.DOTALL).findall(div)[0]
+        if "</br>" in day:
+            arrD=day.split("</br>")
+            day=arrD[0]
+        express3 = r'href="\/embe.php\?id=(.*?)" target="_blank" class="btn btn-primary"><i class="flag (.*?)" style="vertical-align: baseline;"></i>(.*?)</a>'
+        ret3 = re.compile(express3, re.MULTILINE | re.DOTALL).findall(div)
+        for (ch, flag, tit) in ret3:
+            row=day.strip()+"@@"+evento.strip()+"@@"+tit+"@@"+ch+"@@https://nopay2.info/"+immagine
+            arrTemp.append(row)
+            
+    
+    sorted(arrTemp)
+    numIt=0
+    oldDay=""
+    numCh=0
+    jsonText='{"SetViewMode":"500","channels":['
+    for row in arrTemp:
+        arrRow=row.split("@@")
+        day=arrRow[0]
+        evento=arrRow[1]
+        tit=arrRow[2]
+        ch=arrRow[3]
+        img=arrRow[4]
+        if (oldDay != day):
+            if (numCh > 0):
+                jsonText = jsonText + ']},'    
+            jsonText = jsonText + '{"name":"[COLOR gold]'+day+'[/COLOR] ",'
+            jsonText = jsonText + '"thumbnail":"https://freepngimg.com/download/calendar/4-2-calendar-png-hd.png",'
+            jsonText = jsonText + '"fanart":"https://www.stadiotardini.it/wp-content/uploads/2016/12/mandrakata.jpg",'
+            jsonText = jsonText + '"SetViewMode":"51","items":['
+            oldDay = day
+            numIt=0
+            numCh=numCh+1
+        if (numIt > 0):
+            jsonText = jsonText + ','    
+        
+        jsonText = jsonText + '{"title":"[COLOR lime]'+evento.strip()+'[/COLOR] [COLOR aqua]('+tit+')[/COLOR]",'
+        jsonText = jsonText + '"myresolve":"wigi@@https://nopay2.info/embe.php?id='+ch+'",'
+        jsonText = jsonText + '"thumbnail":"'+img+'",'
+        jsonText = jsonText + '"fanart":"https://www.stadiotardini.it/wp-content/uploads/2016/12/mandrakata.jpg",'
+        jsonText = jsonText + '"info":"by MandraKodi"}'
+        numIt=numIt+1
+
+    if (numIt > 0):
+        jsonText = jsonText + ']}' 
+
+    if numIt==0:
+        jsonText = '{"SetViewMode":"503","items":[{"title":"[COLOR red]NO MATCH FOUND[/COLOR]","link":"ignore",'
+        jsonText = jsonText + '"thumbnail":"https://res.9appsinstall.com/group4/M00/51/F1/ghoGAFy4guuAJwiKAAAquIT5LH0862.png",'
+        jsonText = jsonText + '"fanart":"https://www.stadiotardini.it/wp-content/uploads/2016/12/mandrakata.jpg",'
+        jsonText = jsonText + '"info":"NO INFO"}'
+
+    jsonText = jsonText + "]}"
+    logga('JSON-NOPAY: %s', jsonText)
+    video_urls.append((jsonText, "PLAY VIDEO", "No info", "noThumb", "json"))
+    return video_urls
+
+def menuIstorm(parIn=""):
+    video_urls = []
+    
+    urlPage="https://antenasports.ru/channels.php"
+    headers = {
+        'user-agent': "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/74.0.3729.131 Safari/537.36"
+    }
+
+    s = requests.Session()
+    r = s.get(urlPage, headers=headers)
+    
+    express2 = r'<div class="grid-item"><a href="(.*?)" target="_blank" rel="noopener"><span style="(.*?)"><strong>(.*?)</strong>'
+    ret = re.compile(express2, re.MULTILINE | re.DOTALL).findall(r.text)
+    
+    lst = []
+    x=1
+    for (link, id, tito) in ret:
+        if (x > 2):
+            lst.append(tito+"@@"+link)
+        x=x+1
+    lst.sort()
+    jsonText='{"SetViewMode":"503","items":['
+    x=1
+    for (row) in lst:
+        arrL=row.split("@@")
+        tito=arrL[0]
+        link=arrL[1]
+        if (x > 1):
+            jsonText = jsonText + ','    
+        jsonText = jsonText + '{"title":"[COLOR lime]'+tito+'[/COLOR]","myresolve":"antena@@https://antenasports.ru'+link+'",'
+        jsonText = jsonText + '"thumbnail":"https://upload.wikimedia.org/wikipedia/commons/d/db/Sports_portal_bar_icon.png",'
+        jsonText = jsonText + '"fanart":"https://www.stadiotardini.it/wp-content/uploads/2016/12/mandrakata.jpg",'
+        jsonText = jsonText + '"info":"CHANNEL '+tito+'"}'
+        x=x+1
+    
+    jsonText = jsonText + "]}"
+    logga('JSON-ANTENA: %s', jsonText)
+    video_urls.append((jsonText, "PLAY VIDEO", "No info", "noThumb", "json"))
+    return video_urls
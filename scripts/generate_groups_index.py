@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Genera l'indice dei gruppi delle liste grandi (w3u groups[].stations[] o channels[])
+Per ogni lista: <lista>.groups.json con l'hash di ogni gruppo e un file
+<lista>.groups/<hash>.json per gruppo. L'addon scarica l'indice e solo i
+gruppi con hash cambiato, unendoli alla copia della lista che ha in cache.
+La lista non viene toccata: l'indice e' accanto (<lista>.groups.json) e
+riporta dimensione e sha256 del file da cui e' stato generato, cosi' l'addon
+scarta un indice non rigenerato dopo una modifica della lista.
+Lo rigenera la action .github/workflows/GroupsIndex.yml ad ogni push.
+
+    python3 scripts/generate_groups_index.py [data/ItaFilm.w3u ...]
+"""
+
+import os
+import sys
+import glob
+import json
+import hashlib
+
+# Liste pubblicate con l'indice dei gruppi (percorsi relativi alla root del repo)
+LISTS = ['data/*.w3u']
+
+# Chiavi dell'array dei gruppi: w3u e liste channels dell'addon
+GROUP_KEYS = ('groups', 'channels')
+
+# Con meno gruppi conviene scaricare la lista intera
+MIN_GROUPS = 2
+
+def group_hash(group):
+    """Stesso hash di mandraCore.groupHash"""
+    
+    data = json.dumps(group, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha1(data.encode("utf-8")).hexdigest()[:16]
+
+def publish(path):
+    """Scrive indice e gruppi di una lista"""
+    
+    with open(path, 'rb') as f:
+        raw = f.read()
+    data = json.loads(raw.decode('utf-8'))
+    group_key = next((key for key in GROUP_KEYS if isinstance(data.get(key), list)), None)
+    if group_key is None or len(data[group_key]) < MIN_GROUPS:
+        print(f" {path}: meno di {MIN_GROUPS} gruppi, saltata")
+        return False
+    
+    name = os.path.basename(path)
+    index_name = name + '.groups.json'
+    groups_dir = path + '.groups'
+    os.makedirs(groups_dir, exist_ok=True)
+    
+    index = {
+        "key": group_key,
+        "list": name,
+        # il file da cui e' generato l'indice, come lo serve GitHub
+        "source": {"size": len(raw), "sha256": hashlib.sha256(raw).hexdigest()},
+        "header": {k: v for k, v in data.items() if k != group_key},
+        "groups": []
+    }
+    written = set()
+    for group in data[group_key]:
+        digest = group_hash(group)
+        file_name = digest + '.json'
+        group_file = os.path.join(groups_dir, file_name)
+        if not os.path.exists(group_file):
+            with open(group_file, 'w', encoding='utf-8') as f:
+                json.dump(group, f, ensure_ascii=False, separators=(",", ":"))
+        written.add(file_name)
+        index["groups"].append({
+            "name": group.get("name", ""),
+            "hash": digest,
+            "url": os.path.basename(groups_dir) + '/' + file_name,
+            "count": len(group.get("stations", group.get("items", [])))
+        })
+    
+    # gruppi non piu' presenti nella lista
+    for file_name in os.listdir(groups_dir):
+        if file_name.endswith('.json') and file_name not in written:
+            os.remove(os.path.join(groups_dir, file_name))
+    
+    with open(path + '.groups.json', 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, indent=1)
+        f.write("\n")
+    
+    print(f" {path}: {len(index['groups'])} gruppi -> {index_name}")
+    return True
+
+def main():
+    """Main"""
+    
+    paths = sys.argv[1:]
+    if not paths:
+        for pattern in LISTS:
+            paths += sorted(p.replace(os.sep, '/') for p in glob.glob(pattern))
+    for path in paths:
+        if not os.path.exists(path):
+            print(f" Lista non trovata: {path}")
+            continue
+        publish(path)
+
+if __name__ == '__main__':
+    main()
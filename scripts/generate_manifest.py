@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Genera manifest.json per l'aggiornamento del codice dell'addon
+Per ogni modulo: versione, sha256 e dimensione del file servito da GitHub
+"""
+
+import os
+import re
+import glob
+import json
+import hashlib
+
+BASE_URL = "https://raw.githubusercontent.com/mandrakodi/mandrakodi.github.io/main/"
+OUTPUT_FILE = 'manifest.json'
+
+# Moduli scaricati dall'addon (percorsi relativi alla root del repo)
+MODULES = [
+    'launcher.py',
+    'mandraCore.py',
+    'myResolver.py',
+    'portal_api.py',
+    'jsunpack.py',
+]
+
+# Provider del resolver, importati on demand da myResolver
+PACKAGES = ['resolvers/*.py']
+
+# solo la riga versione= in testa al modulo (livetv.py la cerca in un altro file)
+VERSION_REGEX = re.compile(rb"^versione='(.*?)'", re.MULTILINE)
+
+def module_info(path: str):
+    """Versione, hash e dimensione di un modulo"""
+    
+    with open(path, 'rb') as f:
+        data = f.read()
+    
+    found = VERSION_REGEX.search(data)
+    return {
+        "version": found.group(1).decode('utf-8') if found else "",
+        "sha256": hashlib.sha256(data).hexdigest(),
+        "size": len(data)
+    }
+
+def main():
+    """Main"""
+    
+    manifest = {"baseUrl": BASE_URL, "modules": {}}
+    names = list(MODULES)
+    for pattern in PACKAGES:
+        names += sorted(p.replace(os.sep, '/') for p in glob.glob(pattern))
+    for name in names:
+        if not os.path.exists(name):
+            print(f" Modulo non trovato: {name}")
+            continue
+        manifest["modules"][name] = module_info(name)
+        print(f" {name}: {manifest['modules'][name]['version']}")
+    
+    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+    
+    print(f"\n Output: {OUTPUT_FILE}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Divide data/radio.json (radio italiane raggruppate per regione) in un indice
+piccolo delle regioni e un file per regione. L'addon scarica l'indice per il
+menu e poi solo la regione aperta; i file hanno l'hash nel nome e restano
+in cache finche' il contenuto non cambia.
+Lo rigenera la action .github/workflows/GroupsIndex.yml ad ogni push.
+
+    python3 scripts/generate_radio_shards.py [data/radio.json]
+"""
+
+import os
+import sys
+import json
+
+from generate_groups_index import group_hash
+
+SOURCE = 'data/radio.json'
+SHARDS_DIR = 'data/radio'
+INDEX_NAME = 'index.json'
+
+# L'addon rilegge l'indice una volta al giorno
+REFRESH_LIST = 86400
+
+def regions(data):
+    """Stazioni di radio.json divise per GroupId, nell'ordine del file"""
+
+    groups = {}
+    for entry in data.get("radio", []):
+        # radio.json ha una lista per regione; accetta anche le stazioni sciolte
+        stations = entry if isinstance(entry, list) else [entry]
+        for station in stations:
+            groups.setdefault(station.get("GroupId", ""), []).append(station)
+    return groups
+
+def publish(path):
+    """Scrive l'indice e le regioni di radio.json"""
+
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    os.makedirs(SHARDS_DIR, exist_ok=True)
+
+    index = {
+        "RefreshList": REFRESH_LIST,
+        "source": os.path.basename(path),
+        "regions": []
+    }
+    written = set()
+    for group_id, stations in regions(data).items():
+        digest = group_hash(stations)
+        file_name = digest + '.json'
+        shard_file = os.path.join(SHARDS_DIR, file_name)
+        if not os.path.exists(shard_file):
+            with open(shard_file, 'w', encoding='utf-8') as f:
+                json.dump(stations, f, ensure_ascii=False, separators=(",", ":"))
+        written.add(file_name)
+        index["regions"].append({
+            "id": group_id,
+            "name": stations[0].get("GroupName", group_id),
+            "count": len(stations),
+            "hash": digest,
+            "url": file_name
+        })
+
+    # regioni non piu' presenti o cambiate
+    for file_name in os.listdir(SHARDS_DIR):
+        if file_name.endswith('.json') and file_name != INDEX_NAME and file_name not in written:
+            os.remove(os.path.join(SHARDS_DIR, file_name))
+
+    with open(os.path.join(SHARDS_DIR, INDEX_NAME), 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, indent=1)
+        f.write("\n")
+
+    print(f" {path}: {len(index['regions'])} regioni -> {SHARDS_DIR}/{INDEX_NAME}")
+
+def main():
+    """Main"""
+
+    path = sys.argv[1] if len(sys.argv) > 1 else SOURCE
+    if not os.path.exists(path):
+        print(f" Lista non trovata: {path}")
+        return
+    publish(path)
+
+if __name__ == '__main__':
+    main()